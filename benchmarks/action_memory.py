@@ -0,0 +1,78 @@
+"""
+This module contains a memory benchmark of the story actions.
+It builds a large synthetic story and reports the memory allocated per action, measured with tracemalloc.
+
+Run it from the repository root with: python -m benchmarks.action_memory [number of actions]
+"""
+
+import sys
+import tracemalloc
+
+from engine.game_objects.action import Choice, GoTo, Talk
+from engine.game_objects.character import Character
+from engine.game_objects.scene import Scene
+
+DEFAULT_ACTIONS = 100_000
+ACTIONS_PER_SCENE = 50
+
+
+def build_story(action_count: int, characters: list[Character]) -> list[Scene]:
+    """
+    Builds a story with the given amount of actions spread across scenes.
+
+    :param action_count: The amount of actions of the story.
+    :param characters: The characters speaking in the story.
+    :return: The list of scenes.
+    """
+    scenes = []
+    for scene_index in range(0, action_count, ACTIONS_PER_SCENE):
+        scene = Scene(f'scene_{scene_index}', 'background.png')
+        last = min(action_count, scene_index + ACTIONS_PER_SCENE) - 1
+        for index in range(scene_index, last):
+            character = characters[index % len(characters)]
+            scene.add_action(Talk(character, f'Line {index}', state='default' if index % 2 else 'happy'))
+        if last % 2:
+            scene.add_action(GoTo(characters[0], f'Line {last}', go_to=f'scene_{last + 1}'))
+        else:
+            scene.add_action(Choice(characters[0], f'Line {last}', [(f'scene_{last + 1}', 'Next')]))
+        scenes.append(scene)
+    return scenes
+
+
+def measure(action_count: int) -> dict:
+    """
+    Measures the memory used by a synthetic story.
+
+    :param action_count: The amount of actions of the story.
+    :return: A dictionary with the total bytes, the bytes per action and the peak bytes.
+    """
+    characters = [
+        Character(f'Character {index}', states={'default': f'{index}.png', 'happy': f'{index}_happy.png'})
+        for index in range(10)
+    ]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    scenes = build_story(action_count, characters)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert sum(len(scene.actions) for scene in scenes) == action_count
+    return {
+        'actions': action_count,
+        'bytes': after - before,
+        'bytes_per_action': (after - before) / action_count,
+        'peak': peak - before,
+    }
+
+
+def main(args: list[str] = None):
+    args = sys.argv[1:] if args is None else args
+    action_count = int(args[0]) if args else DEFAULT_ACTIONS
+    result = measure(action_count)
+    print(
+        f"{result['actions']} actions: {result['bytes'] / 1024 / 1024:.1f} MiB, "
+        f"{result['bytes_per_action']:.0f} bytes per action, peak {result['peak'] / 1024 / 1024:.1f} MiB"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+This module contains a decode benchmark of the image formats the build can optimize to.
+It draws a noisy full HD background, optimizes it for an 800x600 game in every format and reports the file size and
+the time the renderers spend loading and converting it, compared to the original image.
+
+Run it from the repository root with: python -m benchmarks.image_decode [number of loads]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from engine.utils.images import IMAGE_FORMATS, optimize_image  # noqa: E402
+
+DEFAULT_LOADS = 20
+SOURCE_SIZE = (1920, 1080)
+TARGET_RESOLUTION = (800, 600)
+
+
+def _load_time(path: str, loads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loads):
+        pygame.image.load(path).convert()
+    return (time.perf_counter() - start) / loads
+
+
+def measure(loads: int) -> dict[str, tuple[int, float]]:
+    """
+    Optimizes a background in every image format and times its loading.
+
+    :param loads: The amount of loads averaged per format.
+    :return: A dictionary mapping 'original' and each format to the file size and the seconds per load.
+    """
+    pygame.init()
+    pygame.display.set_mode(TARGET_RESOLUTION)
+    random.seed(0)
+    source_image = pygame.Surface(SOURCE_SIZE)
+    for _ in range(2000):
+        color = [random.randrange(256) for _ in range(3)]
+        center = random.randrange(SOURCE_SIZE[0]), random.randrange(SOURCE_SIZE[1])
+        pygame.draw.circle(source_image, color, center, random.randrange(5, 60))
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        source = os.path.join(folder, 'background.png')
+        pygame.image.save(source_image, source)
+        results['original'] = os.path.getsize(source), _load_time(source, loads)
+        for image_format in IMAGE_FORMATS:
+            destination = os.path.join(folder, image_format, 'background.png')
+            optimize_image(source, destination, TARGET_RESOLUTION, image_format)
+            results[image_format] = os.path.getsize(destination), _load_time(destination, loads)
+    pygame.quit()
+    return results
+
+
+def main(args: list[str] = None):
+    args = sys.argv[1:] if args is None else args
+    loads = int(args[0]) if args else DEFAULT_LOADS
+    for name, (size, seconds) in measure(loads).items():
+        print(f"{name:>8}: {size / 1024:8.0f} KiB, {seconds * 1000:6.2f} ms per load")
+
+
+if __name__ == '__main__':
+    main()
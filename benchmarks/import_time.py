@@ -0,0 +1,84 @@
+"""
+This module contains a startup benchmark of the game runtime.
+It imports the game module in a fresh interpreter with python -X importtime, reports the total import time and the
+slowest modules, and can append the result to a JSON lines file to track it over time.
+
+Run it from the repository root with: python -m benchmarks.import_time [--runs N] [--history FILE]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+DEFAULT_MODULE = 'engine.game_ui.game'
+DEFAULT_RUNS = 5
+# Modules that belong to the build and must never be imported by the game.
+FORBIDDEN_MODULES = ('deep_translator', 'requests', 'bs4')
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Imports a module in a fresh interpreter and parses the import time report.
+
+    :param module: The module to be imported.
+    :return: A dictionary mapping each imported module to its self and cumulative time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def measure(module: str = DEFAULT_MODULE, runs: int = DEFAULT_RUNS) -> dict:
+    """
+    Measures the import time of a module, keeping the fastest of several runs to reduce noise.
+
+    :param module: The module to be imported.
+    :param runs: The amount of fresh interpreters started.
+    :return: A dictionary with the total time, the slowest modules and the forbidden modules imported.
+    """
+    best = None
+    for _ in range(runs):
+        times = import_times(module)
+        if best is None or times[module][1] < best[module][1]:
+            best = times
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:10]
+    return {
+        'module': module,
+        'total_us': best[module][1],
+        'modules': len(best),
+        'slowest': [(name, self_time) for name, (self_time, _) in slowest],
+        'forbidden': [name for name in best if name.split('.')[0] in FORBIDDEN_MODULES],
+    }
+
+
+def main(args: list[str] = None):
+    parser = argparse.ArgumentParser(description='Measures the import time of the game runtime.')
+    parser.add_argument('--module', default=DEFAULT_MODULE, help='The module to be imported.')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='The amount of runs, the fastest is kept.')
+    parser.add_argument('--history', help='A JSON lines file the result is appended to.')
+    options = parser.parse_args(args)
+
+    result = measure(options.module, options.runs)
+    print(f"{result['module']}: {result['total_us'] / 1000:.1f} ms, {result['modules']} modules")
+    for name, self_time in result['slowest']:
+        print(f"  {self_time / 1000:8.1f} ms  {name}")
+    if result['forbidden']:
+        print('Build only modules imported:', ', '.join(result['forbidden']))
+    if options.history:
+        with open(options.history, 'a', encoding='utf-8') as history:
+            history.write(json.dumps({'time': int(time.time()), **result}) + '\n')
+    sys.exit(1 if result['forbidden'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+This module contains an allocation benchmark of the scene frame loop.
+It plays an action on a static screen for many frames and reports the memory allocated by the frame loop, measured
+with tracemalloc, both the memory still held and the peak of the short-lived allocations. The few bytes taken by the
+measurement itself are constant, numbers growing with the amount of frames mean the loop allocates.
+
+Run it from the repository root with: python -m benchmarks.render_payload [number of frames]
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from engine.game_objects.action import Choice  # noqa: E402
+from engine.game_objects.character import Character  # noqa: E402
+from engine.game_objects.scene import Scene  # noqa: E402
+from engine.game_ui.game_renderer import (  # noqa: E402
+    BackgroundRenderer,
+    ForegroundRenderer,
+    GameSceneRenderer,
+    HUDRenderer,
+)
+from engine.game_ui.game_scene import play_scene  # noqa: E402
+
+DEFAULT_FRAMES = 10_000
+
+
+class _StaticScheduler:
+    """
+    A scheduler handing out no events for a fixed amount of frames, then a quit event.
+    The events are built up front so the scheduler itself allocates nothing while measuring.
+    """
+
+    def __init__(self, frames: int):
+        self._events = iter([()] * frames + [[pygame.event.Event(pygame.QUIT)]])
+        self._measuring = False
+        self.current = 0
+        self.peak = 0
+
+    def events(self, animating: bool = False):
+        if not self._measuring:
+            # The first frame bakes the action, the measurement starts after it.
+            self._measuring = True
+            self.current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            return next(self._events)
+        events = next(self._events)
+        if events:
+            current, peak = tracemalloc.get_traced_memory()
+            self.current, self.peak = current - self.current, peak - self.current
+        return events
+
+
+def measure(frames: int) -> dict:
+    """
+    Plays a choice on a static screen and measures the allocations of the frame loop.
+
+    :param frames: The amount of frames measured.
+    :return: A dictionary with the frames, the bytes held and the peak bytes allocated by the loop.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    with tempfile.TemporaryDirectory() as resources:
+        pygame.image.save(pygame.Surface((800, 600)), os.path.join(resources, 'background.png'))
+        pygame.image.save(pygame.Surface((300, 400)), os.path.join(resources, 'narrator.png'))
+        renderer = GameSceneRenderer(
+            BackgroundRenderer(screen, resources),
+            ForegroundRenderer(screen, resources),
+            HUDRenderer(screen, resources),
+        )
+        character = Character('Narrator', states={'default': 'narrator.png'})
+        scene = Scene('start', 'background.png')
+        scene.add_action(Choice(character, 'Where to?', [('left', 'Left'), ('right', 'Right')]))
+        scheduler = _StaticScheduler(frames)
+        tracemalloc.start()
+        play_scene(scene, renderer, scheduler)
+        tracemalloc.stop()
+    pygame.quit()
+    return {'frames': frames, 'bytes': scheduler.current, 'peak': scheduler.peak}
+
+
+def main(args: list[str] = None):
+    args = sys.argv[1:] if args is None else args
+    frames = int(args[0]) if args else DEFAULT_FRAMES
+    result = measure(frames)
+    print(f"{result['frames']} static frames: {result['bytes']} bytes held, peak {result['peak']} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,44 @@
 """
 This module contains the build functionality for the game engine.
-It includes the main build function, a function to build the application,
-a function to build the game JSON files, and a function to validate the necessary files.
+It includes the main build function, a function to build the application in the selected packaging mode,
+a function running the build of the game assets in process, the fallback running the build.py script of older
+projects, and a function to validate the necessary files.
 """
 
+import importlib.util
 import os
-import shutil
 import subprocess
 import platform
 import sys
 
 import PyInstaller.__main__ as py_installer
 
+from cli.installer.packaging import (
+    DEFAULT_LAUNCH_RUNS,
+    DEFAULT_PACKAGING,
+    DEFAULT_PACKAGING_CACHE,
+    check_platforms,
+    describe_launch,
+    executable_path,
+    measure_launch,
+    work_path,
+)
+from engine.game_ui.build_result import BuildEvent, BuildResult
+from engine.game_ui.game_builder import parse_build_arguments
+
+# Modules only used while building the story, the bundled game never imports them.
+BUILD_ONLY_MODULES = ['deep_translator']
+
 
 def build(
         output_path: str,
         project_path: str,
         resolutions: list[str],
+        jobs: int = None,
+        packaging: str = DEFAULT_PACKAGING,
+        launch_runs: int = DEFAULT_LAUNCH_RUNS,
+        platforms: list[str] = None,
+        languages: list[str] = None,
 ):
     """
     Main build function. Prepares for building, validates files, builds game JSONs and the application.
@@ -26,20 +48,50 @@ def build(
     :param platforms: The platforms for which the game will be built.
     :param resolutions: The resolutions for which the game will be built.
     :param languages: The languages for which the game will be built.
+    :param jobs: The amount of processes used to build the assets.
+    :param packaging: One of PACKAGING_MODES.
+    :param launch_runs: How many times the packaged game is launched to time it, 0 skips it.
+        A launch failing is reported as a warning.
     """
     print("Preparing for building...")
-    print("Resolutions:", resolutions)  # TODO select the resolutions to be used
+    print("Resolutions:", resolutions or 'original assets')
+    print("Languages:", languages or 'all')
     try:
+        print("Platform:", check_platforms(platforms))
         validate_files(project_path)
-        build_main_path, game_name = build_game_jsons()
+        result = build_game(project_path, resolutions, jobs, languages)
+        if result is None:
+            build_main_path, game_name = build_game_jsons(resolutions, jobs, languages)
+        else:
+            build_main_path, game_name = result.main_path, result.game_title
         data_path = os.path.dirname(build_main_path)
-        build_app(build_main_path, data_path, game_name, output_path)
+        executable = build_app(
+            build_main_path,
+            data_path,
+            game_name,
+            output_path,
+            packaging,
+            os.path.join(project_path, DEFAULT_PACKAGING_CACHE)
+        )
     except Exception as e:
         print(f'Build error: {e}')
         sys.exit(-2)
+    if launch_runs:
+        # The game is packaged at this point, a launch that fails here does not fail the build.
+        try:
+            print(describe_launch(measure_launch(executable, launch_runs), packaging))
+        except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f'Warning: the launch time could not be measured: {e}')
 
 
-def build_app(build_main_path, data_path, game_name, output_path):
+def build_app(
+        build_main_path,
+        data_path,
+        game_name,
+        output_path,
+        packaging: str = DEFAULT_PACKAGING,
+        cache_path: str = None
+) -> str:
     """
     Builds the application using PyInstaller.
 
@@ -47,27 +99,115 @@ def build_app(build_main_path, data_path, game_name, output_path):
     :param data_path: The path of the data files.
     :param game_name: The name of the game.
     :param output_path: The path where the built application will be output.
+    :param packaging: One of PACKAGING_MODES, 'onedir' starts faster since nothing is unpacked on launch.
+    :param cache_path: The folder keeping the PyInstaller work folder between builds,
+        every build starts from a clean one when None.
+    :return: The path of the executable.
     """
+    if cache_path is None:
+        cache_options = ['--clean']  # Clean PyInstaller cache and temporary files
+    else:
+        # The work folder is only reused by builds with the same engine and dependencies.
+        workpath = work_path(cache_path, packaging)
+        cache_options = [f'--workpath={workpath}', f'--specpath={workpath}']
+        # The paths written in the spec file are relative to it, it is not in the project folder anymore.
+        build_main_path = os.path.abspath(build_main_path)
+        data_path = os.path.abspath(data_path)
     options = [
         build_main_path,
-        '--onefile',  # Create a single executable file
-        '--clean',  # Clean PyInstaller cache and temporary files
+        f'--{packaging}',  # A single executable file, or a folder with the executable and its libraries
+        '--noconfirm',  # Replace the previous output folder without asking
+        *cache_options,
         f'--distpath={output_path}',  # Output path
         f'--name={game_name}',  # Name of the executable
         f'--add-data={data_path}{os_data_colon()}.',  # External data files
-        '--windowed'
+        '--windowed',
+        *(f'--exclude-module={module}' for module in BUILD_ONLY_MODULES),
     ]
+    # The data folder is kept, the next build only rewrites the files whose inputs changed.
     py_installer.run(options)
-    shutil.rmtree(data_path, ignore_errors=True)
+    return executable_path(output_path, game_name, packaging)
+
+
+def build_arguments(resolutions: list[str] = None, jobs: int = None, languages: list[str] = None) -> list[str]:
+    """
+    Returns the build.py options matching the CLI options.
+
+    :param resolutions: The resolutions the images are pre-scaled to.
+    :param jobs: The amount of processes used to build the assets.
+    :param languages: The languages translated and bundled.
+    :return: The list of command line arguments.
+    """
+    arguments = []
+    if resolutions:
+        arguments += ['--resolutions', *resolutions]
+    if jobs:
+        arguments += ['--jobs', str(jobs)]
+    if languages:
+        arguments += ['--languages', *languages]
+    return arguments
+
+
+def print_build_event(event: BuildEvent):
+    """
+    Prints the progress of a build stage.
+
+    :param event: The event sent by the build.
+    """
+    match event.status:
+        case 'start':
+            print(f"[{event.stage}] {event.message}")
+        case 'progress':
+            print(f"[{event.stage}] {event.completed}/{event.total} {event.message}")
+        case _:
+            print(f"[{event.stage}] done in {event.message}")
+
 
+def build_game(
+        project_path: str,
+        resolutions: list[str] = None,
+        jobs: int = None,
+        languages: list[str] = None,
+        progress=print_build_event
+) -> BuildResult | None:
+    """
+    Builds the game assets in this process, calling the build function of the build.py script of the project.
+    The project folder must be the working directory, the paths of the build are relative to it.
 
-def build_game_jsons() -> (str, str):
+    :param project_path: The path of the project to be built.
+    :param resolutions: The resolutions the images are pre-scaled to.
+    :param jobs: The amount of processes used to build the assets.
+    :param languages: The languages translated and bundled, all of them when None.
+    :param progress: The callable receiving the BuildEvent of each stage.
+    :return: The result of the build, or None when the build.py script has no build function.
+    """
+    spec = importlib.util.spec_from_file_location('project_build', os.path.join(project_path, 'build.py'))
+    module = importlib.util.module_from_spec(spec)
+    # The script imports the configuration, characters and scenes modules of the project.
+    sys.path.insert(0, project_path)
+    try:
+        spec.loader.exec_module(module)
+        if not hasattr(module, 'build'):
+            return None
+        return module.build(
+            **parse_build_arguments(build_arguments(resolutions, jobs, languages)),
+            progress=progress
+        )
+    finally:
+        sys.path.remove(project_path)
+
+
+def build_game_jsons(resolutions: list[str] = None, jobs: int = None, languages: list[str] = None) -> (str, str):
     """
     Builds the game JSON files by running the build.py script.
+    Only used for the projects whose build.py script has no build function to be called in process.
 
+    :param resolutions: The resolutions the images are pre-scaled to.
+    :param jobs: The amount of processes used to build the assets.
+    :param languages: The languages translated and bundled, all of them when None.
     :return: The path of the main build file and the name of the game.
     """
-    cmd = 'python build.py'
+    cmd = ' '.join(['python build.py', *build_arguments(resolutions, jobs, languages)])
     p = subprocess.Popen(cmd, stdout=subprocess.PIPE, shell=True)
     out, err = p.communicate()
     build_main_path, game_name = out.decode().split('\n')[-2:][0].split('#')[1:3]
@@ -0,0 +1,148 @@
+"""
+This module contains the packaging helpers for the game engine.
+It includes the packaging modes of the executable, the platforms it can be packaged for, the PyInstaller work folder
+kept between builds for the same engine and dependencies, and the measurement of how long the packaged game takes to
+launch.
+"""
+
+import hashlib
+import importlib.metadata
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+from engine.game_ui.game_builder import LAUNCH_PROBE_VARIABLE
+
+# 'onefile' ships a single file unpacked to a temporary folder on every launch, 'onedir' ships a folder that
+# starts without extraction.
+PACKAGING_MODES = ('onefile', 'onedir')
+DEFAULT_PACKAGING = 'onefile'
+DEFAULT_PACKAGING_CACHE = '.pyinstaller_cache'
+# The launch is only timed on request, it needs a machine able to run the packaged game.
+DEFAULT_LAUNCH_RUNS = 0
+LAUNCH_TIMEOUT = 120
+# The platform names of the CLI, by the name platform.system() gives them.
+PLATFORMS = {'Windows': 'windows', 'Linux': 'linux', 'Darwin': 'macos'}
+
+
+def current_platform() -> str:
+    """
+    Returns the name of the platform the build runs on.
+
+    :return: One of the PLATFORMS values.
+    """
+    return PLATFORMS.get(platform.system(), platform.system().lower())
+
+
+def check_platforms(platforms: list[str] = None) -> str:
+    """
+    Checks the platforms requested can be built here. PyInstaller does not cross compile, so only the current
+    platform is built and the other ones requested are reported.
+
+    :param platforms: The platforms requested, the current platform when None.
+    :return: The platform built.
+    :raises ValueError: If the current platform is not one of the requested ones.
+    """
+    current = current_platform()
+    if not platforms:
+        return current
+    if current not in platforms:
+        raise ValueError(
+            f"Cannot build for {', '.join(platforms)} on {current}, PyInstaller does not cross compile. "
+            f"Run the build on each platform."
+        )
+    skipped = [name for name in platforms if name != current]
+    if skipped:
+        print(f"Skipping {', '.join(skipped)}: PyInstaller does not cross compile, run the build on each platform.")
+    return current
+
+
+def packaging_key() -> str:
+    """
+    Returns the key of the PyInstaller work folder: the Python, engine and PyInstaller versions and the installed
+    distributions, the ones PyInstaller may bundle.
+
+    :return: A short hexadecimal digest.
+    """
+    distributions = sorted(
+        f"{distribution.metadata['Name']}=={distribution.version}".lower()
+        for distribution in importlib.metadata.distributions()
+        if distribution.metadata['Name']
+    )
+    content = '\n'.join([sys.version, platform.platform(), *distributions])
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+def work_path(cache_folder: str, packaging: str = DEFAULT_PACKAGING) -> str:
+    """
+    Returns the PyInstaller work folder of a packaging mode for the current engine and dependencies,
+    removing the folders the mode kept for other ones. Each mode keeps its own folder, switching modes starts warm.
+
+    :param cache_folder: The folder keeping the work folders.
+    :param packaging: One of PACKAGING_MODES.
+    :return: The path of the work folder.
+    """
+    key = packaging_key()
+    mode_folder = os.path.join(cache_folder, packaging)
+    stale = []
+    if os.path.isdir(cache_folder):
+        stale += [os.path.join(cache_folder, name) for name in os.listdir(cache_folder) if name not in PACKAGING_MODES]
+    if os.path.isdir(mode_folder):
+        stale += [os.path.join(mode_folder, name) for name in os.listdir(mode_folder) if name != key]
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+    return os.path.join(mode_folder, key)
+
+
+def executable_path(output_path: str, game_name: str, packaging: str = DEFAULT_PACKAGING) -> str:
+    """
+    Returns the path of the packaged game.
+
+    :param output_path: The path the application was output to.
+    :param game_name: The name of the game.
+    :param packaging: One of PACKAGING_MODES.
+    :return: The path of the executable.
+    """
+    name = f"{game_name}.exe" if platform.system() == 'Windows' else game_name
+    if packaging == 'onedir':
+        return os.path.join(output_path, game_name, name)
+    return os.path.join(output_path, name)
+
+
+def measure_launch(executable: str, runs: int = 1) -> list[float]:
+    """
+    Launches the packaged game until its assets are loaded and the window is open, then stops it, and times it.
+    The game runs without a window unless SDL_VIDEODRIVER is set.
+
+    :param executable: The path of the packaged game.
+    :param runs: The amount of launches.
+    :return: The seconds each launch took.
+    :raises RuntimeError: If the game fails to launch.
+    """
+    environment = dict(os.environ, **{LAUNCH_PROBE_VARIABLE: '1'})
+    environment.setdefault('SDL_VIDEODRIVER', 'dummy')
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.run([executable], env=environment, capture_output=True, timeout=LAUNCH_TIMEOUT)
+        timings.append(time.perf_counter() - start)
+        if process.returncode != 0:
+            raise RuntimeError(f"The game failed to launch: {process.stderr.decode(errors='replace').strip()}")
+    return timings
+
+
+def describe_launch(timings: list[float], packaging: str = DEFAULT_PACKAGING) -> str:
+    """
+    Describes the launch times for the build output.
+
+    :param timings: The seconds each launch took.
+    :param packaging: The packaging mode measured.
+    :return: A human-readable summary.
+    """
+    return (
+        f"Launch time ({packaging}): {min(timings):.2f}s best, {sum(timings) / len(timings):.2f}s average "
+        f"over {len(timings)} launches"
+    )
@@ -2,6 +2,7 @@ import argparse
 import os
 
 from cli.installer.build import build
+from cli.installer.packaging import DEFAULT_LAUNCH_RUNS, DEFAULT_PACKAGING, PACKAGING_MODES, PLATFORMS
 from cli.project_init import init_project
 from cli.validate import validate
 
@@ -23,7 +24,16 @@ def main():
         case "init":
             init_project(args.project_path, args.project_name)
         case "build":
-            build(args.output, os.getcwd(), args.resolutions)
+            build(
+                args.output,
+                os.getcwd(),
+                args.resolutions,
+                args.jobs,
+                args.packaging,
+                args.launch_runs,
+                args.platforms,
+                args.languages,
+            )
         case "validate":
             validate()
         case _:
@@ -47,9 +57,31 @@ def build_parsers(subparsers):
     """
     parser_build = subparsers.add_parser("build", help="Build the project executable")
     parser_build.add_argument("--output", help="Output location for the executable file", required=True)
-    parser_build.add_argument("--platforms", nargs="+", help="List of platforms")
+    parser_build.add_argument(
+        "--platforms",
+        nargs="+",
+        choices=sorted(PLATFORMS.values()),
+        help="List of platforms, only the current one can be built"
+    )
     parser_build.add_argument("--resolutions", nargs="+", help="List of resolutions")
-    parser_build.add_argument("--languages", nargs="+", help="List of languages")
+    parser_build.add_argument(
+        "--languages",
+        nargs="+",
+        help="List of languages to translate and bundle, all the languages of the configuration by default"
+    )
+    parser_build.add_argument("--jobs", type=int, help="Amount of processes used to build the assets")
+    parser_build.add_argument(
+        "--packaging",
+        choices=PACKAGING_MODES,
+        default=DEFAULT_PACKAGING,
+        help="'onefile' ships a single file unpacked on every launch, 'onedir' ships a folder that starts faster"
+    )
+    parser_build.add_argument(
+        "--launch-runs",
+        type=int,
+        default=DEFAULT_LAUNCH_RUNS,
+        help="How many times the packaged game is launched to time it, it is not launched by default"
+    )
 
 
 def project_init_parsers(subparsers):
@@ -1,17 +1,23 @@
 BUILD_FILE_CONTENT = """
 from engine.game_ui.game import Game
-from engine.game_ui.game_builder import GameBuilder
+from engine.game_ui.game_builder import GameBuilder, parse_build_arguments
 
 from characters import CHARACTERS
 from configuration import GAME_CONFIGURATION
 from scenes import load_scenes
 
 GAME_CONFIGURATION.build = True
-game = Game(configuration=GAME_CONFIGURATION)
 
-if __name__ == "__main__":
+
+def build(**options):
+    # A new game per call, the scenes are only added once when the CLI builds the project in process.
+    game = Game(configuration=GAME_CONFIGURATION)
     scenes = load_scenes()
     for scene in scenes:
         game.add_scene(scenes[scene])
-    GameBuilder(game).build(characters=CHARACTERS, output_folder='output')
+    return GameBuilder(game).build(characters=CHARACTERS, output_folder='output', **options)
+
+
+if __name__ == "__main__":
+    build(**parse_build_arguments())
 """
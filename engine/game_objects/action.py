@@ -1,26 +1,56 @@
 """
 This module contains the Action classes for the game engine.
 It includes the base Action class, and specific action classes: Talk, Choice, and GoTo.
+A story holds one instance per line of dialogue, so the actions use slots instead of an instance dictionary.
 """
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from engine.game_objects.character import Character, _GameCharacter
+from engine.game_objects.string_table import StringTable
 from engine.utils.translation import translate
 
 
 class Action:
     """
     Base Action class. It represents an action performed by a character in the game.
+    When a string table is given, the texts of the action are identifiers of that table.
 
     :param character: The character performing the action.
     :param state: The state of the character.
+    :param strings: The string table of the story.
     """
+    __slots__ = ('character', 'strings', '_payload', '_payload_version')
     character: _GameCharacter
+    strings: StringTable | None
     type: str = 'action'
 
-    def __init__(self, character: Character, state: str = None, *args, **kwargs):
+    def __init__(self, character: Character, state: str = None, *args, strings: StringTable = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.character = character.snapshot(state=state)
-
-    def render(self) -> dict:
+        self.strings = strings
+        self._payload = None
+        self._payload_version = None
+
+    def _localize(self, text: str) -> str:
+        if self.strings is None:
+            return text
+        return self.strings.get(text)
+
+    def render(self) -> Mapping[str, Any]:
+        """
+        Returns what the renderer needs to draw the action. The payload is read-only and built once,
+        the same instance is returned on every frame until the language of the string table changes.
+
+        :return: A read-only mapping with the rendered fields of the action.
+        """
+        version = self.strings.version if self.strings is not None else None
+        if self._payload is None or self._payload_version != version:
+            self._payload = MappingProxyType(self._render())
+            self._payload_version = version
+        return self._payload
+
+    def _render(self) -> dict:
         return {
             'character_name': self.character.name,
             'character_image': self.character.image,
@@ -34,6 +64,16 @@ class Action:
             'type': self.type
         }
 
+    def dump_structure(self, key: str, strings: dict[str, str]) -> dict:
+        """
+        Dumps the action without its texts, which are replaced by identifiers and collected in the strings.
+
+        :param key: The identifier of the action text.
+        :param strings: A dictionary collecting the texts by identifier.
+        :return: The dumped action.
+        """
+        return Action.dump(self)
+
     def __str__(self):
         return f"{self.type} - {self.character.name}[{self.character.state}]"
 
@@ -49,6 +89,7 @@ class Talk(Action):
     :param text: The text that the character says.
     :param state: The state of the character.
     """
+    __slots__ = ('text',)
     text: str
     type: str = 'talk'
 
@@ -56,9 +97,9 @@ class Talk(Action):
         super().__init__(character, state, *args, **kwargs)
         self.text = text
 
-    def render(self) -> dict:
-        output = super().render()
-        output['text'] = self.text
+    def _render(self) -> dict:
+        output = super()._render()
+        output['text'] = self._localize(self.text)
         return output
 
     def dump(self, src: str, target: str, *args, **kwargs) -> dict:
@@ -66,6 +107,12 @@ class Talk(Action):
         output['text'] = translate(self.text, src, target)
         return output
 
+    def dump_structure(self, key: str, strings: dict[str, str]) -> dict:
+        output = super().dump_structure(key, strings)
+        output['text'] = key
+        strings[key] = self.text
+        return output
+
 
 class Choice(Action):
     """
@@ -76,6 +123,7 @@ class Choice(Action):
     :param choices: The choices that the character can make.
     :param state: The state of the character.
     """
+    __slots__ = ('text', 'choices')
     text: str
     choices: list[tuple[str, str]]
     type: str = 'choice'
@@ -86,10 +134,10 @@ class Choice(Action):
         self.text = text
         self.choices = choices
 
-    def render(self) -> dict:
-        output = super().render()
-        output['text'] = self.text
-        output['choices'] = self.choices
+    def _render(self) -> dict:
+        output = super()._render()
+        output['text'] = self._localize(self.text)
+        output['choices'] = tuple((go_to, self._localize(text)) for go_to, text in self.choices)
         return output
 
     def dump(self, src: str, target: str, *args, **kwargs) -> dict:
@@ -104,6 +152,17 @@ class Choice(Action):
         ]
         return output
 
+    def dump_structure(self, key: str, strings: dict[str, str]) -> dict:
+        output = super().dump_structure(key, strings)
+        output['text'] = key
+        strings[key] = self.text
+        output['choices'] = []
+        for index, (go_to, text) in enumerate(self.choices):
+            choice_key = f"{key}/{index}"
+            strings[choice_key] = text
+            output['choices'].append({'go_to': go_to, 'text': choice_key})
+        return output
+
     def go_to(self) -> list[str]:
         return [choice[0] for choice in self.choices]
 
@@ -117,6 +176,7 @@ class GoTo(Action):
     :param go_to: The scene that the character goes to.
     :param state: The state of the character.
     """
+    __slots__ = ('text', '_go_to')
     text: str
     _go_to: str
     type: str = 'go_to'
@@ -133,9 +193,9 @@ class GoTo(Action):
         self.text = text
         self._go_to = go_to
 
-    def render(self) -> dict:
-        output = super().render()
-        output['text'] = self.text
+    def _render(self) -> dict:
+        output = super()._render()
+        output['text'] = self._localize(self.text)
         output['go_to'] = self._go_to
         return output
 
@@ -145,5 +205,12 @@ class GoTo(Action):
         output['go_to'] = self._go_to
         return output
 
+    def dump_structure(self, key: str, strings: dict[str, str]) -> dict:
+        output = super().dump_structure(key, strings)
+        output['text'] = key
+        strings[key] = self.text
+        output['go_to'] = self._go_to
+        return output
+
     def go_to(self) -> list[str] | None:
         return [self._go_to]
@@ -0,0 +1,71 @@
+"""
+This module contains the Backlog class for the game engine.
+It includes a bounded record of the actions shown to the player across scene changes, kept as references to the
+scenes instead of the actions themselves.
+"""
+
+from collections import deque
+from typing import Iterator, Mapping
+
+from engine.game_objects.action import Action
+from engine.game_objects.scene import Scene
+
+# Enough lines for a backlog screen, old lines are dropped once it is full.
+DEFAULT_BACKLOG_SIZE = 200
+
+
+class Backlog:
+    """
+    Backlog class. It keeps the last actions shown in the game as (scene name, action index) references.
+    The references are resolved against the scenes when read, so the texts follow the active language.
+
+    :param size: The maximum amount of actions kept.
+    """
+    size: int
+
+    def __init__(self, size: int = DEFAULT_BACKLOG_SIZE):
+        """
+        Initializes the Backlog instance.
+
+        :param size: The maximum amount of actions kept.
+        """
+        self.size = size
+        self._entries: deque[tuple[str, int]] = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        return iter(self._entries)
+
+    def record(self, scene_name: str, action_index: int):
+        """
+        Records an action shown to the player, dropping the oldest one when the backlog is full.
+
+        :param scene_name: The name of the scene of the action.
+        :param action_index: The position of the action in the scene.
+        """
+        self._entries.append((scene_name, action_index))
+
+    def clear(self):
+        """
+        Removes every recorded action.
+        """
+        self._entries.clear()
+
+    def actions(self, scenes: Mapping[str, Scene]) -> list[tuple[str, Action]]:
+        """
+        Resolves the recorded references into actions, oldest first.
+        References to scenes or actions that no longer exist are skipped.
+
+        :param scenes: A mapping of scene names to Scene instances.
+        :return: A list of (scene name, action) tuples.
+        """
+        output = []
+        for scene_name, action_index in self._entries:
+            if scene_name not in scenes:
+                continue
+            scene_actions = scenes[scene_name].actions
+            if action_index < len(scene_actions):
+                output.append((scene_name, scene_actions[action_index]))
+        return output
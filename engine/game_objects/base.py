@@ -13,6 +13,7 @@ class BaseGameObject:
     :param args: Additional positional arguments.
     :param kwargs: Additional keyword arguments.
     """
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         """
@@ -1,6 +1,7 @@
 """
 This module contains the Character classes for the game engine.
 It includes the base Character class, and a dataclass _GameCharacter.
+The snapshots are immutable and interned per state, so every action of a character in the same state shares one.
 """
 
 import os
@@ -10,10 +11,10 @@ from engine.game_objects.base import BaseGameObject
 from engine.utils.files import dump
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _GameCharacter:
     """
-    _GameCharacter dataclass. It represents a snapshot of a game character's state.
+    _GameCharacter dataclass. It represents an immutable snapshot of a game character's state.
 
     :param name: The name of the character.
     :param image: The image of the character.
@@ -51,6 +52,7 @@ class Character(BaseGameObject):
         self.name = name
         self.state = state.upper()
         self.states = {state.upper(): states[state] for state in states} if states else {}
+        self._snapshots: dict[str, _GameCharacter] = {}
 
     def validate_states(self, game_path: str):
         """
@@ -68,18 +70,40 @@ class Character(BaseGameObject):
     def snapshot(self, state: str = None) -> _GameCharacter:
         """
         Returns a snapshot of the character's state.
+        The same instance is returned for a state until its image changes.
 
         :param state: The state of the character.
         :return: An instance of _GameCharacter representing the snapshot.
         """
-        if state:
-            state = state.upper()
-            return _GameCharacter(self.name, self.states[state], state)
-        return _GameCharacter(self.name, self.states[self.state], self.state)
+        state = state.upper() if state else self.state
+        image = self.states[state]
+        snapshot = self._snapshots.get(state)
+        if snapshot is None or snapshot.image != image or snapshot.name != self.name:
+            snapshot = _GameCharacter(self.name, image, state)
+            self._snapshots[state] = snapshot
+        return snapshot
 
     def __str__(self):
         return f"{self.name}[{self.state}]"
 
+    def dump(self) -> dict:
+        """
+        Dumps the character, it is the same for every language.
+
+        :return: The dumped data of the character.
+        """
+        return {'name': self.name, 'state': self.state, 'states': self.states.copy()}
+
+    def translate(self, source: str, target: str) -> dict:
+        """
+        Translates the character into its dumped data. The character has no text to be translated.
+
+        :param source: The source language.
+        :param target: The target language.
+        :return: The dumped data of the character.
+        """
+        return self.dump()
+
     def translate_and_dump(self, path: str, source: str, target: str, *args, **kwargs):
         """
         Translates and dumps the character.
@@ -90,5 +114,5 @@ class Character(BaseGameObject):
         :param args: Additional positional arguments.
         :param kwargs: Additional keyword arguments.
         """
-        output = self.__dict__.copy()
+        output = self.translate(source, target)
         dump(os.path.join(path, target, f'{self.name.upper()}.json'), output)
@@ -4,10 +4,15 @@ It includes methods for adding actions to a scene, executing the next action, lo
 """
 import json
 import os
+from collections import deque
 
 from engine.game_objects.action import Action, Choice, Talk, GoTo
 from engine.game_objects.base import BaseGameObject
 from engine.game_objects.character import Character
+from engine.game_objects.string_table import StringTable
+
+# The history only needs to cover a rewind of the scene, looping scenes must not grow it forever.
+DEFAULT_HISTORY_SIZE = 50
 
 
 class Scene(BaseGameObject):
@@ -16,20 +21,22 @@ class Scene(BaseGameObject):
 
     :param name: The name of the scene.
     :param background: The background of the scene.
+    :param history_size: The maximum amount of executed actions kept in the history.
     """
+    __slots__ = ('name', 'background', 'action', 'actions', '_history', 'outcomes')
     name: str
     background: str
     action: int
     actions: list[Action]
-    history: list[Action]
     outcomes: list[str]
 
-    def __init__(self, name, background, *args, **kwargs):
+    def __init__(self, name, background, *args, history_size: int = DEFAULT_HISTORY_SIZE, **kwargs):
         """
         Initializes the Scene instance.
 
         :param name: The name of the scene.
         :param background: The background of the scene.
+        :param history_size: The maximum amount of executed actions kept in the history.
         :param args: Additional positional arguments.
         :param kwargs: Additional keyword arguments.
         """
@@ -37,7 +44,7 @@ class Scene(BaseGameObject):
         self.name = name
         self.background = background
         self.actions = []
-        self.history = []
+        self._history: deque[int] = deque(maxlen=history_size)
         self.action = 0
         self.outcomes = []
 
@@ -47,6 +54,15 @@ class Scene(BaseGameObject):
             f"{[f'{idx}: ' + str(action) for idx, action in enumerate(self.actions, start=1)]}"
         )
 
+    @property
+    def history(self) -> list[Action]:
+        """
+        Returns the last executed actions of the scene, oldest first.
+
+        :return: A list of actions.
+        """
+        return [self.actions[index] for index in self._history]
+
     def add_action(self, action: Action):
         """
         Adds an action to the scene.
@@ -70,7 +86,7 @@ class Scene(BaseGameObject):
         """
         if self.action < len(self.actions):
             action = self.actions[self.action]
-            self.history.append(action)
+            self._history.append(self.action)
             self.action += 1
             return action
         self.action = 0
@@ -88,13 +104,31 @@ class Scene(BaseGameObject):
         :return: A Scene instance.
         """
         with open(path, "r", encoding='utf-8') as file:
-            content = json.load(file)
-            scene = cls(**content)
+            return cls.from_dict(json.load(file), characters)
+
+    @classmethod
+    def from_dict(
+            cls,
+            content: dict,
+            characters: dict[str, Character] = None,
+            strings: StringTable = None
+    ) -> 'Scene':
+        """
+        Creates a scene from its dumped data.
+
+        :param content: The dumped data of the scene.
+        :param characters: A dictionary mapping character names to Character instances.
+        :param strings: The string table of the story, when the texts of the data are text identifiers.
+        :return: A Scene instance.
+        """
+        scene = cls(**content)
         for action in content.get('actions'):
             action_type = action.pop('type')
             if not action_type:
                 raise Exception("Action type not found")
             action['character'] = characters.get(action['character'].upper())
+            if strings is not None:
+                action['strings'] = strings
             if action_type == "choice":
                 choices = [
                     (choice['go_to'], choice['text'])
@@ -107,6 +141,39 @@ class Scene(BaseGameObject):
                 scene.add_action(Talk(**action))
         return scene
 
+    def translate(self, source: str, target: str) -> dict:
+        """
+        Translates the scene into its dumped data.
+
+        :param source: The source language.
+        :param target: The target language.
+        :return: The dumped data of the scene.
+        """
+        return {
+            "name": self.name,
+            "background": self.background,
+            "actions": [
+                action.dump(source, target)
+                for action in self.actions
+            ]
+        }
+
+    def dump_structure(self, strings: dict[str, str]) -> dict:
+        """
+        Dumps the scene without its texts, which are replaced by stable identifiers and collected in the strings.
+
+        :param strings: A dictionary collecting the texts by identifier.
+        :return: The dumped data of the scene.
+        """
+        return {
+            "name": self.name,
+            "background": self.background,
+            "actions": [
+                action.dump_structure(f"{self.name}#{index}", strings)
+                for index, action in enumerate(self.actions)
+            ]
+        }
+
     def translate_and_dump(self, path: str, source: str, target: str, *args, **kwargs):
         """
         Translates and dumps the scene.
@@ -117,17 +184,9 @@ class Scene(BaseGameObject):
         :param args: Additional positional arguments.
         :param kwargs: Additional keyword arguments.
         """
-        snapshot = self.__dict__.copy()
-        output = {
-            "name": snapshot["name"],
-            "background": snapshot["background"],
-            "actions": [
-                action.dump(source, target)
-                for action in snapshot["actions"]
-            ]
-        }
+        output = self.translate(source, target)
         output_path = os.path.join(path, target)
-        output_file = os.path.join(output_path, f"{snapshot['name']}.json")
+        output_file = os.path.join(output_path, f"{self.name}.json")
         os.makedirs(output_path, exist_ok=True)
         with open(output_file, "w", encoding='utf-8') as file:
             json.dump(output, file, ensure_ascii=False)
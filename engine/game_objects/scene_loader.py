@@ -0,0 +1,106 @@
+"""
+This module contains the SceneLoader class for the game engine.
+It includes a mapping of scene names to scenes that only parses a scene the first time it is accessed,
+and can warm the scenes reachable from another one on a background thread.
+"""
+
+import threading
+from collections.abc import MutableMapping
+from typing import Callable, Iterable, Iterator
+
+from engine.game_objects.scene import Scene
+
+
+class SceneLoader(MutableMapping):
+    """
+    SceneLoader class. It behaves like a dictionary of scenes but loads each one on first access.
+
+    :param scene_names: The names of the scenes available to be loaded.
+    :param load: A callable receiving a scene name and returning the loaded Scene.
+    """
+
+    def __init__(self, scene_names: Iterable[str], load: Callable[[str], Scene]):
+        """
+        Initializes the SceneLoader instance.
+
+        :param scene_names: The names of the scenes available to be loaded.
+        :param load: A callable receiving a scene name and returning the loaded Scene.
+        """
+        self._names = dict.fromkeys(scene_names)
+        self._scenes: dict[str, Scene] = {}
+        self._load = load
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str) -> Scene:
+        scene = self._scenes.get(name)
+        if scene is not None:
+            return scene
+        if name not in self._names:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._scenes:
+                self._scenes[name] = self._load(name)
+            return self._scenes[name]
+
+    def __setitem__(self, name: str, scene: Scene):
+        with self._lock:
+            self._names[name] = None
+            self._scenes[name] = scene
+
+    def __delitem__(self, name: str):
+        with self._lock:
+            del self._names[name]
+            self._scenes.pop(name, None)
+
+    def __contains__(self, name) -> bool:
+        # Checking a name must not parse the scene, the default Mapping implementation would.
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def loaded(self) -> list[str]:
+        """
+        Returns the names of the scenes parsed so far.
+
+        :return: A list of scene names.
+        """
+        return list(self._scenes)
+
+    def warm(self, scene_name: str, depth: int = 1) -> threading.Thread:
+        """
+        Loads the scenes reachable from a scene on a background thread, breadth first.
+
+        :param scene_name: The name of the scene where the walk starts.
+        :param depth: How many jumps away from the scene are loaded.
+        :return: The thread doing the work.
+        """
+        thread = threading.Thread(target=self._warm, args=(scene_name, depth), name='scene-warmer', daemon=True)
+        thread.start()
+        return thread
+
+    def _warm(self, scene_name: str, depth: int):
+        visited = {scene_name}
+        frontier = [scene_name]
+        for _ in range(depth):
+            next_frontier = []
+            for name in frontier:
+                try:
+                    outcomes = self[name].outcomes
+                except Exception:  # noqa
+                    # A broken scene is reported when the game enters it, not by the warmer.
+                    continue
+                for outcome in outcomes:
+                    if outcome and outcome not in visited and outcome in self:
+                        visited.add(outcome)
+                        next_frontier.append(outcome)
+            frontier = next_frontier
+        for name in frontier:
+            try:
+                self[name]
+            except Exception:  # noqa
+                continue
@@ -0,0 +1,67 @@
+"""
+This module contains the StringTable class for the game engine.
+It includes the texts of one language keyed by stable identifiers, shared by every action of a built story.
+"""
+
+import json
+
+
+class StringTable:
+    """
+    StringTable class. It maps the text identifiers of the story to the texts of the active language.
+    Swapping the language replaces the texts in place, so the actions holding the table never need to be reloaded.
+
+    :param strings: A dictionary mapping text identifiers to texts.
+    :param language: The language of the texts.
+    """
+    strings: dict[str, str]
+    language: str | None
+    version: int
+
+    def __init__(self, strings: dict[str, str] = None, language: str = None):
+        """
+        Initializes the StringTable instance.
+
+        :param strings: A dictionary mapping text identifiers to texts.
+        :param language: The language of the texts.
+        """
+        self.strings = strings or {}
+        self.language = language
+        self.version = 0
+
+    def __getitem__(self, key: str) -> str:
+        return self.strings[key]
+
+    def __len__(self):
+        return len(self.strings)
+
+    def get(self, key: str) -> str:
+        """
+        Returns the text of an identifier, or the identifier itself when the language has no text for it.
+
+        :param key: The text identifier.
+        :return: The text.
+        """
+        return self.strings.get(key, key)
+
+    def swap(self, strings: dict[str, str], language: str):
+        """
+        Replaces the texts with the ones of another language.
+        The version is bumped so the actions rebuild their cached render payloads.
+
+        :param strings: A dictionary mapping text identifiers to texts.
+        :param language: The language of the texts.
+        """
+        self.strings = strings
+        self.language = language
+        self.version += 1
+
+    def load(self, path: str, language: str):
+        """
+        Replaces the texts with the ones stored in a string table file.
+
+        :param path: The path of the string table file.
+        :param language: The language of the texts.
+        """
+        with open(path, 'r', encoding='utf-8') as table_file:
+            self.swap(json.load(table_file), language)
@@ -0,0 +1,145 @@
+"""
+This module contains the AssetPrefetcher class for the game engine.
+It includes the breadth-first walk over the scene graph and the worker thread that decodes the images of the
+reachable scenes while the player is reading.
+"""
+
+import queue
+import threading
+from typing import Mapping
+
+from engine.game_objects.scene import Scene
+from engine.game_ui.game_renderer import RendererBase
+
+DEFAULT_PREFETCH_DEPTH = 1
+
+
+class AssetPrefetcher:
+    """
+    AssetPrefetcher class. It loads the backgrounds and character images of the scenes reachable from the active one
+    into the renderers surface cache on a background thread.
+
+    :param background_renderer: The renderer used to load the backgrounds.
+    :param foreground_renderer: The renderer used to load the character images.
+    :param depth: How many jumps away from the active scene are prefetched.
+    """
+    background_renderer: RendererBase
+    foreground_renderer: RendererBase
+    depth: int
+    requested: int
+    loaded: int
+    failed: int
+
+    def __init__(
+            self,
+            background_renderer: RendererBase,
+            foreground_renderer: RendererBase,
+            depth: int = DEFAULT_PREFETCH_DEPTH
+    ):
+        """
+        Initializes the AssetPrefetcher instance.
+
+        :param background_renderer: The renderer used to load the backgrounds.
+        :param foreground_renderer: The renderer used to load the character images.
+        :param depth: How many jumps away from the active scene are prefetched.
+        """
+        self.background_renderer = background_renderer
+        self.foreground_renderer = foreground_renderer
+        self.depth = depth
+        self.requested = 0
+        self.loaded = 0
+        self.failed = 0
+        self._generation = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+
+    def prefetch(self, scene_name: str, scenes: Mapping[str, Scene]):
+        """
+        Schedules the images of the scene and of the scenes reachable from it.
+        The scene graph is walked on the worker thread, so lazily loaded scenes are parsed there too.
+        Work scheduled for a previously entered scene that was not done yet is dropped.
+
+        :param scene_name: The name of the scene being entered.
+        :param scenes: A mapping of scene names to Scene instances.
+        """
+        self._generation += 1
+        self._queue.put((self._generation, scene_name, scenes))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name='asset-prefetcher', daemon=True)
+            self._thread.start()
+
+    def reachable_assets(self, scene_name: str, scenes: Mapping[str, Scene]) -> list[tuple[str, bool]]:
+        """
+        Walks the scene graph breadth first and lists the images used up to the configured depth,
+        nearest scenes first.
+
+        :param scene_name: The name of the scene where the walk starts.
+        :param scenes: A mapping of scene names to Scene instances.
+        :return: A list of (image path, alpha) tuples without duplicates.
+        """
+        assets = {}
+        visited = {scene_name}
+        frontier = [scene_name] if scene_name in scenes else []
+        for _ in range(self.depth + 1):
+            next_frontier = []
+            for name in frontier:
+                scene = scenes[name]
+                assets.setdefault((scene.background, False), None)
+                for action in scene.actions:
+                    assets.setdefault((action.character.image, True), None)
+                for outcome in scene.outcomes:
+                    if outcome and outcome not in visited and outcome in scenes:
+                        visited.add(outcome)
+                        next_frontier.append(outcome)
+            frontier = next_frontier
+        return list(assets)
+
+    def stop(self):
+        """
+        Drops the pending work and stops the worker thread.
+        """
+        self._generation += 1
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread = None
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the prefetcher counters and how many of the prefetched images were drawn afterwards.
+
+        :return: A dictionary with the requested, loaded, failed, hits, misses and hit rate values.
+        """
+        cache = self.background_renderer.surface_cache
+        hits = cache.prefetch_hits
+        return {
+            'requested': self.requested,
+            'loaded': self.loaded,
+            'failed': self.failed,
+            'hits': hits,
+            'misses': cache.prefetch_misses,
+            'hit_rate': hits / self.loaded if self.loaded else 0.0,
+        }
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            generation, scene_name, scenes = job
+            try:
+                assets = self.reachable_assets(scene_name, scenes)
+            except Exception:  # noqa
+                # A broken scene is reported when the game enters it.
+                continue
+            for image_path, alpha in assets:
+                if generation != self._generation:
+                    break
+                self.requested += 1
+                renderer = self.foreground_renderer if alpha else self.background_renderer
+                try:
+                    if renderer.preload(image_path, alpha=alpha):
+                        self.loaded += 1
+                except Exception:  # noqa
+                    # A broken asset is reported by the renderer when the scene draws it.
+                    self.failed += 1
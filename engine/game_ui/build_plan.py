@@ -0,0 +1,119 @@
+"""
+This module contains the BuildPlan class for the game engine.
+It includes the minimal set of translation jobs a build needs, computed before any work is done, and its summary
+for dry runs.
+"""
+
+import math
+from dataclasses import dataclass
+
+from engine.game_ui.game_configurations import Configuration
+from engine.utils.translation import DEFAULT_TRANSLATION_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class BuildPlan:
+    """
+    BuildPlan dataclass. It represents the work of a build: the story texts are written in the source language and
+    translated once into each other language, the source language table is the texts themselves.
+
+    :param source_language: The language the story is written in.
+    :param target_languages: The other languages the story is translated into.
+    :param scenes: The amount of scenes written.
+    :param characters: The amount of characters written.
+    :param texts: The amount of texts of the story.
+    :param unique_texts: The amount of distinct texts of the story, the ones actually translated.
+    :param batch_size: The maximum amount of texts sent to the translation backend at once.
+    """
+    source_language: str
+    target_languages: tuple[str, ...]
+    scenes: int
+    characters: int
+    texts: int
+    unique_texts: int
+    batch_size: int = DEFAULT_TRANSLATION_BATCH_SIZE
+
+    @classmethod
+    def create(
+            cls,
+            configuration: Configuration,
+            strings: dict[str, str],
+            scenes: int,
+            characters: int,
+            batch_size: int = DEFAULT_TRANSLATION_BATCH_SIZE,
+            languages: list[str] = None
+    ) -> 'BuildPlan':
+        """
+        Creates the plan of a build.
+
+        :param configuration: The configuration of the game, its language is the language the story is written in.
+        :param strings: A dictionary mapping the text identifiers of the story to its texts.
+        :param scenes: The amount of scenes written.
+        :param characters: The amount of characters written.
+        :param batch_size: The maximum amount of texts sent to the translation backend at once.
+        :param languages: The languages to be built, all the languages of the configuration when None.
+            The source language is always built, the game starts in it.
+        :return: A BuildPlan instance.
+        :raises ValueError: If a requested language is not one of the languages of the configuration.
+        """
+        source_language = configuration.language
+        targets = dict.fromkeys(configuration.languages)
+        if languages is not None:
+            unknown = [language for language in languages if language not in targets]
+            if unknown:
+                raise ValueError(
+                    f"Unknown languages {', '.join(unknown)}. Use some of {', '.join(targets)}, "
+                    f"or add them to Configuration.languages."
+                )
+            targets = dict.fromkeys(languages)
+        return cls(
+            source_language=source_language,
+            target_languages=tuple(language for language in targets if language != source_language),
+            scenes=scenes,
+            characters=characters,
+            texts=len(strings),
+            unique_texts=len(set(strings.values())),
+            batch_size=batch_size,
+        )
+
+    @property
+    def languages(self) -> tuple[str, ...]:
+        """
+        Returns every language a string table is written for.
+
+        :return: The source language followed by the target languages.
+        """
+        return self.source_language, *self.target_languages
+
+    @property
+    def translation_pairs(self) -> list[tuple[str, str]]:
+        """
+        Returns the (source, target) language pairs to be translated.
+
+        :return: A list of language pairs.
+        """
+        return [(self.source_language, target) for target in self.target_languages]
+
+    @property
+    def translation_batches(self) -> int:
+        """
+        Returns the maximum amount of batches sent to the translation backend, when nothing is in the translation
+        memory yet.
+
+        :return: The amount of batches.
+        """
+        return len(self.target_languages) * math.ceil(self.unique_texts / self.batch_size)
+
+    def describe(self) -> str:
+        """
+        Describes the plan for the build output.
+
+        :return: A human-readable summary of the plan.
+        """
+        targets = ', '.join(self.target_languages) or 'none'
+        return (
+            f"Build plan: {self.scenes} scenes, {self.characters} characters, "
+            f"{self.texts} texts ({self.unique_texts} distinct) written in {self.source_language}\n"
+            f"Translations: {len(self.translation_pairs)} language pairs into {targets}, "
+            f"up to {self.unique_texts * len(self.translation_pairs)} texts in {self.translation_batches} batches"
+        )
@@ -0,0 +1,114 @@
+"""
+This module contains the BuildResult and BuildEvent classes for the game engine.
+It includes the structured outcome of a build, returned to the callers running it in process, and the progress
+events streamed while it runs.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from engine.game_ui.build_plan import BuildPlan
+
+
+@dataclass(frozen=True)
+class BuildEvent:
+    """
+    BuildEvent dataclass. It represents the progress of a build stage.
+
+    :param stage: The name of the stage, e.g. 'translation' or 'images'.
+    :param status: 'start' and 'finish' delimit the stage, 'progress' reports its completed work.
+    :param message: A human-readable description of the event.
+    :param completed: The amount of work done in the stage so far.
+    :param total: The amount of work of the stage, 0 when unknown.
+    """
+    stage: str
+    status: str
+    message: str = ''
+    completed: int = 0
+    total: int = 0
+
+
+@dataclass
+class BuildResult:
+    """
+    BuildResult dataclass. It represents what a build did.
+
+    :param plan: The plan of the build.
+    :param game_title: The title of the game built.
+    :param main_path: The path of the executable script written, None for dry runs.
+    :param translations: The translation memory counters: hits, misses and batches.
+    :param files: The amount of files rebuilt, unchanged and removed.
+    :param images: The amount of images scaled and, when optimized, their summed sizes and decode times.
+    :param timings: The seconds spent in each stage, in the order they ran.
+    """
+    plan: BuildPlan
+    game_title: str
+    main_path: str | None = None
+    translations: dict[str, int] = field(default_factory=dict)
+    files: dict[str, int] = field(default_factory=dict)
+    images: dict[str, float] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def data_path(self) -> str | None:
+        """
+        Returns the folder bundled with the executable.
+
+        :return: The folder of the executable script, None for dry runs.
+        """
+        return os.path.dirname(self.main_path) if self.main_path is not None else None
+
+
+class BuildProgress:
+    """
+    BuildProgress class. It times the stages of a build and sends their events to a callable.
+
+    :param callback: The callable receiving each BuildEvent, events are only timed when None.
+    :param clock: The clock used to time the stages.
+    """
+    timings: dict[str, float]
+
+    def __init__(self, callback: Callable[[BuildEvent], None] = None, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initializes the BuildProgress instance.
+
+        :param callback: The callable receiving each BuildEvent, events are only timed when None.
+        :param clock: The clock used to time the stages.
+        """
+        self.timings = {}
+        self._callback = callback
+        self._clock = clock
+
+    def emit(self, stage: str, status: str, message: str = '', completed: int = 0, total: int = 0):
+        """
+        Sends an event to the callable.
+
+        :param stage: The name of the stage.
+        :param status: The status of the stage: 'start', 'progress' or 'finish'.
+        :param message: A human-readable description of the event.
+        :param completed: The amount of work done in the stage so far.
+        :param total: The amount of work of the stage.
+        """
+        if self._callback is not None:
+            self._callback(BuildEvent(stage, status, message, completed, total))
+
+    @contextmanager
+    def stage(self, name: str, message: str = '') -> Iterator[None]:
+        """
+        Times a stage, sending its start and finish events.
+        A stage entered twice adds up its time, a failing stage is timed but does not send its finish event.
+
+        :param name: The name of the stage.
+        :param message: A human-readable description of the stage.
+        """
+        self.emit(name, 'start', message)
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+        self.emit(name, 'finish', f"{elapsed:.2f}s")
@@ -0,0 +1,72 @@
+"""
+This module contains the FontManager class for the game engine.
+It includes the fonts shared by the renderers and a cache of the rasterized text surfaces.
+"""
+
+import pygame
+
+from engine.game_ui.constants.text_constants import font as default_font
+from engine.game_ui.surface_cache import SurfaceCache
+
+# Text lines are small, 8 MiB holds thousands of them.
+DEFAULT_TEXT_CACHE_SIZE = 8 * 1024 * 1024
+
+
+class FontManager:
+    """
+    FontManager class. It creates each font once and memoizes the surfaces rendered with them.
+
+    :param max_bytes: The maximum amount of bytes kept in the text surface cache.
+    """
+    text_cache: SurfaceCache
+
+    def __init__(self, max_bytes: int = DEFAULT_TEXT_CACHE_SIZE):
+        """
+        Initializes the FontManager instance.
+
+        :param max_bytes: The maximum amount of bytes kept in the text surface cache.
+        """
+        self._fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self.text_cache = SurfaceCache(max_bytes)
+
+    def font(self, font: tuple[str | None, int] = default_font) -> pygame.font.Font:
+        """
+        Returns the font for the given name and size, creating it on the first call.
+
+        :param font: A tuple with the font name (or None for the default font) and its size.
+        :return: The font instance.
+        """
+        if font not in self._fonts:
+            self._fonts[font] = pygame.font.Font(*font)
+        return self._fonts[font]
+
+    def render(
+            self,
+            text: str,
+            color: tuple[int, int, int],
+            antialias: bool = True,
+            font: tuple[str | None, int] = default_font
+    ) -> pygame.Surface:
+        """
+        Returns the rasterized text, rendering it only when it is not cached.
+
+        :param text: The text to be rendered.
+        :param color: The color of the text.
+        :param antialias: A flag indicating whether the text is antialiased.
+        :param font: A tuple with the font name (or None for the default font) and its size.
+        :return: The surface with the text.
+        """
+        return self.text_cache.get(
+            (font, text, color, antialias),
+            lambda: self.font(font).render(text, antialias, color)
+        )
+
+    def size(self, text: str, font: tuple[str | None, int] = default_font) -> tuple[int, int]:
+        """
+        Returns the size the text takes once rendered, without rendering it.
+
+        :param text: The text to be measured.
+        :param font: A tuple with the font name (or None for the default font) and its size.
+        :return: The width and height of the text.
+        """
+        return self.font(font).size(text)
@@ -0,0 +1,53 @@
+"""
+This module contains the FrameScheduler class for the game engine.
+It includes the frame rate cap shared by every game loop and the idle mode that sleeps until an event arrives.
+"""
+
+import pygame
+
+DEFAULT_FPS = 60
+DEFAULT_IDLE_TIMEOUT = 500
+
+
+class FrameScheduler:
+    """
+    FrameScheduler class. It paces the game loops and hands them the pending events.
+
+    :param fps: The maximum amount of frames per second.
+    :param idle_wait: A flag indicating whether the scheduler blocks on the event queue when nothing is animating.
+    :param idle_timeout: The maximum time in milliseconds to block on the event queue.
+    """
+    fps: int
+    idle_wait: bool
+    idle_timeout: int
+    clock: pygame.time.Clock
+
+    def __init__(self, fps: int = DEFAULT_FPS, idle_wait: bool = True, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initializes the FrameScheduler instance.
+
+        :param fps: The maximum amount of frames per second.
+        :param idle_wait: A flag indicating whether the scheduler blocks on the event queue when nothing is animating.
+        :param idle_timeout: The maximum time in milliseconds to block on the event queue.
+        """
+        self.fps = fps
+        self.idle_wait = idle_wait
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+
+    def events(self, animating: bool = False) -> list[pygame.event.Event]:
+        """
+        Waits for the next frame and returns the pending events.
+        When idle mode is active and nothing is animating, it sleeps until an event arrives or the timeout expires.
+
+        :param animating: A flag indicating whether the caller has something moving on the screen.
+        :return: The list of pending events.
+        """
+        events = []
+        if self.idle_wait and not animating:
+            event = pygame.event.wait(self.idle_timeout)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+        self.clock.tick(self.fps)
+        events.extend(pygame.event.get())
+        return events
@@ -9,9 +9,15 @@ import sys
 
 import pygame
 
+from engine.game_objects.action import Action
+from engine.game_objects.backlog import Backlog
 from engine.game_objects.character import Character
 from engine.game_objects.scene import Scene
-from engine.game_ui.constants.window_constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from engine.game_objects.scene_loader import SceneLoader
+from engine.game_objects.string_table import StringTable
+from engine.game_ui.asset_prefetcher import AssetPrefetcher
+from engine.game_ui.font_manager import FontManager
+from engine.game_ui.frame_scheduler import FrameScheduler
 from engine.game_ui.game_configurations import Configuration
 from engine.game_ui.game_renderer import (
     GameSceneRenderer,
@@ -21,13 +27,18 @@ from engine.game_ui.game_renderer import (
     MenuRenderer
 )
 from engine.game_ui.game_scene import play_scene
+from engine.game_ui.surface_cache import SurfaceCache
+from engine.utils.asset_store import AssetIndex
+from engine.utils.resolutions import image_folder
+from engine.utils.story_pack import StoryPack, story_pack_path, string_table_path
 
 
 class Game:
     """
     Game class. It represents the game engine.
     """
-    scenes: dict[str, Scene]
+    scenes: dict[str, Scene] | SceneLoader
+    strings: StringTable | None
     active_scene: str | None
     configuration: Configuration
     debug: bool
@@ -40,17 +51,46 @@ class Game:
         :param debug: A flag indicating whether the game is in debug mode.
         """
         self.scenes = {}
+        self.strings = None
+        self.backlog = Backlog(configuration.backlog_size)
         self.active_scene = 'start'
         self.configuration = configuration
         self.debug = debug
+        # A built game may keep its resources in a content-addressed store, the index finds the file of each one.
+        self.assets = AssetIndex.open(self.configuration.resource_folder)
         if not self.configuration.build:
             pygame.init()
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.menu_renderer = MenuRenderer(self.screen, self.configuration.resource_folder)
+            self.screen = pygame.display.set_mode(self.configuration.resolution)
+            self.surface_cache = SurfaceCache(self.configuration.surface_cache_size)
+            self.font_manager = FontManager(self.configuration.text_cache_size)
+            # The build may ship pre-scaled images per resolution, the closest one to the window is picked once here.
+            resource_folder = image_folder(
+                self.configuration.resource_folder,
+                self.configuration.resolution,
+                self.assets.folders()
+            )
+            self.menu_renderer = MenuRenderer(
+                self.screen, resource_folder, self.surface_cache, self.font_manager, self.assets
+            )
             self.renderer = GameSceneRenderer(
-                background_renderer=BackgroundRenderer(self.screen, self.configuration.resource_folder),
-                foreground_renderer=ForegroundRenderer(self.screen, self.configuration.resource_folder),
-                hud_renderer=HUDRenderer(self.screen, self.configuration.resource_folder)
+                background_renderer=BackgroundRenderer(self.screen, resource_folder, self.surface_cache, self.assets),
+                foreground_renderer=ForegroundRenderer(self.screen, resource_folder, self.surface_cache, self.assets),
+                hud_renderer=HUDRenderer(
+                    self.screen, resource_folder, self.surface_cache, self.font_manager, self.assets
+                ),
+                composite_cache=SurfaceCache(self.configuration.composite_cache_size)
+            )
+            self.prefetcher = None
+            if self.configuration.prefetch_depth > 0:
+                self.prefetcher = AssetPrefetcher(
+                    self.renderer.background_renderer,
+                    self.renderer.foreground_renderer,
+                    depth=self.configuration.prefetch_depth,
+                )
+            self.scheduler = FrameScheduler(
+                fps=self.configuration.fps,
+                idle_wait=self.configuration.idle_wait,
+                idle_timeout=self.configuration.idle_timeout,
             )
             pygame.display.set_caption(self.configuration.game_title)
         self._user_folder_path = os.path.join(os.path.expanduser("~"), self.configuration.game_title)
@@ -64,11 +104,12 @@ class Game:
         :return: The next game state.
         """
         selected_item = 0
-        menu_items = self.configuration.languages
+        menu_items = self.available_languages()
         running = True
         while running:
             self.menu_renderer.render(selected_item, menu_items)
-            for event in pygame.event.get():
+            pygame.display.flip()
+            for event in self.scheduler.events():
                 if event.type == pygame.QUIT:
                     return "quit"
                 elif event.type == pygame.KEYDOWN:
@@ -82,7 +123,19 @@ class Game:
                         return "menu"
                     elif event.key == pygame.K_ESCAPE:
                         return "quit"
-            pygame.display.flip()
+
+    def available_languages(self) -> list[str]:
+        """
+        Returns the languages of the configuration the game has texts for, a build may bundle only some of them.
+
+        :return: A list of languages.
+        """
+        if self.strings is None:
+            return self.configuration.languages
+        return [
+            language for language in self.configuration.languages
+            if os.path.exists(self.assets.resolve(string_table_path(self.configuration.resource_folder, language)))
+        ]
 
     def show_menu(self):
         """
@@ -97,7 +150,8 @@ class Game:
         running = True
         while running:
             self.menu_renderer.render(selected_item, menu_items)
-            for event in pygame.event.get():
+            pygame.display.flip()
+            for event in self.scheduler.events():
                 if event.type == pygame.QUIT:
                     return "quit"
                 elif event.type == pygame.KEYDOWN:
@@ -108,6 +162,7 @@ class Game:
                     elif event.key == pygame.K_RETURN:
                         match menu_items[selected_item]:
                             case "Start Game":
+                                self.backlog.clear()
                                 return 'gameplay'
                             case "Load Game":
                                 return "load_game"
@@ -115,7 +170,6 @@ class Game:
                                 return 'quit'
                     elif event.key == pygame.K_ESCAPE:
                         return "quit"
-            pygame.display.flip()
 
     def _has_save_file(self) -> bool:
         return os.path.exists(self._save_file_path)
@@ -136,9 +190,9 @@ class Game:
                 default_lang = self.configuration.language
                 game_state = self.select_language()
                 if default_lang != self.configuration.language:
-                    self.scenes = {}
                     self.active_scene = 'start'
-                    self.load_assets(self.configuration, game=self)
+                    self._switch_language(self.configuration.language)
+                    self.renderer.clear_composites()
             elif game_state == "menu":
                 self.active_scene = 'start'
                 game_state = self.show_menu()
@@ -154,6 +208,17 @@ class Game:
 
             pygame.display.flip()
 
+    def _switch_language(self, language: str):
+        if self.strings is not None:
+            # The story structure is shared by every language, only the texts are swapped in place.
+            self.strings.load(
+                self.assets.resolve(string_table_path(self.configuration.resource_folder, language)),
+                language
+            )
+        else:
+            self.scenes = {}
+            self.load_assets(self.configuration, game=self)
+
     def _handle_save_file(self, game_state, output):
         if game_state == 'game_over' and self._has_save_file():
             print('Removing save file, game was completed')
@@ -164,15 +229,30 @@ class Game:
 
     def _gameplay(self, game_state):
         print('Scene:', self.scenes[self.active_scene].name)
+        if self.prefetcher is not None:
+            # The prefetcher walks the reachable scenes on its own thread, which also parses the lazy ones.
+            self.prefetcher.prefetch(self.active_scene, self.scenes)
+        elif isinstance(self.scenes, SceneLoader):
+            self.scenes.warm(self.active_scene)
         # TODO Move to a class with the common interface
         output, game_state = play_scene(
             self.scenes[self.active_scene],
             self.renderer,
+            self.scheduler,
+            self.backlog,
         )
         self.scenes[self.active_scene].action = 0
         self.active_scene = output
         return game_state, output
 
+    def backlog_actions(self) -> list[tuple[str, Action]]:
+        """
+        Returns the actions shown to the player so far, across scenes, oldest first.
+
+        :return: A list of (scene name, action) tuples.
+        """
+        return self.backlog.actions(self.scenes)
+
     def _load_game_data(self, game_state):
         with open(self._save_file_path, 'r') as file:
             loaded_scene = file.read()
@@ -201,31 +281,58 @@ class Game:
         :param game: An optional Game instance.
         :return: A Game instance with the loaded assets.
         """
-        assets_path = os.path.join(configuration.resource_folder, 'assets.json')
-        with open(assets_path, 'r') as assets_file:
-            assets = json.load(assets_file)
-        characters = {}
-        char_folder = os.path.join(configuration.resource_folder, 'characters', configuration.language)
-        for character in assets['characters']:
-            character_path = os.path.join(char_folder, f"{character}.json")
-            with open(character_path, 'r') as character_file:
-                data = json.load(character_file)
-                characters[data['name'].upper()] = Character(**data)
-
-        scene_folder = os.path.join(configuration.resource_folder, 'scenes', configuration.language)
         if game is None:
             game = Game(configuration, debug=False)
         else:
             game.scenes = {}
-        for scene in assets['scenes']:
-            scene_path = os.path.join(scene_folder, f"{scene}.json")
-            game.add_scene(Scene.load(scene_path, characters=characters))
+        strings = None
+        pack_path = game.assets.resolve(story_pack_path(configuration.resource_folder))
+        if os.path.exists(pack_path):
+            # The story is a single pack, read with one open and one read, and its texts come from the string table.
+            pack = StoryPack.open(pack_path)
+            strings = StringTable()
+            strings.load(
+                game.assets.resolve(string_table_path(configuration.resource_folder, configuration.language)),
+                configuration.language
+            )
+            characters = {name: Character(**data) for name, data in pack.characters.items()}
+            scene_names = pack.scene_names
+
+            def load_scene(name: str) -> Scene:
+                return Scene.from_dict(pack.scene(name), characters=characters, strings=strings)
+        else:
+            assets_path = game.assets.resolve(os.path.join(configuration.resource_folder, 'assets.json'))
+            with open(assets_path, 'r') as assets_file:
+                assets = json.load(assets_file)
+            characters = {}
+            char_folder = os.path.join(configuration.resource_folder, 'characters', configuration.language)
+            for character in assets['characters']:
+                character_path = os.path.join(char_folder, f"{character}.json")
+                with open(character_path, 'r') as character_file:
+                    data = json.load(character_file)
+                    characters[data['name'].upper()] = Character(**data)
+            scene_names = assets['scenes']
+            scene_folder = os.path.join(configuration.resource_folder, 'scenes', configuration.language)
+
+            def load_scene(name: str) -> Scene:
+                return Scene.load(os.path.join(scene_folder, f"{name}.json"), characters=characters)
+
+        game.strings = strings
+
+        if configuration.lazy_scenes:
+            # Scenes are parsed on first access, so the startup time does not grow with the story.
+            game.scenes = SceneLoader(scene_names, load_scene)
+        else:
+            for scene in scene_names:
+                game.add_scene(load_scene(scene))
         return game
 
     def quit(self):
         """
         Quits the game.
         """
+        if getattr(self, 'prefetcher', None) is not None:
+            self.prefetcher.stop()
         pygame.quit()
         sys.exit()
 
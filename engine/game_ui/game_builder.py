@@ -3,21 +3,52 @@ This module contains the GameBuilder class for the game engine.
 It includes methods for building the game, including translating and dumping characters and scenes, and moving files to the output folder.
 """
 
+import argparse
+import json
 import os
-import shutil
+from typing import Callable
 
 from engine.game_objects.character import Character
+from engine.game_ui.build_plan import BuildPlan
+from engine.game_ui.build_result import BuildEvent, BuildProgress, BuildResult
 from engine.game_ui.game import Game
 from engine.game_ui.game_configurations import Configuration
-from engine.utils.files import dump
+from engine.utils.asset_store_builder import DEFAULT_ASSET_STAGING, AssetStore
+from engine.utils.build_jobs import DEFAULT_BUILD_JOBS, BuildJobError, run_jobs
+from engine.utils.build_manifest import DEFAULT_BUILD_MANIFEST, BuildManifest
+from engine.utils.images import (
+    DEFAULT_IMAGE_FORMAT,
+    IMAGE_FORMATS,
+    ImageStats,
+    is_image,
+    optimize_image,
+    prescale_image,
+)
+from engine.utils.resolutions import format_resolution, parse_resolution
+from engine.utils.story_pack import encode_story_pack, encode_string_table, story_pack_path, string_table_path
+from engine.utils.translation import TRANSLATION_BACKENDS, GoogleTranslationBackend, TranslationBackend
+from engine.utils.translation_executor import (
+    DEFAULT_TRANSLATION_RATE,
+    DEFAULT_TRANSLATION_RETRIES,
+    DEFAULT_TRANSLATION_WORKERS,
+    TranslationExecutor,
+)
+from engine.utils.translation_memory import DEFAULT_TRANSLATION_MEMORY, TranslationMemory
+
+# Set by the packaging to time the launch, the game stops once its assets are loaded and its window is open.
+LAUNCH_PROBE_VARIABLE = 'PYENGINE_LAUNCH_PROBE'
+
+OUTPUT_EXECUTABLE = f"""
+import os
 
-OUTPUT_EXECUTABLE = """
 from engine.game_ui.game import Game
 
 from configuration import GAME_CONFIGURATION
 
 if __name__ == "__main__":
     game = Game.load_assets(GAME_CONFIGURATION)
+    if os.environ.get('{LAUNCH_PROBE_VARIABLE}'):
+        game.quit()
     game.start()
 """
 
@@ -38,71 +69,418 @@ class GameBuilder:
         self.game = game
         self.config = game.configuration
 
-    def build(self, characters: dict[str, Character], output_folder: str = None):
+    def build(
+            self,
+            characters: dict[str, Character],
+            output_folder: str = None,
+            resolutions: list[tuple[int, int]] = None,
+            translation_memory: str = DEFAULT_TRANSLATION_MEMORY,
+            translation_backend: TranslationBackend = None,
+            translation_executor: TranslationExecutor = None,
+            dry_run: bool = False,
+            build_manifest: str = DEFAULT_BUILD_MANIFEST,
+            force: bool = False,
+            jobs: int = DEFAULT_BUILD_JOBS,
+            progress: Callable[[BuildEvent], None] = None,
+            optimize_images: str = None,
+            asset_store: bool = False,
+            asset_staging: str = DEFAULT_ASSET_STAGING,
+            languages: list[str] = None
+    ) -> BuildResult:
         """
         Builds the game.
 
         :param characters: A dictionary mapping character names to Character instances.
         :param output_folder: The output folder for the game.
+        :param resolutions: The resolutions the images are pre-scaled to, the original images are shipped when empty.
+        :param translation_memory: The path of the database keeping the translations between builds.
+        :param translation_backend: The backend translating the texts, Google Translate by default.
+        :param translation_executor: The executor sending the texts to the backend concurrently.
+        :param dry_run: A flag indicating whether the build only prints its plan, without translating or writing.
+        :param build_manifest: The path of the manifest recording the files written, to skip them on the next build.
+        :param force: A flag indicating whether every file is rebuilt, ignoring the manifest.
+        :param jobs: The amount of processes scaling the images.
+        :param progress: The callable receiving the BuildEvent of each stage while the build runs.
+        :param optimize_images: The format the images are re-encoded to, one of IMAGE_FORMATS. The images are then
+            scaled down to the game resolution and their metadata is dropped. They are shipped as they are when None.
+        :param asset_store: A flag indicating whether the resources are shipped in a content-addressed store, where
+            identical files are stored once.
+        :param asset_staging: The folder the resources are laid out in before being stored, kept between builds.
+        :param languages: The languages translated and bundled, all the languages of the configuration when None.
+            The language the story is written in is always bundled.
+        :return: The result of the build, with its plan, paths, counters and the time spent in each stage.
+        :raises BuildJobError: After the rest of the build is written, if some images could not be scaled.
         """
-        output_char_folder = os.path.join(output_folder, self.config.resource_folder, 'characters')
-        output_scene_folder = os.path.join(output_folder, self.config.resource_folder, 'scenes')
-        languages = self.config.languages
-        for language in languages:
-            for name, character in characters.items():
-                for target_language in self.config.languages:
-                    character.translate_and_dump(output_char_folder, language, target=target_language)
-
+        stages = BuildProgress(progress)
+        output_resource_folder = os.path.join(output_folder, self.config.resource_folder)
+        # With an asset store the resources are laid out in the staging folder, and only stored once they are built.
+        resource_folder = output_resource_folder
+        if asset_store:
+            resource_folder = os.path.join(asset_staging, self.config.resource_folder)
+        with stages.stage('plan', 'Dumping the story'):
+            # The story structure is language independent, only its texts are translated into a table per language.
+            strings = {}
+            structure = {}
+            scene_hashes = {}
             for name, scene in self.game.scenes.items():
-                for target_language in self.config.languages:
-                    scene.translate_and_dump(output_scene_folder, language, target=target_language)
-
-        assets_file = os.path.join(output_folder, self.config.resource_folder, 'assets.json')
-        dump(
-            assets_file,
-            {
-                "scenes": list(self.game.scenes.keys()),
-                "characters": list(characters.keys())
-            }
-        )
-        self._move_to_output_folder(
-            self.config.resource_folder,
-            os.path.join(output_folder, self.config.resource_folder)
-        )
+                scene_strings = {}
+                structure[name] = scene.dump_structure(scene_strings)
+                scene_hashes[name] = BuildManifest.content_hash([structure[name], scene_strings])
+                strings.update(scene_strings)
+            dumped_characters = {character.name.upper(): character.dump() for character in characters.values()}
+            plan = BuildPlan.create(
+                self.config,
+                strings,
+                scenes=len(structure),
+                characters=len(characters),
+                languages=languages
+            )
+            print(plan.describe())
+        result = BuildResult(plan, self.config.game_title, timings=stages.timings)
+        if dry_run:
+            return result
 
-        files_to_generate = {
-            os.path.join(output_folder, '__init__.py'): '',
-            os.path.join(output_folder, '__main__.pyw'): OUTPUT_EXECUTABLE,
-        }
-        for file, content in files_to_generate.items():
-            with open(file, 'w') as game_file:
-                game_file.write(content)
+        manifest = BuildManifest(build_manifest, force=force)
+        with stages.stage('story', 'Writing the story pack'):
+            manifest.compare('scenes', scene_hashes)
+            manifest.compare(
+                'characters',
+                {name: BuildManifest.content_hash(character) for name, character in dumped_characters.items()}
+            )
+            manifest.write(story_pack_path(resource_folder), encode_story_pack(dumped_characters, structure))
+
+        with stages.stage(
+                'translation',
+                f"Translating {plan.unique_texts} texts into {len(plan.target_languages)} languages"
+        ):
+            # The story is written in the configured language, its table is the texts themselves.
+            string_tables = {plan.source_language: strings}
+            keys = list(strings)
+            texts = list(strings.values())
+            with TranslationMemory(
+                    translation_memory,
+                    translation_backend or GoogleTranslationBackend(),
+                    batch_size=plan.batch_size,
+                    executor=translation_executor or TranslationExecutor()
+            ) as memory:
+                translations = memory.translate_pairs(texts, plan.translation_pairs)
+            for (_, target_language), translated in translations.items():
+                string_tables[target_language] = dict(zip(keys, translated))
+            print(
+                f"Translation memory: {memory.hits} hits, {memory.misses} misses, "
+                f"{memory.batches} batches sent to {memory.backend.name}"
+            )
+            result.translations = {'hits': memory.hits, 'misses': memory.misses, 'batches': memory.batches}
+            for target_language, string_table in string_tables.items():
+                manifest.write(
+                    string_table_path(resource_folder, target_language),
+                    encode_string_table(string_table)
+                )
 
-        files_to_copy = [
-            'configuration.py',
-        ]
+        with stages.stage('images', 'Placing the resources'):
+            assets_file = os.path.join(resource_folder, 'assets.json')
+            manifest.write(
+                assets_file,
+                json.dumps({
+                    "scenes": list(self.game.scenes.keys()),
+                    "characters": list(characters.keys())
+                })
+            )
+            image_jobs = []
+            self._move_to_output_folder(
+                self.config.resource_folder,
+                resource_folder,
+                manifest,
+                image_jobs,
+                variant_paths={
+                    resolution: os.path.join(resource_folder, format_resolution(resolution))
+                    for resolution in resolutions or []
+                },
+                image_format=optimize_images
+            )
+            failures, result.images = self._scale_images(image_jobs, manifest, jobs, stages, optimize_images)
+            if optimize_images:
+                print(describe_image_stats(result.images))
 
-        for file in files_to_copy:
-            shutil.copy(file, os.path.join(output_folder, file))
+        with stages.stage('files', 'Writing the game files'):
+            result.main_path = os.path.join(output_folder, '__main__.pyw')
+            files_to_generate = {
+                os.path.join(output_folder, '__init__.py'): '',
+                result.main_path: OUTPUT_EXECUTABLE,
+            }
+            for file, content in files_to_generate.items():
+                manifest.write(file, content)
+
+            files_to_copy = [
+                'configuration.py',
+            ]
+
+            for file in files_to_copy:
+                manifest.copy(file, os.path.join(output_folder, file))
+            manifest.save()
+        result.files = {
+            'rebuilt': len(manifest.rebuilt),
+            'unchanged': len(manifest.skipped),
+            'removed': len(manifest.removed),
+        }
+        print(manifest.summary())
+        store = AssetStore(output_resource_folder)
+        if asset_store:
+            with stages.stage('store', 'Storing the resources by content'):
+                store.sync(resource_folder)
+            print(store.summary())
+            result.files['stored'] = store.stored
+        else:
+            store.clear()
+        if failures:
+            raise BuildJobError(failures)
         print('Game assets built successfully')
-        print(f"#{os.path.join(output_folder, '__main__.pyw')}#{self.config.game_title}#")
+        # Kept for the projects whose build.py is still run as a script and parsed by the CLI.
+        print(f"#{result.main_path}#{self.config.game_title}#")
+        return result
 
-    def _move_to_output_folder(self, source_folder: str, output_path: str = None):
+    def _move_to_output_folder(
+            self,
+            source_folder: str,
+            output_path: str,
+            manifest: BuildManifest,
+            image_jobs: list[tuple[tuple, str, str]],
+            variant_paths: dict[tuple[int, int], str] = None,
+            image_format: str = None
+    ):
         """
-        Moves files to the output folder.
+        Moves files to the output folder, skipping the files placed from the same content by the last build.
+        The images to be scaled are added to the image jobs instead of being copied: when variant paths are given,
+        they are pre-scaled into each resolution folder, and when an image format is given, they are optimized.
 
         :param source_folder: The source folder.
         :param output_path: The output path.
+        :param manifest: The manifest of the build.
+        :param image_jobs: A list collecting the (job arguments, manifest variant, reason) of each image to scale.
+        :param variant_paths: A dictionary mapping each target resolution to its output path.
+        :param image_format: The format the images are optimized to, one of IMAGE_FORMATS.
         :return: None
         """
-        if output_path is None:
-            output_path = os.path.join('output', self.config.resource_folder)
         os.makedirs(output_path, exist_ok=True)
-        for file_name in os.listdir(source_folder):
+        for file_name in sorted(os.listdir(source_folder)):
             source = os.path.join(source_folder, file_name)
             destination = os.path.join(output_path, file_name)
             if os.path.isfile(source):
-                shutil.copy(source, destination)
-                print('Copying file: ', source)
+                if variant_paths and is_image(source):
+                    for resolution, variant_path in variant_paths.items():
+                        self._add_image_job(
+                            image_jobs,
+                            manifest,
+                            (source, os.path.join(variant_path, file_name), resolution),
+                            format_resolution(resolution),
+                            image_format
+                        )
+                elif image_format and is_image(source):
+                    # Without variants the images are only scaled down, the game window is the largest target.
+                    self._add_image_job(
+                        image_jobs,
+                        manifest,
+                        (source, destination, self.config.resolution),
+                        'optimized',
+                        image_format,
+                        upscale=False
+                    )
+                elif manifest.copy(source, destination):
+                    print('Copying file: ', source)
             elif os.path.isdir(source) and not source.endswith(('characters', 'scenes')):
-                self._move_to_output_folder(source, destination)
+                self._move_to_output_folder(
+                    source,
+                    destination,
+                    manifest,
+                    image_jobs,
+                    {
+                        resolution: os.path.join(variant_path, file_name)
+                        for resolution, variant_path in (variant_paths or {}).items()
+                    },
+                    image_format
+                )
+
+    @staticmethod
+    def _add_image_job(
+            image_jobs: list[tuple[tuple, str, str]],
+            manifest: BuildManifest,
+            arguments: tuple[str, str, tuple[int, int]],
+            variant: str,
+            image_format: str = None,
+            upscale: bool = True
+    ):
+        """
+        Adds an image to the jobs, unless the manifest shows it was built from the same source with the same options.
+
+        :param image_jobs: The (job arguments, manifest variant, reason) of each image to scale.
+        :param manifest: The manifest of the build.
+        :param arguments: The source, destination and resolution of the image.
+        :param variant: The name of the variant in the manifest.
+        :param image_format: The format the image is optimized to, it is only scaled when None.
+        :param upscale: A flag indicating whether an optimized image smaller than the resolution is scaled up.
+        """
+        source, destination, _ = arguments
+        if image_format:
+            arguments = (*arguments, image_format, upscale)
+            variant = f"{variant} {image_format}"
+        reason = manifest.check_derived(source, destination, variant)
+        if reason is None:
+            manifest.record_derived(source, destination, variant, None)
+        else:
+            image_jobs.append((arguments, variant, reason))
+
+    @staticmethod
+    def _scale_images(
+            image_jobs: list[tuple[tuple, str, str]],
+            manifest: BuildManifest,
+            jobs: int,
+            stages: BuildProgress = None,
+            image_format: str = None
+    ) -> tuple[list[tuple[tuple, Exception]], dict[str, float]]:
+        """
+        Scales or optimizes the images on a pool of processes and records the ones written in the manifest.
+
+        :param image_jobs: The (job arguments, manifest variant, reason) of each image to scale.
+        :param manifest: The manifest of the build.
+        :param jobs: The amount of processes.
+        :param stages: The progress of the build, receiving an event per image scaled.
+        :param image_format: The format the images are optimized to, they are only scaled when None.
+        :return: The job arguments and the error of each image that could not be written,
+            and the summed ImageStats of the optimized images.
+        """
+
+        def on_result(index: int, error: Exception | None):
+            arguments, variant, _ = image_jobs[index]
+            stages.emit(
+                'images',
+                'progress',
+                f"{arguments[0]} {variant}" + (f" failed: {error}" if error else ''),
+                index + 1,
+                len(image_jobs)
+            )
+
+        results = run_jobs(
+            optimize_image if image_format else prescale_image,
+            [arguments for arguments, _, _ in image_jobs],
+            jobs,
+            on_result if stages is not None else None
+        )
+        failures = []
+        stats = dict.fromkeys(ImageStats._fields, 0)
+        stats['images'] = 0
+        for (arguments, variant, reason), (image_stats, error) in zip(image_jobs, results):
+            if error is None:
+                manifest.record_derived(arguments[0], arguments[1], variant, reason)
+                print('Scaling file: ', arguments[0], variant)
+                if image_stats is not None:
+                    stats['images'] += 1
+                    for name, value in image_stats._asdict().items():
+                        stats[name] += value
+            else:
+                failures.append((arguments, error))
+        return failures, stats
+
+
+def describe_image_stats(stats: dict[str, float]) -> str:
+    """
+    Describes what the optimization of the images saved for the build output.
+
+    :param stats: The amount of images optimized and their summed ImageStats.
+    :return: A human-readable summary.
+    """
+    saved_bytes = stats['source_bytes'] - stats['output_bytes']
+    saved_decode = stats['source_decode'] - stats['output_decode']
+    return (
+        f"Image optimization: {stats['images']} images, "
+        f"{stats['source_bytes'] / 1024:.0f} KiB -> {stats['output_bytes'] / 1024:.0f} KiB "
+        f"({saved_bytes / 1024:.0f} KiB saved), "
+        f"decoding {stats['source_decode'] * 1000:.1f} ms -> {stats['output_decode'] * 1000:.1f} ms "
+        f"({saved_decode * 1000:.1f} ms saved)"
+    )
+
+
+def parse_build_arguments(args: list[str] = None) -> dict:
+    """
+    Parses the options the CLI forwards to the build.py script of the project.
+
+    :param args: The command line arguments, sys.argv is used when not given.
+    :return: A dictionary with the keyword arguments for GameBuilder.build.
+    """
+    parser = argparse.ArgumentParser(description="Builds the game assets.")
+    parser.add_argument("--resolutions", nargs="+", type=parse_resolution, help="List of resolutions, e.g. 800x600")
+    parser.add_argument(
+        "--translation-memory",
+        default=DEFAULT_TRANSLATION_MEMORY,
+        help="Path of the database keeping the translations between builds"
+    )
+    parser.add_argument(
+        "--translation-backend",
+        choices=list(TRANSLATION_BACKENDS),
+        default=GoogleTranslationBackend.name,
+        help="Service translating the texts, 'dictionary' keeps them untranslated without network access"
+    )
+    parser.add_argument(
+        "--translation-workers",
+        type=int,
+        default=DEFAULT_TRANSLATION_WORKERS,
+        help="Amount of translation batches sent at the same time"
+    )
+    parser.add_argument(
+        "--translation-rate",
+        type=float,
+        default=DEFAULT_TRANSLATION_RATE,
+        help="Maximum amount of translation batches sent per second, 0 disables the limit"
+    )
+    parser.add_argument(
+        "--translation-retries",
+        type=int,
+        default=DEFAULT_TRANSLATION_RETRIES,
+        help="How many times a failed translation batch is sent again"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the build plan and the translation jobs it needs without building"
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild every file, ignoring the build manifest")
+    parser.add_argument(
+        "--optimize-images",
+        nargs="?",
+        const=DEFAULT_IMAGE_FORMAT,
+        choices=IMAGE_FORMATS,
+        help="Scale the images down to the game resolution and re-encode them without metadata, "
+             "'bmp' decodes fastest, 'png' is compressed"
+    )
+    parser.add_argument(
+        "--asset-store",
+        action="store_true",
+        help="Ship the resources in a content-addressed store, identical files are stored once"
+    )
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        help="Languages to translate and bundle, all the languages of the configuration by default"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_BUILD_JOBS,
+        help="Amount of processes scaling the images"
+    )
+    options, _ = parser.parse_known_args(args)
+    return {
+        'resolutions': options.resolutions,
+        'translation_memory': options.translation_memory,
+        'translation_backend': TRANSLATION_BACKENDS[options.translation_backend](),
+        'translation_executor': TranslationExecutor(
+            workers=options.translation_workers,
+            rate=options.translation_rate or None,
+            retries=options.translation_retries,
+        ),
+        'dry_run': options.dry_run,
+        'force': options.force,
+        'jobs': options.jobs,
+        'optimize_images': options.optimize_images,
+        'asset_store': options.asset_store,
+        'languages': options.languages,
+    }
@@ -1,8 +1,15 @@
 """
 This module contains the Configuration class for the game engine.
-It includes properties for game title, resource folder, language, languages, and build.
+It includes properties for game title, resource folder, language, languages, build, resolution, the surface, text and
+composite cache sizes, frame pacing, asset prefetching, lazy scene loading and the backlog size.
 """
 
+from engine.game_objects.backlog import DEFAULT_BACKLOG_SIZE
+from engine.game_ui.asset_prefetcher import DEFAULT_PREFETCH_DEPTH
+from engine.game_ui.constants.window_constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from engine.game_ui.font_manager import DEFAULT_TEXT_CACHE_SIZE
+from engine.game_ui.frame_scheduler import DEFAULT_FPS, DEFAULT_IDLE_TIMEOUT
+from engine.game_ui.surface_cache import DEFAULT_SURFACE_CACHE_SIZE, DEFAULT_COMPOSITE_CACHE_SIZE
 from engine.utils.files import resource_path
 
 
@@ -15,6 +22,16 @@ class Configuration:
     language: str
     languages: list[str]
     build: bool
+    resolution: tuple[int, int]
+    surface_cache_size: int
+    text_cache_size: int
+    composite_cache_size: int
+    fps: int
+    idle_wait: bool
+    idle_timeout: int
+    prefetch_depth: int
+    lazy_scenes: bool
+    backlog_size: int
 
     def __init__(
             self,
@@ -23,6 +40,16 @@ class Configuration:
             language: str = 'pt',
             languages: list[str] = None,
             build: bool = False,
+            resolution: tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+            surface_cache_size: int = DEFAULT_SURFACE_CACHE_SIZE,
+            text_cache_size: int = DEFAULT_TEXT_CACHE_SIZE,
+            composite_cache_size: int = DEFAULT_COMPOSITE_CACHE_SIZE,
+            fps: int = DEFAULT_FPS,
+            idle_wait: bool = True,
+            idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+            prefetch_depth: int = DEFAULT_PREFETCH_DEPTH,
+            lazy_scenes: bool = True,
+            backlog_size: int = DEFAULT_BACKLOG_SIZE,
     ):
         """
         Initializes the Configuration instance.
@@ -32,12 +59,32 @@ class Configuration:
         :param language: The language of the game.
         :param languages: The languages available for the game.
         :param build: A flag indicating whether the game is in build mode.
+        :param resolution: The width and height of the game window, it selects the pre-scaled assets to be used.
+        :param surface_cache_size: The byte budget of the cache holding the loaded images.
+        :param text_cache_size: The byte budget of the cache holding the rendered text lines.
+        :param composite_cache_size: The byte budget of the cache holding the baked frame of each action.
+        :param fps: The maximum amount of frames per second drawn by the game loops.
+        :param idle_wait: A flag indicating whether the game loops sleep until an event arrives when nothing moves.
+        :param idle_timeout: The maximum time in milliseconds the game loops sleep waiting for an event.
+        :param prefetch_depth: How many scene jumps ahead the images are loaded in background, 0 disables it.
+        :param lazy_scenes: A flag indicating whether the built scenes are parsed on first access instead of startup.
+        :param backlog_size: The maximum amount of past actions kept for the backlog, across scenes.
         """
         self._resource_folder = resource_folder
         self.language = language
         self.languages = languages or [language]
         self.game_title = game_title
         self.build = build
+        self.resolution = tuple(resolution)
+        self.surface_cache_size = surface_cache_size
+        self.text_cache_size = text_cache_size
+        self.composite_cache_size = composite_cache_size
+        self.fps = fps
+        self.idle_wait = idle_wait
+        self.idle_timeout = idle_timeout
+        self.prefetch_depth = prefetch_depth
+        self.lazy_scenes = lazy_scenes
+        self.backlog_size = backlog_size
 
     @property
     def resource_folder(self):
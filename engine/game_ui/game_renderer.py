@@ -2,83 +2,125 @@ import os
 
 import pygame
 
-from engine.game_ui.constants.text_constants import font, RED, GRAY
-from engine.game_ui.constants.window_constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from engine.game_ui.constants.text_constants import RED, GRAY, WHITE
+from engine.game_ui.font_manager import FontManager
+from engine.game_ui.surface_cache import SurfaceCache, DEFAULT_COMPOSITE_CACHE_SIZE
+from engine.utils.asset_store import AssetIndex
+from engine.utils.resolutions import fit_size
 
 
 class RendererBase:
     screen: pygame.Surface
     resource_path: str
+    surface_cache: SurfaceCache
+    assets: AssetIndex
 
-    def __init__(self, screen: pygame.Surface, resource_path: str = 'resources'):
+    def __init__(
+            self,
+            screen: pygame.Surface,
+            resource_path: str = 'resources',
+            surface_cache: SurfaceCache = None,
+            assets: AssetIndex = None
+    ):
         self.screen = screen
         self.resource_path = resource_path
+        self.surface_cache = surface_cache if surface_cache is not None else SurfaceCache()
+        self.assets = assets if assets is not None else AssetIndex(resource_path)
 
     def render(self, *args, **kwargs):
         raise NotImplementedError
 
-    def _scalling_factor(self, image: pygame.Surface) -> float:
-        return min(SCREEN_WIDTH / image.get_width(), SCREEN_HEIGHT / image.get_height())
+    def preload(self, image_path: str, alpha: bool = False) -> bool:
+        """
+        Loads an image into the surface cache ahead of its first render.
+
+        :param image_path: The path of the image relative to the resource folder.
+        :param alpha: A flag indicating whether the image keeps its alpha channel.
+        :return: True if the image was loaded, False if it was already cached.
+        """
+        key = self._image_key(image_path, alpha)
+        if key in self.surface_cache:
+            return False
+        self.surface_cache.put(key, self._load_scaled_image(image_path, alpha), prefetched=True)
+        return True
+
+    def _image_key(self, image_path: str, alpha: bool = False) -> tuple:
+        # Images with the same content are stored once by the build, so they share one cached surface too.
+        return self.assets.resolve(os.path.join(self.resource_path, image_path)), self.screen.get_size(), alpha
+
+    def _load_image(self, image_path: str, alpha: bool = False) -> pygame.Surface:
+        # The disk is only touched on a cache miss, the frame loop reuses the converted and scaled surface.
+        return self.surface_cache.get(
+            self._image_key(image_path, alpha),
+            lambda: self._load_scaled_image(image_path, alpha)
+        )
+
+    def _load_scaled_image(self, image_path: str, alpha: bool = False) -> pygame.Surface:
+        image = pygame.image.load(self.assets.resolve(os.path.join(self.resource_path, image_path)))
+        image = image.convert_alpha() if alpha else image.convert()
+        size = fit_size(image.get_size(), self.screen.get_size())
+        if size == image.get_size():
+            # Assets pre-scaled by the build for this resolution are used as they are.
+            return image
+        return pygame.transform.scale(image, size)
 
     @property
     def _hud_height(self) -> float:
-        return SCREEN_HEIGHT // 3
+        return self.screen.get_height() // 3
 
 
 class ForegroundRenderer(RendererBase):
 
     def render(self, character_image: str, *args, **kwargs):
-        image = pygame.image.load(os.path.join(self.resource_path, character_image)).convert_alpha()
-
-        image = pygame.transform.scale(
-            image,
-            (
-                int(image.get_width() * self._scalling_factor(image)),
-                int(image.get_height() * self._scalling_factor(image))
-            )
-        )
-        foreground_x = (SCREEN_WIDTH - image.get_width()) // 2
-        foreground_y = (SCREEN_HEIGHT - image.get_height()) // 2
+        image = self._load_image(character_image, alpha=True)
+        foreground_x = (self.screen.get_width() - image.get_width()) // 2
+        foreground_y = (self.screen.get_height() - image.get_height()) // 2
         self.screen.blit(image, (foreground_x, foreground_y))
 
 
 class BackgroundRenderer(RendererBase):
     def render(self, background: str, *args, **kwargs):
-        image = pygame.image.load(os.path.join(self.resource_path, background)).convert()
-        image = pygame.transform.scale(
-            image,
-            (
-                int(image.get_width() * self._scalling_factor(image)),
-                int(image.get_height() * self._scalling_factor(image))
-            )
-        )
+        image = self._load_image(background)
         self.screen.blit(image, (0, 0))
 
 
 class HUDRenderer(RendererBase):
+    font_manager: FontManager
 
-    def __init__(self, screen: pygame.Surface, resource_path: str = 'resources'):
-        super().__init__(screen, resource_path)
-        self.font = pygame.font.Font(*font)
+    def __init__(
+            self,
+            screen: pygame.Surface,
+            resource_path: str = 'resources',
+            surface_cache: SurfaceCache = None,
+            font_manager: FontManager = None,
+            assets: AssetIndex = None
+    ):
+        super().__init__(screen, resource_path, surface_cache, assets)
+        self.font_manager = font_manager if font_manager is not None else FontManager()
 
     def _draw_hud(self):
-        hud_rect = pygame.Rect(0, SCREEN_HEIGHT - self._hud_height, SCREEN_WIDTH, self._hud_height)
+        screen_width, screen_height = self.screen.get_size()
+        hud_rect = pygame.Rect(0, screen_height - self._hud_height, screen_width, self._hud_height)
         pygame.draw.rect(self.screen, (0, 0, 0), hud_rect)
 
     def _draw_text(self, character_name: str, text: str, *args, **kwargs):
-        name_surface = self.font.render(f"{character_name}:", True, (255, 255, 255))
-        name_rect = name_surface.get_rect(left=20, bottom=SCREEN_HEIGHT - (self._hud_height // 2))
+        name_surface = self.font_manager.render(f"{character_name}:", WHITE)
+        name_rect = name_surface.get_rect(left=20, bottom=self.screen.get_height() - (self._hud_height // 2))
         self.screen.blit(name_surface, name_rect)
-        text_surface = self.font.render(text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(left=20, bottom=SCREEN_HEIGHT - (self._hud_height // 4))
+        text_surface = self.font_manager.render(text, WHITE)
+        text_rect = text_surface.get_rect(left=20, bottom=self.screen.get_height() - (self._hud_height // 4))
         self.screen.blit(text_surface, text_rect)
 
     def _render_menu_items(self, menu_items: list[tuple[str, str]], selected_item: int):
         for i, item in enumerate(menu_items):
             color = GRAY if i == selected_item else RED
-            text_surface = self.font.render(item[1], True, color)
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 200 + i * 25))
-            self.screen.blit(text_surface, text_rect)
+            text_surface = self.font_manager.render(item[1], color)
+            self.screen.blit(text_surface, self.menu_item_rect(menu_items, i))
+
+    def menu_item_rect(self, menu_items: list[tuple[str, str]], index: int) -> pygame.Rect:
+        text_rect = pygame.Rect((0, 0), self.font_manager.size(menu_items[index][1]))
+        text_rect.center = (self.screen.get_width() // 2, 200 + index * 25)
+        return text_rect
 
     def render(
             self,
@@ -91,19 +133,31 @@ class HUDRenderer(RendererBase):
         self._draw_hud()
         self._draw_text(character_name, text, *args, **kwargs)
         if choices:
-            self._render_menu_items(menu_items=choices, selected_item=selected_item)
+            self.render_choices(choices, selected_item)
+
+    def render_choices(self, choices: list[tuple[str, str]], selected_item: int = 0):
+        self._render_menu_items(menu_items=choices, selected_item=selected_item)
 
 
 class MenuRenderer(RendererBase):
-    def __init__(self, screen: pygame.Surface, resource_path: str = 'resources'):
-        super().__init__(screen, resource_path)
-        self.font = pygame.font.Font(*font)
+    font_manager: FontManager
+
+    def __init__(
+            self,
+            screen: pygame.Surface,
+            resource_path: str = 'resources',
+            surface_cache: SurfaceCache = None,
+            font_manager: FontManager = None,
+            assets: AssetIndex = None
+    ):
+        super().__init__(screen, resource_path, surface_cache, assets)
+        self.font_manager = font_manager if font_manager is not None else FontManager()
 
     def _render_menu_items(self, menu_items: list[str], selected_item: int):
         for i, item in enumerate(menu_items):
             color = GRAY if i == selected_item else RED
-            text_surface = self.font.render(item, True, color)
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 200 + i * 35))
+            text_surface = self.font_manager.render(item, color)
+            text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, 200 + i * 35))
             self.screen.blit(text_surface, text_rect)
 
     def render(self, selected_item: int, menu_items: list[str], *args, **kwargs):
@@ -114,17 +168,43 @@ class MenuRenderer(RendererBase):
 class GameSceneRenderer:
     background_renderer: RendererBase
     foreground_renderer: RendererBase
-    hud_renderer: RendererBase
+    hud_renderer: HUDRenderer
+    composite_cache: SurfaceCache
 
     def __init__(
             self,
             background_renderer: RendererBase,
             foreground_renderer: RendererBase,
-            hud_renderer: RendererBase
+            hud_renderer: HUDRenderer,
+            composite_cache: SurfaceCache = None
     ):
         self.background_renderer = background_renderer
         self.foreground_renderer = foreground_renderer
         self.hud_renderer = hud_renderer
+        if composite_cache is None:
+            composite_cache = SurfaceCache(DEFAULT_COMPOSITE_CACHE_SIZE)
+        self.composite_cache = composite_cache
+        self._last_frame = None
+        self._last_selected_item = None
+
+    @property
+    def screen(self) -> pygame.Surface:
+        return self.background_renderer.screen
+
+    def invalidate(self):
+        """
+        Forces the next call to render to repaint and present the whole screen.
+        """
+        self._last_frame = None
+        self._last_selected_item = None
+
+    def clear_composites(self):
+        """
+        Drops every baked action layer, they are baked again on their next render.
+        It must be called when the texts change, for example after switching the language.
+        """
+        self.composite_cache.clear()
+        self.invalidate()
 
     def render(
             self,
@@ -132,9 +212,62 @@ class GameSceneRenderer:
             character_name: str,
             character_image: str,
             text: str,
-            choices: dict = None,
+            choices: list[tuple[str, str]] = None,
+            selected_item: int = 0,
             *args, **kwargs
-    ):
-        self.background_renderer.render(background)
-        self.foreground_renderer.render(character_image)
-        self.hud_renderer.render(character_name, text, choices, *args, **kwargs)
+    ) -> list[pygame.Rect]:
+        """
+        Renders the scene and presents it on the display, skipping everything that did not change since the last call.
+
+        :return: The list of rectangles pushed to the display, empty when the frame was skipped.
+        """
+        frame = (background, character_name, character_image, text, choices, self.screen.get_size())
+        if frame != self._last_frame:
+            dirty_rects = [self.screen.get_rect()]
+        elif choices and selected_item != self._last_selected_item:
+            # Only the highlight moved, repaint the old and the new choice and push just those rectangles.
+            dirty_rects = [
+                self.hud_renderer.menu_item_rect(choices, index)
+                for index in (self._last_selected_item, selected_item)
+            ]
+        else:
+            return []
+
+        composite = self._composite(background, character_name, character_image, text)
+        for dirty_rect in dirty_rects:
+            self.screen.blit(composite, dirty_rect, dirty_rect)
+            if choices:
+                self.screen.set_clip(dirty_rect)
+                self.hud_renderer.render_choices(choices, selected_item)
+        self.screen.set_clip(None)
+
+        if frame != self._last_frame:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        self._last_frame = frame
+        self._last_selected_item = selected_item
+        return dirty_rects
+
+    def _composite(self, background: str, character_name: str, character_image: str, text: str) -> pygame.Surface:
+        # Everything but the choices is fixed for an action, so it is baked once into a single surface.
+        key = (background, character_name, character_image, text, self.screen.get_size())
+        return self.composite_cache.get(
+            key,
+            lambda: self._bake(background, character_name, character_image, text)
+        )
+
+    def _bake(self, background: str, character_name: str, character_image: str, text: str) -> pygame.Surface:
+        screen = self.screen
+        composite = pygame.Surface(screen.get_size(), 0, screen)
+        renderers = (self.background_renderer, self.foreground_renderer, self.hud_renderer)
+        for renderer in renderers:
+            renderer.screen = composite
+        try:
+            self.background_renderer.render(background)
+            self.foreground_renderer.render(character_image)
+            self.hud_renderer.render(character_name, text)
+        finally:
+            for renderer in renderers:
+                renderer.screen = screen
+        return composite
@@ -5,43 +5,70 @@ It includes methods for playing a scene, rendering actions, handling user inputs
 
 import pygame
 
+from engine.game_objects.backlog import Backlog
 from engine.game_objects.scene import Scene
+from engine.game_ui.frame_scheduler import FrameScheduler
 from engine.game_ui.game_renderer import GameSceneRenderer
 
+# Events after which the window content has to be repainted from scratch.
+REDRAW_EVENTS = {pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED}
 
-def play_scene(scene: Scene, renderer: GameSceneRenderer) -> (str, str):
+
+def play_scene(
+        scene: Scene,
+        renderer: GameSceneRenderer,
+        scheduler: FrameScheduler = None,
+        backlog: Backlog = None
+) -> (str, str):
     """
     Plays a scene in the game.
 
     :param scene: The scene to be played.
     :param renderer: The renderer for the game scene.
+    :param scheduler: The scheduler pacing the frames, a default one is created when it is not given.
+    :param backlog: The backlog recording the actions shown, if any.
     :return: A tuple containing the next scene and the next game state.
     """
+    if scheduler is None:
+        scheduler = FrameScheduler()
+    # The screen was used by other loops in between, so the first frame is always a full repaint.
+    renderer.invalidate()
     action = scene.execute_next_action()
     while action:
+        if backlog is not None:
+            backlog.record(scene.name, scene.action - 1)
         rendered_action = action.render()
         choices = rendered_action.get('choices')
         go_to = rendered_action.get('go_to')
         selected_item = 0
         running = True
+        dirty = True
         while running:
-            renderer.render(
-                background=scene.background,
-                selected_item=selected_item,
-                **action.render()
-            )
+            # The payload is cached by the action, a frame where nothing changed does not touch the renderer at all.
+            if dirty:
+                renderer.render(
+                    background=scene.background,
+                    selected_item=selected_item,
+                    **rendered_action
+                )
+                dirty = False
 
-            for event in pygame.event.get():
+            for event in scheduler.events():
                 if event.type == pygame.QUIT:
                     return None, "quit"
+                elif event.type in REDRAW_EVENTS:
+                    renderer.invalidate()
+                    dirty = True
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         return None, "menu"
                     elif choices:
                         if event.key == pygame.K_UP:
                             selected_item = (selected_item - 1) % len(choices)
+                            dirty = True
                         elif choices and event.key == pygame.K_DOWN:
                             selected_item = (selected_item + 1) % len(choices)
+                            dirty = True
                         elif choices and event.key == pygame.K_RETURN:
                             return choices[selected_item][0], 'gameplay' if choices[selected_item][0] else 'game_over'
                     elif go_to:
@@ -49,7 +76,5 @@ def play_scene(scene: Scene, renderer: GameSceneRenderer) -> (str, str):
                     else:
                         running = False
 
-            pygame.display.flip()
-
         action = scene.execute_next_action()
     return None, 'game_over'
@@ -0,0 +1,141 @@
+"""
+This module contains the SurfaceCache class for the game engine.
+It includes a least recently used (LRU) cache for converted and pre-scaled surfaces, bounded by a byte budget.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+# 64 MiB is enough to keep a few full screen backgrounds and every character state of a scene.
+DEFAULT_SURFACE_CACHE_SIZE = 64 * 1024 * 1024
+# A baked action frame takes a full screen, 32 MiB keeps the last sixteen actions at 800x600.
+DEFAULT_COMPOSITE_CACHE_SIZE = 32 * 1024 * 1024
+
+
+class SurfaceCache:
+    """
+    SurfaceCache class. It keeps surfaces in memory and evicts the least recently used ones
+    once the byte budget is exceeded. It is safe to fill it from a worker thread.
+
+    :param max_bytes: The maximum amount of bytes kept in the cache.
+    """
+    max_bytes: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    prefetch_hits: int
+    prefetch_misses: int
+
+    def __init__(self, max_bytes: int = DEFAULT_SURFACE_CACHE_SIZE):
+        """
+        Initializes the SurfaceCache instance.
+
+        :param max_bytes: The maximum amount of bytes kept in the cache.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self._prefetched: set[Hashable] = set()
+        self._lock = threading.RLock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Returns the surface stored for the key, creating it with the factory on a miss.
+
+        :param key: The key of the surface.
+        :param factory: A callable that creates the surface when it is not cached.
+        :return: The cached surface.
+        """
+        with self._lock:
+            surface = self._entries.get(key)
+            if surface is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if key in self._prefetched:
+                    self._prefetched.discard(key)
+                    self.prefetch_hits += 1
+                return surface
+            self.misses += 1
+        # The factory runs outside the lock, so a worker decoding an image never blocks the frame loop.
+        surface = factory()
+        self.put(key, surface)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface, prefetched: bool = False):
+        """
+        Stores a surface in the cache, evicting the least recently used entries if needed.
+        Surfaces bigger than the whole budget are not stored.
+
+        :param key: The key of the surface.
+        :param surface: The surface to be stored.
+        :param prefetched: A flag indicating whether the surface was loaded ahead of time by a prefetcher.
+        """
+        surface_size = self.surface_size(surface)
+        if surface_size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= self.surface_size(self._entries.pop(key))
+            self._entries[key] = surface
+            self.size += surface_size
+            if prefetched:
+                self._prefetched.add(key)
+            while self.size > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self.size -= self.surface_size(evicted)
+                self.evictions += 1
+                if evicted_key in self._prefetched:
+                    # It was prefetched but evicted before anyone drew it.
+                    self._prefetched.discard(evicted_key)
+                    self.prefetch_misses += 1
+
+    def clear(self):
+        """
+        Removes every surface from the cache. The counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._prefetched.clear()
+            self.size = 0
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        :return: A dictionary with the hits, misses, evictions, prefetch hits and misses, entries and bytes used.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'prefetch_hits': self.prefetch_hits,
+            'prefetch_misses': self.prefetch_misses,
+            'entries': len(self._entries),
+            'bytes': self.size,
+        }
+
+    @staticmethod
+    def surface_size(surface: pygame.Surface) -> int:
+        """
+        Returns the amount of bytes used by the pixels of a surface.
+
+        :param surface: The surface to be measured.
+        :return: The size of the surface in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
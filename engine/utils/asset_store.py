@@ -0,0 +1,79 @@
+"""
+This module contains the AssetIndex class for the game engine.
+It includes the index the game uses to find the stored file of each resource in the content-addressed store the build
+output keeps its resources in, where identical files are stored once under the hash of their content.
+The store itself is written by the build, see engine.utils.asset_store_builder.
+"""
+
+import json
+import os
+
+ASSET_INDEX = 'asset_index.json'
+ASSET_OBJECTS = 'objects'
+ASSET_INDEX_VERSION = 1
+
+
+def relative_path(path: str, root: str) -> str:
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+
+class AssetIndex:
+    """
+    AssetIndex class. It maps the paths of the resources to the files of the content-addressed store.
+    A resource folder without an index maps every path to itself, so the game runs the same from a project folder.
+
+    :param root: The resource folder the index belongs to.
+    :param files: A dictionary mapping each resource path, relative to the root, to its stored file.
+    """
+    root: str
+    files: dict[str, str]
+
+    def __init__(self, root: str, files: dict[str, str] = None):
+        """
+        Initializes the AssetIndex instance.
+
+        :param root: The resource folder the index belongs to.
+        :param files: A dictionary mapping each resource path, relative to the root, to its stored file.
+        """
+        self.root = root
+        self.files = files or {}
+
+    @classmethod
+    def open(cls, root: str) -> 'AssetIndex':
+        """
+        Reads the index of a resource folder.
+
+        :param root: The resource folder.
+        :return: An AssetIndex instance, empty when the folder has no index.
+        """
+        try:
+            with open(os.path.join(root, ASSET_INDEX), 'r', encoding='utf-8') as index_file:
+                content = json.load(index_file)
+        except (OSError, ValueError):
+            return cls(root)
+        if content.get('version') != ASSET_INDEX_VERSION:
+            return cls(root)
+        return cls(root, content['files'])
+
+    def resolve(self, path: str) -> str:
+        """
+        Returns the file holding a resource.
+        Identical resources resolve to the same file, which also makes them share one cached surface in the game.
+
+        :param path: The path of the resource, inside the root.
+        :return: The path of the stored file, or the path itself when it is not in the index.
+        """
+        if not self.files:
+            return path
+        stored = self.files.get(relative_path(path, self.root))
+        if stored is None:
+            return path
+        return os.path.join(self.root, stored)
+
+    def folders(self) -> list[str]:
+        """
+        Lists the folders at the top of the resource paths, e.g. the pre-scaled resolution folders.
+
+        :return: A sorted list of folder names.
+        """
+        return sorted({path.split('/', 1)[0] for path in self.files if '/' in path})
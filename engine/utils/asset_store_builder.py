@@ -0,0 +1,122 @@
+"""
+This module contains the AssetStore class for the game engine.
+It includes the build side of the content-addressed store the build output keeps its resources in: it stores the
+built resources once per distinct content and writes the AssetIndex the game reads.
+"""
+
+import json
+import os
+
+from engine.utils.asset_store import ASSET_INDEX, ASSET_INDEX_VERSION, ASSET_OBJECTS, AssetIndex, relative_path
+from engine.utils.build_manifest import file_hash, file_stat, link_or_copy
+
+DEFAULT_ASSET_STAGING = '.asset_staging'
+
+
+class AssetStore:
+    """
+    AssetStore class. It fills the content-addressed store of a resource folder from a staging folder laid out as the
+    game resources, and writes the index of the store.
+
+    :param root: The resource folder of the build output.
+    """
+    root: str
+    stored: int
+    added: int
+    removed: int
+    saved_bytes: int
+
+    def __init__(self, root: str):
+        """
+        Initializes the AssetStore instance.
+
+        :param root: The resource folder of the build output.
+        """
+        self.root = root
+        self.stored = 0
+        self.added = 0
+        self.removed = 0
+        self.saved_bytes = 0
+
+    def _read_index(self) -> dict:
+        try:
+            with open(os.path.join(self.root, ASSET_INDEX), 'r', encoding='utf-8') as index_file:
+                content = json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+        if content.get('version') != ASSET_INDEX_VERSION:
+            return {}
+        return content
+
+    def sync(self, staging: str) -> AssetIndex:
+        """
+        Stores every file of the staging folder once per distinct content and writes the index.
+        The files are only hashed when their size or modification time changed since the last sync,
+        and the stored files no resource refers to anymore are removed.
+
+        :param staging: The folder holding the resources laid out as the game expects them.
+        :return: The index written.
+        """
+        previous = self._read_index()
+        previous_files = previous.get('files', {})
+        previous_stats = previous.get('stats', {})
+        files = {}
+        stats = {}
+        seen = set()
+        for folder, _, names in sorted(os.walk(staging)):
+            for name in sorted(names):
+                source = os.path.join(folder, name)
+                path = relative_path(source, staging)
+                stat = file_stat(source)
+                stored = previous_files.get(path)
+                if stored is None or previous_stats.get(path) != stat \
+                        or not os.path.isfile(os.path.join(self.root, stored)):
+                    content_hash = file_hash(source)
+                    stored = f"{ASSET_OBJECTS}/{content_hash[:2]}/{content_hash}{os.path.splitext(name)[1].lower()}"
+                if stored in seen:
+                    self.saved_bytes += stat[0]
+                elif not os.path.isfile(os.path.join(self.root, stored)):
+                    link_or_copy(source, os.path.join(self.root, stored))
+                    self.added += 1
+                seen.add(stored)
+                files[path] = stored
+                stats[path] = stat
+        self._remove_unreferenced(seen)
+        self.stored = len(seen)
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, ASSET_INDEX), 'w', encoding='utf-8') as index_file:
+            # The stats of the staged files only let the next sync skip hashing them, the game reads the files.
+            json.dump({'version': ASSET_INDEX_VERSION, 'files': files, 'stats': stats}, index_file, indent=1)
+        return AssetIndex(self.root, files)
+
+    def clear(self):
+        """
+        Removes the store and its index, when the build output goes back to plain resource folders.
+        """
+        self._remove_unreferenced(set())
+        if os.path.isfile(os.path.join(self.root, ASSET_INDEX)):
+            os.remove(os.path.join(self.root, ASSET_INDEX))
+
+    def _remove_unreferenced(self, referenced: set[str]):
+        objects = os.path.join(self.root, ASSET_OBJECTS)
+        for folder, _, names in os.walk(objects, topdown=False):
+            for name in names:
+                stored = relative_path(os.path.join(folder, name), self.root)
+                if stored not in referenced:
+                    os.remove(os.path.join(folder, name))
+                    self.removed += 1
+            if folder != objects and not os.listdir(folder):
+                os.rmdir(folder)
+        if os.path.isdir(objects) and not os.listdir(objects):
+            os.rmdir(objects)
+
+    def summary(self) -> str:
+        """
+        Describes the store for the build output.
+
+        :return: A human-readable summary.
+        """
+        return (
+            f"Asset store: {self.stored} stored files, {self.added} added, {self.removed} removed, "
+            f"{self.saved_bytes / 1024:.0f} KiB of duplicates not stored"
+        )
@@ -0,0 +1,61 @@
+"""
+This module contains the parallel execution of the build jobs for the game engine.
+It includes the function running independent jobs on a pool of processes and the error merging their failures.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+DEFAULT_BUILD_JOBS = 1
+
+
+class BuildJobError(Exception):
+    """
+    BuildJobError class. It is raised once every job ran, listing all the jobs that failed.
+
+    :param failures: The arguments of each failed job and its error.
+    """
+
+    def __init__(self, failures: list[tuple[tuple, Exception]]):
+        self.failures = failures
+        details = '\n'.join(f"  {', '.join(map(str, job))}: {error}" for job, error in failures)
+        super().__init__(f"{len(failures)} build jobs failed:\n{details}")
+
+
+def run_jobs(
+        function: Callable,
+        jobs: list[tuple],
+        workers: int = DEFAULT_BUILD_JOBS,
+        on_result: Callable[[int, Exception | None], None] = None
+) -> list[tuple[object, Exception | None]]:
+    """
+    Runs a function once per job. With more than one worker the jobs run on a pool of processes,
+    so the function, its arguments and its return value must be importable and picklable.
+    A failing job does not stop the others.
+
+    :param function: The function to be run.
+    :param jobs: The positional arguments of each call.
+    :param workers: The amount of processes, 1 runs the jobs in the current process.
+    :param on_result: The callable receiving the index and the error of each job, in the order of the jobs.
+    :return: The (return value, error) of each job in the order of the jobs, the error is None for the ones that
+        succeeded and the value is None for the ones that failed.
+    """
+    results: list[tuple[object, Exception | None]] = []
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                results.append((function(*job), None))
+            except Exception as error:  # noqa
+                results.append((None, error))
+            if on_result is not None:
+                on_result(len(results) - 1, results[-1][1])
+        return results
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = [pool.submit(function, *job) for job in jobs]
+        # The results are read in the order of the jobs, not of completion, so the build output is deterministic.
+        for future in futures:
+            error = future.exception()
+            results.append((future.result() if error is None else None, error))
+            if on_result is not None:
+                on_result(len(results) - 1, error)
+    return results
@@ -0,0 +1,287 @@
+"""
+This module contains the BuildManifest class for the game engine.
+It includes the record of the files written by a build, with the content hashes of their inputs and outputs, so the
+next build skips what did not change and reports what was rebuilt and why.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+DEFAULT_BUILD_MANIFEST = '.build_manifest.json'
+BUILD_MANIFEST_VERSION = 1
+
+
+def file_hash(path: str) -> str:
+    """
+    Returns the content hash of a file.
+
+    :param path: The path of the file.
+    :return: The hexadecimal SHA-256 digest of the file.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_stat(path: str) -> list[int] | None:
+    """
+    Returns the size and modification time of a file, the cheap check done before hashing it.
+
+    :param path: The path of the file.
+    :return: A list with the size and the modification time in nanoseconds, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+@contextmanager
+def replace_file(destination: str) -> Iterator[BinaryIO]:
+    """
+    Opens a temporary file next to an output file, which replaces the output file once written.
+    The output file may be a hardlink to a source file, writing into it would change the source file too.
+
+    :param destination: The path of the output file.
+    :return: The temporary file, opened for writing bytes.
+    """
+    folder = os.path.dirname(destination) or '.'
+    os.makedirs(folder, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=folder)
+    try:
+        with os.fdopen(descriptor, 'wb') as output_file:
+            yield output_file
+        # The temporary file is only readable by its owner, the output gets the mode open() would give it.
+        os.chmod(temporary, 0o666 & ~_umask())
+        os.replace(temporary, destination)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+def link_or_copy(source: str, destination: str):
+    """
+    Places a file in the output, hardlinking it when the file system allows it and copying it otherwise.
+
+    :param source: The path of the source file.
+    :param destination: The path of the output file.
+    """
+    os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+    if os.path.lexists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+class BuildManifest:
+    """
+    BuildManifest class. It keeps, for every file written by the build, the hash of what it was made from and the
+    size and modification time it was left with. A file is only written again when its input changed or the output
+    was modified or removed since the last build.
+
+    :param path: The path of the manifest file.
+    :param force: A flag indicating whether the previous manifest is ignored and everything is rebuilt.
+    """
+    path: str
+    rebuilt: list[tuple[str, str]]
+    skipped: list[str]
+    removed: list[str]
+
+    def __init__(self, path: str = DEFAULT_BUILD_MANIFEST, force: bool = False):
+        """
+        Initializes the BuildManifest instance.
+
+        :param path: The path of the manifest file.
+        :param force: A flag indicating whether the previous manifest is ignored and everything is rebuilt.
+        """
+        self.path = path
+        self._previous: dict[str, dict] = {} if force else self._read(path)
+        self._sources: dict[str, dict] = {
+            entry['source']: entry for entry in self._previous.values() if 'source' in entry
+        }
+        self._entries: dict[str, dict] = {}
+        self._hashes: dict[str, str] = {}
+        self._previous_items: dict[str, dict[str, str]] = {} if force else self._read(path, 'items')
+        self._items: dict[str, dict[str, str]] = {}
+        self.rebuilt = []
+        self.skipped = []
+        self.removed = []
+        self.changes: dict[str, list[tuple[str, str]]] = {}
+
+    @staticmethod
+    def _read(path: str, section: str = 'outputs') -> dict:
+        try:
+            with open(path, 'r', encoding='utf-8') as manifest_file:
+                content = json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+        if content.get('version') != BUILD_MANIFEST_VERSION:
+            return {}
+        return content.get(section, {})
+
+    def compare(self, group: str, hashes: dict[str, str]) -> list[tuple[str, str]]:
+        """
+        Compares the content hashes of a group of build inputs, e.g. the scenes, with the ones of the last build.
+
+        :param group: The name of the group.
+        :param hashes: A dictionary mapping each input name to its content hash.
+        :return: A list of (name, reason) tuples for the new, changed and removed inputs.
+        """
+        previous = self._previous_items.get(group, {})
+        changes = [
+            (name, 'new' if name not in previous else 'changed')
+            for name, content_hash in hashes.items()
+            if previous.get(name) != content_hash
+        ]
+        changes.extend((name, 'removed') for name in previous if name not in hashes)
+        self._items[group] = hashes
+        self.changes[group] = changes
+        return changes
+
+    @staticmethod
+    def content_hash(content: object) -> str:
+        """
+        Returns the content hash of data that can be dumped to JSON.
+
+        :param content: The data.
+        :return: The hexadecimal SHA-256 digest of the data.
+        """
+        return hashlib.sha256(json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def _input_hash(self, source: str) -> str:
+        # The input is only hashed when its size or modification time changed since the last build.
+        if source not in self._hashes:
+            previous = self._sources.get(source)
+            if previous is not None and previous['source_stat'] == file_stat(source):
+                self._hashes[source] = previous['source_hash']
+            else:
+                self._hashes[source] = file_hash(source)
+        return self._hashes[source]
+
+    def _check(self, destination: str, input_hash: str) -> str | None:
+        previous = self._previous.get(destination)
+        if previous is None:
+            return 'new'
+        if previous['input'] != input_hash:
+            return 'changed'
+        if file_stat(destination) != previous['output']:
+            return 'output modified'
+        return None
+
+    def _record(self, destination: str, input_hash: str, reason: str | None, source: str = None):
+        entry = {'input': input_hash, 'output': file_stat(destination)}
+        if source is not None:
+            entry['source'] = source
+            entry['source_hash'] = self._hashes[source]
+            entry['source_stat'] = file_stat(source)
+        self._entries[destination] = entry
+        if reason is None:
+            self.skipped.append(destination)
+        else:
+            self.rebuilt.append((destination, reason))
+
+    def write(self, destination: str, content: bytes | str) -> bool:
+        """
+        Writes a generated file unless the same content was written there by the last build.
+
+        :param destination: The path of the output file.
+        :param content: The content of the file, text is encoded as UTF-8.
+        :return: A flag indicating whether the file was written.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        input_hash = hashlib.sha256(content).hexdigest()
+        reason = self._check(destination, input_hash)
+        if reason is not None:
+            with replace_file(destination) as output_file:
+                output_file.write(content)
+        self._record(destination, input_hash, reason)
+        return reason is not None
+
+    def copy(self, source: str, destination: str) -> bool:
+        """
+        Places a source file in the output unless it was already placed there from the same content.
+
+        :param source: The path of the source file.
+        :param destination: The path of the output file.
+        :return: A flag indicating whether the file was placed.
+        """
+        reason = self.check_derived(source, destination, 'copy')
+        if reason is not None:
+            link_or_copy(source, destination)
+        self.record_derived(source, destination, 'copy', reason)
+        return reason is not None
+
+    def check_derived(self, source: str, destination: str, variant: str) -> str | None:
+        """
+        Checks whether an output file has to be made again from its source, without making it.
+
+        :param source: The path of the source file.
+        :param destination: The path of the output file.
+        :param variant: A description of how the output is made from the source, e.g. the target resolution.
+        :return: The reason to make the file, or None if it is up to date.
+        """
+        return self._check(destination, f"{self._input_hash(source)}:{variant}")
+
+    def record_derived(self, source: str, destination: str, variant: str, reason: str | None):
+        """
+        Records an output file made from a source file, once it exists.
+
+        :param source: The path of the source file.
+        :param destination: The path of the output file.
+        :param variant: A description of how the output is made from the source, e.g. the target resolution.
+        :param reason: The reason the file was made, or None if it was up to date.
+        """
+        self._record(destination, f"{self._input_hash(source)}:{variant}", reason, source=source)
+
+    def save(self):
+        """
+        Removes the outputs of the last build that this build did not produce, and saves the manifest.
+        """
+        for destination in self._previous.keys() - self._entries.keys():
+            if os.path.isfile(destination):
+                os.remove(destination)
+                self.removed.append(destination)
+                # An empty resolution folder left behind would still be picked by the game.
+                try:
+                    os.removedirs(os.path.dirname(destination))
+                except OSError:
+                    pass
+        with open(self.path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(
+                {'version': BUILD_MANIFEST_VERSION, 'items': self._items, 'outputs': self._entries},
+                manifest_file,
+                indent=1
+            )
+
+    def summary(self) -> str:
+        """
+        Describes what the build did for the build output.
+
+        :return: A human-readable summary with every rebuilt file and the reason.
+        """
+        lines = [
+            f"Build manifest: {len(self.rebuilt)} rebuilt, {len(self.skipped)} unchanged, {len(self.removed)} removed"
+        ]
+        for group, changes in self.changes.items():
+            if changes:
+                lines.append(f"  {group}: " + ', '.join(f"{name} ({reason})" for name, reason in changes))
+        lines.extend(f"  {reason}: {destination}" for destination, reason in self.rebuilt)
+        lines.extend(f"  removed: {destination}" for destination in self.removed)
+        return '\n'.join(lines)
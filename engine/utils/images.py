@@ -0,0 +1,125 @@
+"""
+This module contains the image helpers used when building the game.
+It includes the detection of image files, the pre-scaling of an image to a target resolution and its optimization:
+downscaled to the resolution and re-encoded without metadata in a format that is fast to decode.
+"""
+
+import os
+import time
+from typing import NamedTuple
+
+import pygame
+
+from engine.utils.build_manifest import link_or_copy, replace_file
+from engine.utils.resolutions import fit_size
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tga', '.webp')
+# The extensions pygame encodes, it writes TGA data the game cannot load for the other ones.
+ENCODED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+# 'png' compresses the images losslessly, 'bmp' stores the pixels uncompressed in the channel order of the screen.
+IMAGE_FORMATS = ('png', 'bmp')
+DEFAULT_IMAGE_FORMAT = 'png'
+# The common 32 bits screen format, A8R8G8B8, converting from it at runtime is a plain copy.
+DISPLAY_MASKS = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+
+
+class ImageStats(NamedTuple):
+    """
+    ImageStats named tuple. It represents the cost of an image before and after its optimization.
+
+    :param source_bytes: The size of the original file.
+    :param output_bytes: The size of the optimized file.
+    :param source_decode: The seconds spent decoding the original file.
+    :param output_decode: The seconds spent decoding the optimized file.
+    """
+    source_bytes: int
+    output_bytes: int
+    source_decode: float
+    output_decode: float
+
+
+def is_image(path: str) -> bool:
+    return path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def _scale(image: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+    if image.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(image, size)
+    return pygame.transform.scale(image, size)
+
+
+def prescale_image(source: str, destination: str, resolution: tuple[int, int]):
+    """
+    Scales an image to fit the resolution the same way the renderers do at runtime and saves it.
+    The images pygame cannot encode in their own format are saved as PNG under their name,
+    the image loader detects the format from the file content.
+
+    :param source: The path of the original image.
+    :param destination: The path of the scaled image.
+    :param resolution: The width and height of the target screen.
+    """
+    image = pygame.image.load(source)
+    size = fit_size(image.get_size(), resolution)
+    if size != image.get_size():
+        image = _scale(image, size)
+    name = os.path.basename(destination)
+    if not name.lower().endswith(ENCODED_EXTENSIONS):
+        name = 'image.png'
+    with replace_file(destination) as image_file:
+        pygame.image.save(image, image_file, name)
+
+
+def save_image(image: pygame.Surface, destination: str, image_format: str = DEFAULT_IMAGE_FORMAT):
+    """
+    Saves an image in a format, without the metadata of the original file.
+    The file keeps its name whatever the format, the image loader detects the format from the file content.
+
+    :param image: The image to be saved.
+    :param destination: The path of the file.
+    :param image_format: One of IMAGE_FORMATS.
+    :raises ValueError: If the format is not supported.
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Invalid image format {image_format}. Use one of {', '.join(IMAGE_FORMATS)}.")
+    if image_format == 'bmp':
+        display_image = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32, DISPLAY_MASKS)
+        display_image.blit(image, (0, 0))
+        image = display_image
+    with replace_file(destination) as image_file:
+        pygame.image.save(image, image_file, f"image.{image_format}")
+
+
+def optimize_image(
+        source: str,
+        destination: str,
+        resolution: tuple[int, int],
+        image_format: str = DEFAULT_IMAGE_FORMAT,
+        upscale: bool = True
+) -> ImageStats:
+    """
+    Scales an image to fit the resolution, saves it in the format and measures what was saved.
+    An image saved as PNG without being scaled keeps its original bytes when the re-encoded file is not smaller,
+    pygame compresses less than most image editors.
+
+    :param source: The path of the original image.
+    :param destination: The path of the optimized image.
+    :param resolution: The width and height of the target screen.
+    :param image_format: One of IMAGE_FORMATS.
+    :param upscale: A flag indicating whether images smaller than the resolution are scaled up too,
+        otherwise they are only scaled down.
+    :return: The sizes and decode times of the original and the optimized images.
+    """
+    start = time.perf_counter()
+    image = pygame.image.load(source)
+    source_decode = time.perf_counter() - start
+    size = fit_size(image.get_size(), resolution)
+    scaled = size != image.get_size() and (upscale or size[0] < image.get_width())
+    if scaled:
+        image = _scale(image, size)
+    save_image(image, destination, image_format)
+    if not scaled and image_format == 'png' and os.path.getsize(destination) >= os.path.getsize(source):
+        link_or_copy(source, destination)
+    start = time.perf_counter()
+    pygame.image.load(destination)
+    output_decode = time.perf_counter() - start
+    return ImageStats(os.path.getsize(source), os.path.getsize(destination), source_decode, output_decode)
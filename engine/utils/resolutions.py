@@ -0,0 +1,99 @@
+"""
+This module contains the helpers to handle the target resolutions of the game.
+It includes the parsing of resolutions such as 800x600, the fitting of images to a resolution and the selection of the
+pre-scaled asset variant that matches the screen.
+"""
+
+import os
+import re
+
+RESOLUTION_PATTERN = re.compile(r'^(\d+)x(\d+)$')
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    """
+    Parses a resolution written as <width>x<height>.
+
+    :param value: The resolution text, for example 800x600.
+    :return: A tuple with the width and the height.
+    :raises ValueError: If the text is not a valid resolution.
+    """
+    match = RESOLUTION_PATTERN.match(value.strip().lower())
+    if not match or not all(int(dimension) for dimension in match.groups()):
+        raise ValueError(f"Invalid resolution {value}. Use the <width>x<height> format, for example 800x600.")
+    return int(match.group(1)), int(match.group(2))
+
+
+def format_resolution(resolution: tuple[int, int]) -> str:
+    """
+    Formats a resolution as <width>x<height>, which is also the name of its asset folder.
+
+    :param resolution: A tuple with the width and the height.
+    :return: The resolution text.
+    """
+    return f"{resolution[0]}x{resolution[1]}"
+
+
+def fit_size(size: tuple[int, int], resolution: tuple[int, int]) -> tuple[int, int]:
+    """
+    Returns the biggest size that keeps the aspect ratio of an image and fits inside the resolution.
+
+    :param size: The width and height of the image.
+    :param resolution: The width and height of the screen.
+    :return: The fitted width and height.
+    """
+    factor = min(resolution[0] / size[0], resolution[1] / size[1])
+    return int(size[0] * factor), int(size[1] * factor)
+
+
+def available_resolutions(resource_folder: str, folders: list[str] = None) -> list[tuple[int, int]]:
+    """
+    Lists the pre-scaled asset variants shipped inside the resource folder.
+
+    :param resource_folder: The resource folder of the game.
+    :param folders: The folders of the resources when they are not laid out on disk, e.g. kept in an asset store.
+    :return: A list with the resolutions that have an asset folder.
+    """
+    if folders:
+        return sorted(parse_resolution(name) for name in folders if RESOLUTION_PATTERN.match(name))
+    if not os.path.isdir(resource_folder):
+        return []
+    return sorted(
+        parse_resolution(name)
+        for name in os.listdir(resource_folder)
+        if RESOLUTION_PATTERN.match(name) and os.path.isdir(os.path.join(resource_folder, name))
+    )
+
+
+def select_resolution(available: list[tuple[int, int]], target: tuple[int, int]) -> tuple[int, int] | None:
+    """
+    Selects the asset variant for the screen: the exact match, else the biggest one that fits the screen,
+    else the smallest one available.
+
+    :param available: The resolutions that have an asset folder.
+    :param target: The resolution of the screen.
+    :return: The selected resolution, or None if there is no variant.
+    """
+    if not available:
+        return None
+    if target in available:
+        return target
+    fitting = [resolution for resolution in available if resolution[0] <= target[0] and resolution[1] <= target[1]]
+    if fitting:
+        return max(fitting, key=lambda resolution: resolution[0] * resolution[1])
+    return min(available, key=lambda resolution: resolution[0] * resolution[1])
+
+
+def image_folder(resource_folder: str, resolution: tuple[int, int], folders: list[str] = None) -> str:
+    """
+    Returns the folder the images are loaded from for the screen resolution.
+
+    :param resource_folder: The resource folder of the game.
+    :param resolution: The resolution of the screen.
+    :param folders: The folders of the resources when they are not laid out on disk, e.g. kept in an asset store.
+    :return: The asset variant folder, or the resource folder itself when the game has no variants.
+    """
+    selected = select_resolution(available_resolutions(resource_folder, folders), resolution)
+    if selected is None:
+        return resource_folder
+    return os.path.join(resource_folder, format_resolution(selected))
@@ -0,0 +1,106 @@
+"""
+This module contains the packed story format of the built game.
+It includes the functions encoding the language independent story pack and the string table of each language,
+and the StoryPack class reading the pack with a single file read.
+
+A pack is a JSON header line followed by the JSON of every scene, one after the other. The header holds the characters
+and, for each scene, the offset and length of its JSON in the body, so a scene is parsed only when it is needed.
+The texts of the scenes are identifiers of the string tables, one JSON file per language.
+"""
+
+import json
+import os
+
+STORY_PACK_VERSION = 2
+
+
+def story_pack_path(resource_folder: str) -> str:
+    return os.path.join(resource_folder, 'story', 'story.pack')
+
+
+def string_table_path(resource_folder: str, language: str) -> str:
+    return os.path.join(resource_folder, 'story', 'strings', f'{language}.json')
+
+
+def encode_string_table(strings: dict[str, str]) -> bytes:
+    """
+    Encodes the texts of a language into the content of its string table file.
+
+    :param strings: A dictionary mapping text identifiers to texts.
+    :return: The content of the string table file.
+    """
+    return json.dumps(strings, ensure_ascii=False).encode('utf-8')
+
+
+def encode_story_pack(characters: dict[str, dict], scenes: dict[str, dict]) -> bytes:
+    """
+    Encodes the characters and the scene structure into the content of a pack file.
+
+    :param characters: A dictionary mapping character names to their dumped data.
+    :param scenes: A dictionary mapping scene names to their dumped data.
+    :return: The content of the pack file.
+    """
+    index = {}
+    body = []
+    offset = 0
+    for name, scene in scenes.items():
+        content = json.dumps(scene, ensure_ascii=False).encode('utf-8')
+        index[name] = [offset, len(content)]
+        body.append(content)
+        offset += len(content)
+    header = {
+        'version': STORY_PACK_VERSION,
+        'characters': characters,
+        'scenes': index,
+    }
+    return json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n' + b''.join(body)
+
+
+class StoryPack:
+    """
+    StoryPack class. It holds the bytes of a pack file and slices the scenes out of it on demand.
+
+    :param data: The content of the pack file.
+    """
+    characters: dict[str, dict]
+
+    def __init__(self, data: bytes):
+        """
+        Initializes the StoryPack instance.
+
+        :param data: The content of the pack file.
+        """
+        header_end = data.index(b'\n')
+        header = json.loads(data[:header_end])
+        if header.get('version') != STORY_PACK_VERSION:
+            raise ValueError(f"Unsupported story pack version {header.get('version')}")
+        self._data = data
+        self._body = header_end + 1
+        self._index: dict[str, list[int]] = header['scenes']
+        self.characters = header['characters']
+
+    @classmethod
+    def open(cls, path: str) -> 'StoryPack':
+        """
+        Reads a pack file, the whole file is read at once.
+
+        :param path: The path of the pack file.
+        :return: A StoryPack instance.
+        """
+        with open(path, 'rb') as pack_file:
+            return cls(pack_file.read())
+
+    @property
+    def scene_names(self) -> list[str]:
+        return list(self._index)
+
+    def scene(self, name: str) -> dict:
+        """
+        Parses the data of one scene.
+
+        :param name: The name of the scene.
+        :return: The dumped data of the scene.
+        """
+        offset, length = self._index[name]
+        start = self._body + offset
+        return json.loads(self._data[start:start + length])
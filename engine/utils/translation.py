@@ -1,5 +1,96 @@
-from deep_translator import GoogleTranslator
+"""
+This module contains the translation backends for the game engine.
+It includes the TranslationBackend interface translating batches of texts, the Google backend used by default and an
+offline dictionary backend, plus the translate function translating a single text.
+"""
+
+from typing import Iterable
+
+# Texts sent to a backend in a single batch.
+DEFAULT_TRANSLATION_BATCH_SIZE = 50
 
 
 def translate(value: str, source: str, target: str):
+    # The translator is only used while building, importing it lazily keeps it (and the HTTP stack it pulls in)
+    # out of the game startup.
+    from deep_translator import GoogleTranslator
+
     return GoogleTranslator(source=source, target=target).translate(value)
+
+
+class TranslationBackend:
+    """
+    TranslationBackend class. It is the interface of the services translating the story while building.
+    """
+    name: str = 'backend'
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        """
+        Translates a batch of texts. This method should be implemented in a subclass.
+
+        :param texts: The texts to be translated.
+        :param source: The source language.
+        :param target: The target language.
+        :return: The translated texts, in the same order.
+        :raises NotImplementedError: If the method is not implemented in a subclass.
+        """
+        raise NotImplementedError
+
+
+class GoogleTranslationBackend(TranslationBackend):
+    """
+    GoogleTranslationBackend class. It translates the texts with Google Translate.
+    """
+    name: str = 'google'
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        from deep_translator import GoogleTranslator
+
+        return GoogleTranslator(source=source, target=target).translate_batch(texts)
+
+
+class DictionaryTranslationBackend(TranslationBackend):
+    """
+    DictionaryTranslationBackend class. It translates the texts offline with a fixed dictionary per target language,
+    texts missing from the dictionary are kept as they are. Without a dictionary it is an identity translation.
+
+    :param dictionary: A dictionary mapping each target language to a dictionary of texts and their translations.
+    """
+    name: str = 'dictionary'
+    dictionary: dict[str, dict[str, str]]
+
+    def __init__(self, dictionary: dict[str, dict[str, str]] = None):
+        """
+        Initializes the DictionaryTranslationBackend instance.
+
+        :param dictionary: A dictionary mapping each target language to a dictionary of texts and their translations.
+        """
+        self.dictionary = dictionary or {}
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        translations = self.dictionary.get(target, {})
+        return [translations.get(text, text) for text in texts]
+
+
+TRANSLATION_BACKENDS: dict[str, type[TranslationBackend]] = {
+    GoogleTranslationBackend.name: GoogleTranslationBackend,
+    DictionaryTranslationBackend.name: DictionaryTranslationBackend,
+}
+
+
+def batches(texts: Iterable[str], size: int = DEFAULT_TRANSLATION_BATCH_SIZE) -> Iterable[list[str]]:
+    """
+    Splits the texts into batches.
+
+    :param texts: The texts to be split.
+    :param size: The maximum amount of texts of a batch.
+    :return: An iterable of lists of texts.
+    """
+    batch = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
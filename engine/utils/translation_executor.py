@@ -0,0 +1,204 @@
+"""
+This module contains the TranslationExecutor class for the game engine.
+It includes the token bucket limiting the requests sent to a translation service, and the executor sending the
+translation batches from a pool of threads with retries and per-language progress.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from engine.utils.translation import TranslationBackend
+
+DEFAULT_TRANSLATION_WORKERS = 4
+# Batches sent per second, public translation services throttle clients sending faster.
+DEFAULT_TRANSLATION_RATE = 5.0
+DEFAULT_TRANSLATION_RETRIES = 3
+DEFAULT_TRANSLATION_BACKOFF = 1.0
+
+
+class TranslationError(Exception):
+    """
+    TranslationError class. It is raised when some batches could not be translated after every retry.
+
+    :param failures: The failed jobs and the last error of each one.
+    """
+
+    def __init__(self, failures: list[tuple['TranslationJob', Exception]]):
+        self.failures = failures
+        details = '; '.join(
+            f"{job.source}->{job.target} ({len(job.texts)} texts): {error}" for job, error in failures
+        )
+        super().__init__(f"{len(failures)} translation batches failed: {details}")
+
+
+@dataclass(frozen=True)
+class TranslationJob:
+    """
+    TranslationJob dataclass. It represents a batch of texts to be translated from a language to another.
+
+    :param source: The source language.
+    :param target: The target language.
+    :param texts: The texts to be translated.
+    """
+    source: str
+    target: str
+    texts: tuple[str, ...]
+
+
+class TokenBucket:
+    """
+    TokenBucket class. It allows a steady rate of operations with short bursts, blocking the callers above it.
+
+    :param rate: The amount of tokens added per second, None disables the limit.
+    :param capacity: The maximum amount of tokens kept for a burst.
+    :param clock: The callable returning the current time in seconds.
+    :param sleep: The callable waiting for an amount of seconds.
+    """
+    rate: float | None
+    capacity: float
+
+    def __init__(
+            self,
+            rate: float | None,
+            capacity: float = 1,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initializes the TokenBucket instance.
+
+        :param rate: The amount of tokens added per second, None disables the limit.
+        :param capacity: The maximum amount of tokens kept for a burst.
+        :param clock: The callable returning the current time in seconds.
+        :param sleep: The callable waiting for an amount of seconds.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes a token, waiting until one is available.
+        """
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+def print_progress(target: str, done: int, total: int):
+    """
+    Prints the translation progress of a language.
+
+    :param target: The target language.
+    :param done: The amount of texts translated.
+    :param total: The amount of texts to be translated.
+    """
+    print(f"Translating {target}: {done}/{total}")
+
+
+class TranslationExecutor:
+    """
+    TranslationExecutor class. It sends translation batches to a backend from a pool of threads, limited by a token
+    bucket, retrying the failed batches with an exponential backoff.
+
+    :param workers: The amount of batches translated at the same time.
+    :param rate: The maximum amount of batches sent per second, None disables the limit.
+    :param retries: How many times a failed batch is sent again.
+    :param backoff: The seconds waited before the first retry, doubled on each following one.
+    :param progress: The callable receiving the target language, the texts done and the total after each batch.
+    :param sleep: The callable waiting for an amount of seconds.
+    """
+    workers: int
+    retries: int
+    backoff: float
+
+    def __init__(
+            self,
+            workers: int = DEFAULT_TRANSLATION_WORKERS,
+            rate: float | None = DEFAULT_TRANSLATION_RATE,
+            retries: int = DEFAULT_TRANSLATION_RETRIES,
+            backoff: float = DEFAULT_TRANSLATION_BACKOFF,
+            progress: Callable[[str, int, int], None] = print_progress,
+            sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initializes the TranslationExecutor instance.
+
+        :param workers: The amount of batches translated at the same time.
+        :param rate: The maximum amount of batches sent per second, None disables the limit.
+        :param retries: How many times a failed batch is sent again.
+        :param backoff: The seconds waited before the first retry, doubled on each following one.
+        :param progress: The callable receiving the target language, the texts done and the total after each batch.
+        :param sleep: The callable waiting for an amount of seconds.
+        """
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.bucket = TokenBucket(rate, capacity=self.workers, sleep=sleep)
+        self._progress = progress
+        self._sleep = sleep
+
+    def run(
+            self,
+            backend: TranslationBackend,
+            jobs: list[TranslationJob]
+    ) -> Iterator[tuple[TranslationJob, list[str]]]:
+        """
+        Translates the jobs, yielding each one with its translations as soon as it is done.
+        The results are yielded on the calling thread, so they can be stored without locking.
+
+        :param backend: The backend translating the texts.
+        :param jobs: The batches to be translated.
+        :return: An iterator of (job, translated texts) tuples, in completion order.
+        :raises TranslationError: After every other job was yielded, if some jobs failed on every retry.
+        """
+        totals: dict[str, int] = {}
+        for job in jobs:
+            totals[job.target] = totals.get(job.target, 0) + len(job.texts)
+        done = dict.fromkeys(totals, 0)
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='translation') as pool:
+            futures = {pool.submit(self._translate, backend, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    translations = future.result()
+                except Exception as error:  # noqa
+                    failures.append((job, error))
+                    continue
+                done[job.target] += len(job.texts)
+                if self._progress is not None:
+                    self._progress(job.target, done[job.target], totals[job.target])
+                yield job, translations
+        if failures:
+            raise TranslationError(failures)
+
+    def _translate(self, backend: TranslationBackend, job: TranslationJob) -> list[str]:
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            try:
+                translations = backend.translate_batch(list(job.texts), job.source, job.target)
+            except Exception:  # noqa
+                if attempt == self.retries:
+                    raise
+                self._sleep(self.backoff * 2 ** attempt)
+                continue
+            if len(translations) != len(job.texts):
+                raise ValueError(f"Expected {len(job.texts)} translations, received {len(translations)}")
+            return translations
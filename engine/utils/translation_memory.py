@@ -0,0 +1,181 @@
+"""
+This module contains the TranslationMemory class for the game engine.
+It includes a persistent SQLite cache of the translated texts, so rebuilding an unchanged story translates nothing.
+"""
+
+import hashlib
+import sqlite3
+
+from engine.utils.translation import (
+    DEFAULT_TRANSLATION_BATCH_SIZE,
+    GoogleTranslationBackend,
+    TranslationBackend,
+    batches,
+)
+from engine.utils.translation_executor import TranslationExecutor, TranslationJob
+
+DEFAULT_TRANSLATION_MEMORY = '.translation_memory.sqlite'
+# Version 1 had no backend column, its translations were all made by Google Translate.
+TRANSLATION_MEMORY_VERSION = 2
+
+
+class TranslationMemory:
+    """
+    TranslationMemory class. It stores every translation made during a build, keyed by the backend, the source
+    language, the target language and the hash of the text, and reuses them on the next builds.
+
+    :param path: The path of the SQLite database, ':memory:' keeps it in memory only.
+    :param backend: The backend translating the texts missing from the memory, Google Translate by default.
+    :param batch_size: The maximum amount of texts sent to the backend at once.
+    :param executor: The executor sending the batches to the backend, a single worker without limits by default.
+    """
+    path: str
+    backend: TranslationBackend
+    batch_size: int
+    hits: int
+    misses: int
+    batches: int
+
+    def __init__(
+            self,
+            path: str = DEFAULT_TRANSLATION_MEMORY,
+            backend: TranslationBackend = None,
+            batch_size: int = DEFAULT_TRANSLATION_BATCH_SIZE,
+            executor: TranslationExecutor = None
+    ):
+        """
+        Initializes the TranslationMemory instance.
+
+        :param path: The path of the SQLite database, ':memory:' keeps it in memory only.
+        :param backend: The backend translating the texts missing from the memory, Google Translate by default.
+        :param batch_size: The maximum amount of texts sent to the backend at once.
+        :param executor: The executor sending the batches to the backend, a single worker without limits by default.
+        """
+        self.path = path
+        self.backend = backend or GoogleTranslationBackend()
+        self.batch_size = batch_size
+        self.executor = executor or TranslationExecutor(workers=1, rate=None, progress=None)
+        self._connection = sqlite3.connect(path)
+        self._create_tables()
+        self.hits = 0
+        self.misses = 0
+        self.batches = 0
+
+    def _create_tables(self):
+        version = self._connection.execute('PRAGMA user_version').fetchone()[0]
+        columns = [row[1] for row in self._connection.execute('PRAGMA table_info(translations)')]
+        with self._connection:
+            if columns and version < TRANSLATION_MEMORY_VERSION:
+                self._connection.execute('ALTER TABLE translations RENAME TO translations_v1')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'backend TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL, text_hash TEXT NOT NULL, '
+                'text TEXT NOT NULL, translation TEXT NOT NULL, PRIMARY KEY (backend, source, target, text_hash))'
+            )
+            if columns and version < TRANSLATION_MEMORY_VERSION:
+                # The memory written before the backends keeps its translations, they come from Google Translate.
+                self._connection.execute(
+                    'INSERT OR IGNORE INTO translations '
+                    'SELECT ?, source, target, text_hash, text, translation FROM translations_v1',
+                    (GoogleTranslationBackend.name,)
+                )
+                self._connection.execute('DROP TABLE translations_v1')
+            self._connection.execute(f'PRAGMA user_version = {TRANSLATION_MEMORY_VERSION}')
+
+    def __enter__(self) -> 'TranslationMemory':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def translate(self, value: str, source: str, target: str) -> str:
+        """
+        Returns the translation of a text, calling the backend only when it was never translated before.
+
+        :param value: The text to be translated.
+        :param source: The source language.
+        :param target: The target language.
+        :return: The translated text.
+        """
+        return self.translate_batch([value], source, target)[0]
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        """
+        Translates the texts, each distinct text is looked up once and the ones never translated before are sent
+        to the backend in batches.
+
+        :param texts: The texts to be translated, they may repeat.
+        :param source: The source language.
+        :param target: The target language.
+        :return: The translated texts, in the same order.
+        """
+        return self.translate_pairs(texts, [(source, target)])[(source, target)]
+
+    def translate_pairs(self, texts: list[str], pairs: list[tuple[str, str]]) -> dict[tuple[str, str], list[str]]:
+        """
+        Translates the texts for several language pairs. The missing translations of every pair are collected first
+        and sent together through the executor, so the pairs are translated concurrently.
+        The translations received are kept even when some batches fail.
+
+        :param texts: The texts to be translated, they may repeat.
+        :param pairs: The (source, target) language pairs.
+        :return: A dictionary mapping each pair to the translated texts, in the same order.
+        :raises TranslationError: If some batches could not be translated.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        translations: dict[tuple[str, str], dict[str, str]] = {}
+        jobs = []
+        for source, target in dict.fromkeys(pairs):
+            known = translations[(source, target)] = {}
+            missing = []
+            for text in unique_texts:
+                row = self._connection.execute(
+                    'SELECT translation FROM translations '
+                    'WHERE backend = ? AND source = ? AND target = ? AND text_hash = ?',
+                    (self.backend.name, source, target, self.text_hash(text))
+                ).fetchone()
+                if row is None:
+                    missing.append(text)
+                else:
+                    known[text] = row[0]
+            self.hits += len(known)
+            self.misses += len(missing)
+            jobs.extend(TranslationJob(source, target, tuple(batch)) for batch in batches(missing, self.batch_size))
+        for job, translated in self.executor.run(self.backend, jobs):
+            self.batches += 1
+            for text, translation in zip(job.texts, translated):
+                translations[(job.source, job.target)][text] = translation
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)',
+                    (self.backend.name, job.source, job.target, self.text_hash(text), text, translation)
+                )
+        return {
+            pair: [pair_translations[text] for text in texts]
+            for pair, pair_translations in translations.items()
+        }
+
+    def close(self):
+        """
+        Saves the new translations and closes the database.
+        """
+        self._connection.commit()
+        self._connection.close()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the cache counters, each distinct text of a batch is counted once.
+
+        :return: A dictionary with the hits, misses and batches sent to the backend.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'batches': self.batches}
+
+    @staticmethod
+    def text_hash(value: str) -> str:
+        """
+        Returns the hash identifying a text in the memory.
+
+        :param value: The text.
+        :return: The hexadecimal SHA-256 digest of the text.
+        """
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
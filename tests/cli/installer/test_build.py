@@ -1,16 +1,69 @@
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from cli.installer import build  # corrected import
+from engine.game_ui.build_result import BuildEvent
+
+BUILD_SCRIPT = """
+calls = []
+
+
+def build(**options):
+    calls.append(options)
+    return options
+"""
 
 
 class TestBuild(unittest.TestCase):
 
+    @patch('cli.installer.build.measure_launch', return_value=[0.5])
+    @patch('cli.installer.build.build_game')
+    @patch('cli.installer.build.subprocess')
+    @patch('cli.installer.build.py_installer')
+    def test_build(self, mock_py_installer, mock_subprocess, mock_build_game, mock_measure_launch):
+        # Setup
+        mock_build_game.return_value = MagicMock(main_path=os.path.join('output', '__main__.pyw'), game_title='Game')
+
+        with patch('cli.installer.build.os.listdir') as mock_listdir:
+            mock_listdir.return_value = ['__init__.py', '__main__.py', 'configuration.py', 'build.py', 'characters.py']
+            # Call
+            build.build('output_path', 'project_path', ['800x600'], jobs=2, launch_runs=1)
+
+        # Assert
+        mock_build_game.assert_called_once_with('project_path', ['800x600'], 2, None)
+        mock_subprocess.Popen.assert_not_called()
+        mock_py_installer.run.assert_called_once()
+        self.assertIn(os.path.abspath(os.path.join('output', '__main__.pyw')), mock_py_installer.run.call_args[0][0])
+        self.assertIn('--name=Game', mock_py_installer.run.call_args[0][0])
+        self.assertIn('--onefile', mock_py_installer.run.call_args[0][0])
+        mock_measure_launch.assert_called_once_with(os.path.join('output_path', 'Game'), 1)
+
+    @patch('builtins.print')
+    @patch('cli.installer.build.measure_launch', side_effect=RuntimeError('No available video device'))
+    @patch('cli.installer.build.build_game')
+    @patch('cli.installer.build.py_installer')
+    def test_build_launch_failure_is_a_warning(self, mock_py_installer, mock_build_game, _, mock_print):
+        mock_build_game.return_value = MagicMock(main_path=os.path.join('output', '__main__.pyw'), game_title='Game')
+        with patch('cli.installer.build.os.listdir') as mock_listdir:
+            mock_listdir.return_value = ['__init__.py', '__main__.py', 'configuration.py', 'build.py', 'characters.py']
+            build.build('output_path', 'project_path', None, launch_runs=1)
+        mock_py_installer.run.assert_called_once()
+        mock_print.assert_called_with('Warning: the launch time could not be measured: No available video device')
+
+    @patch('cli.installer.build.check_platforms', side_effect=ValueError('Cannot build for windows on linux'))
+    @patch('cli.installer.build.build_game')
+    def test_build_other_platform(self, mock_build_game, _):
+        with self.assertRaises(SystemExit):
+            build.build('output_path', 'project_path', None, platforms=['windows'])
+        mock_build_game.assert_not_called()
+
+    @patch('cli.installer.build.build_game', return_value=None)
     @patch('cli.installer.build.os')
-    @patch('cli.installer.build.shutil')
     @patch('cli.installer.build.subprocess')
     @patch('cli.installer.build.py_installer')
-    def test_build(self, mock_py_installer, mock_subprocess, mock_shutil, mock_os):
+    def test_build_without_build_function(self, mock_py_installer, mock_subprocess, mock_os, mock_build_game):
         # Setup
         mock_os.path.dirname.return_value = 'data_path'
         mock_subprocess.Popen.return_value.communicate.return_value = (b'#build_main_path#game_name#\n', None)
@@ -22,24 +75,39 @@ class TestBuild(unittest.TestCase):
             'characters.py'
         ]
         # Call
-        build.build('output_path', 'project_path', ['resolutions'])
+        build.build('output_path', 'project_path', ['800x600', '1280x720'])
 
         # Assert
         mock_os.listdir.assert_called_once_with('project_path')
-        mock_subprocess.Popen.assert_called_once_with('python build.py', stdout=mock_subprocess.PIPE, shell=True)
+        mock_subprocess.Popen.assert_called_once_with(
+            'python build.py --resolutions 800x600 1280x720',
+            stdout=mock_subprocess.PIPE,
+            shell=True
+        )
         mock_py_installer.run.assert_called_once()
-        mock_shutil.rmtree.assert_called_once_with('data_path', ignore_errors=True)
 
     @patch('cli.installer.build.os')
-    @patch('cli.installer.build.shutil')
     @patch('cli.installer.build.py_installer')
-    def test_build_app(self, mock_py_installer, mock_shutil, mock_os):
+    def test_build_app(self, mock_py_installer, mock_os):
         # Call
         build.build_app('build_main_path', 'data_path', 'game_name', 'output_path')
 
         # Assert
         mock_py_installer.run.assert_called_once()
-        mock_shutil.rmtree.assert_called_once_with('data_path', ignore_errors=True)
+        self.assertIn('--exclude-module=deep_translator', mock_py_installer.run.call_args[0][0])
+        self.assertIn('--clean', mock_py_installer.run.call_args[0][0])
+
+    @patch('cli.installer.build.py_installer')
+    def test_build_app_onedir_with_cache(self, mock_py_installer):
+        with tempfile.TemporaryDirectory() as cache_path:
+            executable = build.build_app('main.pyw', 'output', 'Game', 'dist', 'onedir', cache_path)
+
+            options = mock_py_installer.run.call_args[0][0]
+            self.assertEqual(executable, os.path.join('dist', 'Game', 'Game'))
+            self.assertEqual(options[0], os.path.abspath('main.pyw'))
+            self.assertIn('--onedir', options)
+            self.assertNotIn('--clean', options)
+            self.assertIn(f'--workpath={build.work_path(cache_path, "onedir")}', options)
 
     @patch('cli.installer.build.subprocess')
     def test_build_game_jsons(self, mock_subprocess):
@@ -54,6 +122,42 @@ class TestBuild(unittest.TestCase):
         self.assertEqual(game_name, 'game_name')
         mock_subprocess.Popen.assert_called_once_with('python build.py', stdout=mock_subprocess.PIPE, shell=True)
 
+    @patch('cli.installer.build.subprocess')
+    def test_build_game_jsons_with_jobs(self, mock_subprocess):
+        mock_subprocess.Popen.return_value.communicate.return_value = (b'#build_main_path#game_name#\n', None)
+        build.build_game_jsons(['800x600'], jobs=4, languages=['en', 'pt'])
+        mock_subprocess.Popen.assert_called_once_with(
+            'python build.py --resolutions 800x600 --jobs 4 --languages en pt',
+            stdout=mock_subprocess.PIPE,
+            shell=True
+        )
+
+    def test_build_game(self):
+        with tempfile.TemporaryDirectory() as project_path:
+            with open(os.path.join(project_path, 'build.py'), 'w') as build_file:
+                build_file.write(BUILD_SCRIPT)
+            progress = MagicMock()
+
+            options = build.build_game(project_path, ['800x600'], jobs=2, languages=['en'], progress=progress)
+
+        self.assertEqual(options['resolutions'], [(800, 600)])
+        self.assertEqual(options['jobs'], 2)
+        self.assertEqual(options['languages'], ['en'])
+        self.assertIs(options['progress'], progress)
+        self.assertNotIn(project_path, build.sys.path)
+
+    def test_build_game_without_build_function(self):
+        with tempfile.TemporaryDirectory() as project_path:
+            with open(os.path.join(project_path, 'build.py'), 'w') as build_file:
+                build_file.write('GAME = None\n')
+
+            self.assertIsNone(build.build_game(project_path))
+
+    @patch('builtins.print')
+    def test_print_build_event(self, mock_print):
+        build.print_build_event(BuildEvent('images', 'progress', 'background.png 800x600', 1, 2))
+        mock_print.assert_called_once_with('[images] 1/2 background.png 800x600')
+
     @patch('cli.installer.build.os')
     def test_validate_files(self, mock_os):
         # Setup
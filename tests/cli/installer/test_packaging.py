@@ -0,0 +1,67 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cli.installer import packaging
+
+
+class TestPackaging(unittest.TestCase):
+
+    def test_packaging_key(self):
+        self.assertEqual(packaging.packaging_key(), packaging.packaging_key())
+        self.assertEqual(len(packaging.packaging_key()), 16)
+
+    def test_work_path_removes_other_keys(self):
+        with tempfile.TemporaryDirectory() as cache_path:
+            os.makedirs(os.path.join(cache_path, 'stale'))
+            os.makedirs(os.path.join(cache_path, 'onedir', 'stale'))
+            path = packaging.work_path(cache_path, 'onedir')
+            os.makedirs(path)
+            self.assertEqual(packaging.work_path(cache_path, 'onedir'), path)
+            self.assertEqual(os.listdir(cache_path), ['onedir'])
+            self.assertEqual(os.listdir(os.path.join(cache_path, 'onedir')), [os.path.basename(path)])
+
+    def test_work_path_keeps_the_other_modes(self):
+        with tempfile.TemporaryDirectory() as cache_path:
+            onedir = packaging.work_path(cache_path, 'onedir')
+            os.makedirs(onedir)
+            onefile = packaging.work_path(cache_path, 'onefile')
+            os.makedirs(onefile)
+            self.assertNotEqual(onedir, onefile)
+            self.assertEqual(packaging.work_path(cache_path, 'onedir'), onedir)
+            self.assertTrue(os.path.isdir(onefile))
+
+    @patch('cli.installer.packaging.platform.system', return_value='Linux')
+    def test_executable_path(self, _):
+        self.assertEqual(packaging.executable_path('dist', 'Game'), os.path.join('dist', 'Game'))
+        self.assertEqual(packaging.executable_path('dist', 'Game', 'onedir'), os.path.join('dist', 'Game', 'Game'))
+
+    @patch('cli.installer.packaging.platform.system', return_value='Linux')
+    def test_check_platforms(self, _):
+        self.assertEqual(packaging.check_platforms(None), 'linux')
+        self.assertEqual(packaging.check_platforms(['linux', 'windows']), 'linux')
+        with self.assertRaises(ValueError):
+            packaging.check_platforms(['windows', 'macos'])
+
+    def test_measure_launch(self):
+        with tempfile.TemporaryDirectory() as folder:
+            executable = os.path.join(folder, 'game.py')
+            with open(executable, 'w') as game_file:
+                game_file.write(
+                    f"#!{sys.executable}\n"
+                    "import os, sys\n"
+                    f"sys.exit(0 if os.environ.get('{packaging.LAUNCH_PROBE_VARIABLE}') else 1)\n"
+                )
+            os.chmod(executable, 0o755)
+            timings = packaging.measure_launch(executable, runs=2)
+        self.assertEqual(len(timings), 2)
+        self.assertIn('over 2 launches', packaging.describe_launch(timings))
+
+    @patch('cli.installer.packaging.subprocess.run')
+    def test_measure_launch_failure(self, mock_run):
+        mock_run.return_value.returncode = 1
+        mock_run.return_value.stderr = b'No module named pygame'
+        with self.assertRaises(RuntimeError):
+            packaging.measure_launch('Game')
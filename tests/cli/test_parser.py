@@ -43,7 +43,7 @@ class TestMainModule(unittest.TestCase):
     def test_build_parsers(self):
         build_parsers(self.subparsers)
         self.subparsers.add_parser.assert_called_once_with("build", help="Build the project executable")
-        assert self.subparsers.add_parser().add_argument.call_count == 4
+        assert self.subparsers.add_parser().add_argument.call_count == 7
 
     def test_project_init_parsers(self):
         project_init_parsers(self.subparsers)
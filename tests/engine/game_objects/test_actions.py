@@ -64,6 +64,17 @@ class TestTalk(unittest.TestCase):
     def test_go_to(self):
         self.assertEqual(self.talk.go_to(), None)
 
+    def test_talk_render_is_cached_and_read_only(self):
+        result = self.talk.render()
+        self.assertIs(self.talk.render(), result)
+        with self.assertRaises(TypeError):
+            result['text'] = 'Bye'
+
+    def test_talk_shares_character_snapshot(self):
+        other = Talk(self.character, 'Bye', 'state')
+        self.assertIs(other.character, self.talk.character)
+        self.assertFalse(hasattr(self.talk, '__dict__'))
+
 
 class TestChoice(unittest.TestCase):
 
@@ -83,7 +94,7 @@ class TestChoice(unittest.TestCase):
         self.assertEqual(result['character_name'], 'Test Character')
         self.assertEqual(result['character_image'], 'image.png')
         self.assertEqual(result['text'], 'Choose')
-        self.assertEqual(result['choices'], [('1', 'One')])
+        self.assertEqual(result['choices'], (('1', 'One'),))
         self.assertEqual(result['type'], 'choice')
 
     def test_choice_dump(self):
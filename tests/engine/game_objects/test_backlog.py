@@ -0,0 +1,44 @@
+import unittest
+
+from engine.game_objects.action import Talk
+from engine.game_objects.backlog import Backlog
+from engine.game_objects.character import Character
+from engine.game_objects.scene import Scene
+
+
+class TestBacklog(unittest.TestCase):
+
+    def setUp(self):
+        character = Character('Test Character', 'state', {'state': 'image.png'})
+        self.first = Scene('first', 'background.png')
+        self.first.add_action(Talk(character, 'Hello'))
+        self.first.add_action(Talk(character, 'World'))
+        self.second = Scene('second', 'background.png')
+        self.second.add_action(Talk(character, 'Bye'))
+        self.scenes = {'first': self.first, 'second': self.second}
+        self.backlog = Backlog(size=2)
+
+    def test_backlog_spans_scenes(self):
+        self.backlog.record('first', 1)
+        self.backlog.record('second', 0)
+        self.assertEqual(
+            self.backlog.actions(self.scenes),
+            [('first', self.first.actions[1]), ('second', self.second.actions[0])]
+        )
+
+    def test_backlog_is_bounded(self):
+        self.backlog.record('first', 0)
+        self.backlog.record('first', 1)
+        self.backlog.record('second', 0)
+        self.assertEqual(list(self.backlog), [('first', 1), ('second', 0)])
+        self.assertEqual(len(self.backlog), 2)
+
+    def test_backlog_skips_missing_references(self):
+        self.backlog.record('missing', 0)
+        self.backlog.record('second', 5)
+        self.assertEqual(self.backlog.actions(self.scenes), [])
+
+    def test_backlog_clear(self):
+        self.backlog.record('first', 0)
+        self.backlog.clear()
+        self.assertEqual(len(self.backlog), 0)
@@ -19,6 +19,18 @@ class TestCharacter(unittest.TestCase):
         self.assertEqual(snapshot.image, 'image.png')
         self.assertEqual(snapshot.state, 'STATE')
 
+    def test_character_snapshot_is_interned(self):
+        self.assertIs(self.character.snapshot(), self.character.snapshot('state'))
+        self.character.states['STATE'] = 'other.png'
+        self.assertEqual(self.character.snapshot().image, 'other.png')
+
+    def test_character_dump(self):
+        self.character.snapshot()
+        self.assertEqual(
+            self.character.dump(),
+            {'name': 'Test Character', 'state': 'STATE', 'states': {'STATE': 'image.png'}}
+        )
+
     def test_character_str(self):
         result = str(self.character)
         self.assertEqual(result, 'Test Character[STATE]')
@@ -33,3 +45,7 @@ class TestGameCharacter(unittest.TestCase):
         self.assertEqual(self.game_character.name, 'Test Character')
         self.assertEqual(self.game_character.image, 'image.png')
         self.assertEqual(self.game_character.state, 'state')
+
+    def test_game_character_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.game_character.state = 'other'
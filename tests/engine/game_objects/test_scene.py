@@ -1,8 +1,9 @@
 import unittest
 
-from engine.game_objects.action import Action, Choice
+from engine.game_objects.action import Action, Choice, GoTo, Talk
 from engine.game_objects.character import Character
 from engine.game_objects.scene import Scene
+from engine.game_objects.string_table import StringTable
 
 
 class TestScene(unittest.TestCase):
@@ -31,11 +32,42 @@ class TestScene(unittest.TestCase):
         self.assertEqual(self.scene.history, [self.action])
         self.assertEqual(self.scene.action, 1)
 
+    def test_scene_history_is_bounded(self):
+        scene = Scene('Loop', 'background.png', history_size=2)
+        first = Talk(self.character, 'First')
+        second = Talk(self.character, 'Second')
+        scene.add_action(first)
+        scene.add_action(second)
+        for _ in range(3):
+            while scene.execute_next_action():
+                pass
+        self.assertEqual(scene.history, [first, second])
+
     def test_scene_str(self):
         self.scene.add_action(self.action)
         result = str(self.scene)
         self.assertEqual(result, 'Test Scene - 1/1\n[\'1: action - Test Character[STATE]\']')
 
+    def test_scene_dump_structure(self):
+        self.scene.add_action(Talk(self.character, 'Hello'))
+        self.scene.add_action(self.choice)
+        strings = {}
+        result = self.scene.dump_structure(strings)
+        self.assertEqual(result['actions'][0]['text'], 'Test Scene#0')
+        self.assertEqual(result['actions'][1]['choices'], [{'go_to': '1', 'text': 'Test Scene#1/0'}])
+        self.assertEqual(strings, {'Test Scene#0': 'Hello', 'Test Scene#1': 'Choose', 'Test Scene#1/0': 'One'})
+
+    def test_scene_from_dict_with_strings(self):
+        strings = StringTable({'Test Scene#0': 'Go away'})
+        content = {
+            'name': 'Test Scene',
+            'background': 'background.png',
+            'actions': [GoTo(self.character, 'Test Scene#0', 'next', 'state').dump_structure('Test Scene#0', {})]
+        }
+        scene = Scene.from_dict(content, {'TEST CHARACTER': self.character}, strings)
+        self.assertEqual(scene.outcomes, ['next'])
+        self.assertEqual(scene.actions[0].render()['text'], 'Go away')
+
     def test_scene_add_action_exception(self):
         self.scene.add_action(self.choice)
         with self.assertRaises(Exception):
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock
+
+from engine.game_objects.action import Choice
+from engine.game_objects.character import Character
+from engine.game_objects.scene import Scene
+from engine.game_objects.scene_loader import SceneLoader
+
+
+class TestSceneLoader(unittest.TestCase):
+
+    def setUp(self):
+        character = Character('Test Character', 'state', {'state': 'image.png'})
+        self.scenes = {}
+        for name, outcomes in {'start': ['second'], 'second': ['third'], 'third': [None]}.items():
+            scene = Scene(name, 'background.png')
+            scene.add_action(Choice(character, 'Choose', [(outcome, 'Next') for outcome in outcomes]))
+            self.scenes[name] = scene
+        self.load = MagicMock(side_effect=lambda name: self.scenes[name])
+        self.loader = SceneLoader(self.scenes.keys(), self.load)
+
+    def test_scene_loader_is_lazy(self):
+        self.assertEqual(len(self.loader), 3)
+        self.assertIn('second', self.loader)
+        self.assertEqual(list(self.loader), ['start', 'second', 'third'])
+        self.load.assert_not_called()
+
+    def test_scene_loader_loads_once(self):
+        self.assertIs(self.loader['start'], self.scenes['start'])
+        self.assertIs(self.loader['start'], self.scenes['start'])
+        self.load.assert_called_once_with('start')
+        self.assertEqual(self.loader.loaded, ['start'])
+
+    def test_scene_loader_missing_scene(self):
+        with self.assertRaises(KeyError):
+            self.loader['missing']
+        self.assertIsNone(self.loader.get('missing'))
+        self.load.assert_not_called()
+
+    def test_scene_loader_set_item(self):
+        scene = Scene('extra', 'background.png')
+        self.loader['extra'] = scene
+        self.assertIs(self.loader['extra'], scene)
+        self.assertEqual(len(self.loader), 4)
+
+    def test_scene_loader_warm(self):
+        self.loader.warm('start', depth=1).join(timeout=5)
+        self.assertEqual(self.loader.loaded, ['start', 'second'])
@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+import unittest
+
+from engine.game_objects.action import Choice, Talk
+from engine.game_objects.character import Character
+from engine.game_objects.string_table import StringTable
+
+
+class TestStringTable(unittest.TestCase):
+
+    def setUp(self):
+        self.strings = StringTable({'start#0': 'Hello', 'start#1': 'Choose', 'start#1/0': 'One'}, 'en')
+        self.character = Character('Test Character', state='state', states={'state': 'image.png'})
+
+    def test_string_table_get(self):
+        self.assertEqual(self.strings.get('start#0'), 'Hello')
+        self.assertEqual(self.strings.get('missing'), 'missing')
+        self.assertEqual(len(self.strings), 3)
+
+    def test_string_table_swap_updates_actions(self):
+        talk = Talk(self.character, 'start#0', strings=self.strings)
+        choice = Choice(self.character, 'start#1', [('next', 'start#1/0')], strings=self.strings)
+        self.assertEqual(talk.render()['text'], 'Hello')
+        self.assertIs(talk.render(), talk.render())
+        self.assertEqual(choice.render()['choices'], (('next', 'One'),))
+        self.strings.swap({'start#0': 'Olá', 'start#1': 'Escolha', 'start#1/0': 'Um'}, 'pt')
+        self.assertEqual(talk.render()['text'], 'Olá')
+        self.assertEqual(choice.render()['text'], 'Escolha')
+        self.assertEqual(choice.render()['choices'], (('next', 'Um'),))
+        self.assertEqual(self.strings.language, 'pt')
+        self.assertEqual(self.strings.version, 1)
+
+    def test_string_table_load(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'fr.json')
+            with open(path, 'w', encoding='utf-8') as table_file:
+                json.dump({'start#0': 'Bonjour'}, table_file)
+            self.strings.load(path, 'fr')
+        self.assertEqual(self.strings['start#0'], 'Bonjour')
+        self.assertEqual(self.strings.language, 'fr')
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+
+from engine.game_objects.action import Choice, Talk
+from engine.game_objects.character import Character
+from engine.game_objects.scene import Scene
+from engine.game_ui.asset_prefetcher import AssetPrefetcher
+from engine.game_ui.game_renderer import BackgroundRenderer, ForegroundRenderer
+from engine.game_ui.surface_cache import SurfaceCache
+
+
+class TestAssetPrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        character = Character('Test Character', 'happy', {'happy': 'happy.png', 'sad': 'sad.png'})
+        start = Scene('start', 'start.png')
+        start.add_action(Choice(character, 'Choose', [('second', 'Second'), ('third', 'Third')]))
+        second = Scene('second', 'second.png')
+        second.add_action(Choice(character, 'Choose', [('fourth', 'Fourth')], state='sad'))
+        third = Scene('third', 'start.png')
+        third.add_action(Talk(character, 'Hello'))
+        fourth = Scene('fourth', 'fourth.png')
+        fourth.add_action(Talk(character, 'Bye'))
+        self.scenes = {scene.name: scene for scene in (start, second, third, fourth)}
+
+        self.cache = SurfaceCache()
+        screen = pygame.Surface((800, 600))
+        self.background_renderer = BackgroundRenderer(screen, 'resources', self.cache)
+        self.foreground_renderer = ForegroundRenderer(screen, 'resources', self.cache)
+        self.background_renderer._load_scaled_image = MagicMock(return_value=pygame.Surface((8, 6)))
+        self.foreground_renderer._load_scaled_image = MagicMock(return_value=pygame.Surface((4, 6)))
+        self.prefetcher = AssetPrefetcher(self.background_renderer, self.foreground_renderer, depth=1)
+
+    def tearDown(self):
+        self.prefetcher.stop()
+
+    def test_reachable_assets_respects_depth(self):
+        assets = self.prefetcher.reachable_assets('start', self.scenes)
+        self.assertEqual(
+            assets,
+            [('start.png', False), ('happy.png', True), ('second.png', False), ('sad.png', True)]
+        )
+
+    def test_reachable_assets_with_bigger_depth(self):
+        self.prefetcher.depth = 2
+        self.assertIn(('fourth.png', False), self.prefetcher.reachable_assets('start', self.scenes))
+
+    def test_reachable_assets_unknown_scene(self):
+        self.assertEqual(self.prefetcher.reachable_assets('missing', self.scenes), [])
+
+    def test_prefetch_fills_the_cache(self):
+        self.prefetcher.prefetch('start', self.scenes)
+        self.prefetcher._queue.put(None)
+        self.prefetcher._thread.join(timeout=5)
+        self.prefetcher._thread = None
+        self.assertEqual(self.prefetcher.loaded, 4)
+        self.background_renderer.render('second.png')
+        self.assertEqual(self.prefetcher.stats['hits'], 1)
+        self.assertEqual(self.prefetcher.stats['hit_rate'], 0.25)
+        self.background_renderer._load_scaled_image.assert_any_call('second.png', False)
@@ -0,0 +1,41 @@
+import unittest
+
+from engine.game_ui.build_plan import BuildPlan
+from engine.game_ui.game_configurations import Configuration
+
+
+class TestBuildPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.configuration = Configuration(game_title='Test Game', language='en', languages=['pt', 'en', 'fr', 'pt'])
+        self.strings = {'start#0': 'Yes', 'start#1': 'No', 'end#0': 'Yes'}
+
+    def test_plan_translates_the_source_once_into_each_language(self):
+        plan = BuildPlan.create(self.configuration, self.strings, scenes=2, characters=1, batch_size=1)
+        self.assertEqual(plan.source_language, 'en')
+        self.assertEqual(plan.languages, ('en', 'pt', 'fr'))
+        self.assertEqual(plan.translation_pairs, [('en', 'pt'), ('en', 'fr')])
+        self.assertEqual(plan.unique_texts, 2)
+        self.assertEqual(plan.translation_batches, 4)
+
+    def test_plan_without_other_languages(self):
+        configuration = Configuration(game_title='Test Game', language='en')
+        plan = BuildPlan.create(configuration, self.strings, scenes=2, characters=1)
+        self.assertEqual(plan.translation_pairs, [])
+        self.assertEqual(plan.translation_batches, 0)
+
+    def test_plan_with_requested_languages(self):
+        plan = BuildPlan.create(self.configuration, self.strings, scenes=2, characters=1, languages=['fr'])
+        self.assertEqual(plan.languages, ('en', 'fr'))
+        plan = BuildPlan.create(self.configuration, self.strings, scenes=2, characters=1, languages=['en'])
+        self.assertEqual(plan.translation_pairs, [])
+        with self.assertRaises(ValueError):
+            BuildPlan.create(self.configuration, self.strings, scenes=2, characters=1, languages=['de'])
+
+    def test_describe(self):
+        plan = BuildPlan.create(self.configuration, self.strings, scenes=2, characters=1)
+        self.assertEqual(
+            plan.describe(),
+            'Build plan: 2 scenes, 1 characters, 3 texts (2 distinct) written in en\n'
+            'Translations: 2 language pairs into pt, fr, up to 4 texts in 2 batches'
+        )
@@ -0,0 +1,41 @@
+import os
+import unittest
+
+from engine.game_ui.build_plan import BuildPlan
+from engine.game_ui.build_result import BuildEvent, BuildProgress, BuildResult
+
+
+class TestBuildResult(unittest.TestCase):
+
+    def setUp(self):
+        self.plan = BuildPlan('en', ('pt',), scenes=1, characters=1, texts=1, unique_texts=1)
+
+    def test_data_path(self):
+        result = BuildResult(self.plan, 'Game', main_path=os.path.join('output', '__main__.pyw'))
+        self.assertEqual(result.data_path, 'output')
+        self.assertIsNone(BuildResult(self.plan, 'Game').data_path)
+
+    def test_stage_timings_and_events(self):
+        events = []
+        ticks = iter([1.0, 1.5, 2.0, 2.25])
+        progress = BuildProgress(events.append, clock=lambda: next(ticks))
+        with progress.stage('images', 'Scaling'):
+            progress.emit('images', 'progress', 'background.png', 1, 1)
+        with progress.stage('images'):
+            pass
+        self.assertEqual(progress.timings, {'images': 0.75})
+        self.assertEqual(events[:3], [
+            BuildEvent('images', 'start', 'Scaling'),
+            BuildEvent('images', 'progress', 'background.png', 1, 1),
+            BuildEvent('images', 'finish', '0.50s'),
+        ])
+
+    def test_failing_stage_is_timed_without_finish_event(self):
+        events = []
+        ticks = iter([1.0, 3.0])
+        progress = BuildProgress(events.append, clock=lambda: next(ticks))
+        with self.assertRaises(ValueError):
+            with progress.stage('translation'):
+                raise ValueError('offline')
+        self.assertEqual(progress.timings, {'translation': 2.0})
+        self.assertEqual([event.status for event in events], ['start'])
@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from engine.game_ui.constants.text_constants import RED, WHITE
+from engine.game_ui.font_manager import FontManager
+
+
+class TestFontManager(unittest.TestCase):
+
+    def setUp(self):
+        pygame.font.init()
+        self.font_manager = FontManager()
+
+    def test_font_is_created_once(self):
+        self.assertIs(self.font_manager.font((None, 36)), self.font_manager.font((None, 36)))
+        self.assertIsNot(self.font_manager.font((None, 36)), self.font_manager.font((None, 20)))
+
+    def test_render_is_memoized(self):
+        surface = self.font_manager.render('Hello', WHITE)
+        self.assertIs(self.font_manager.render('Hello', WHITE), surface)
+        self.assertEqual(self.font_manager.text_cache.misses, 1)
+        self.assertEqual(self.font_manager.text_cache.hits, 1)
+
+    def test_render_key_includes_color_and_antialias(self):
+        surface = self.font_manager.render('Hello', WHITE)
+        self.assertIsNot(self.font_manager.render('Hello', RED), surface)
+        self.assertIsNot(self.font_manager.render('Hello', WHITE, antialias=False), surface)
+        self.assertEqual(self.font_manager.text_cache.misses, 3)
+
+    @patch('engine.game_ui.font_manager.pygame.font.Font')
+    def test_size_does_not_render(self, mock_font):
+        mock_font.return_value.size.return_value = (50, 20)
+        self.assertEqual(self.font_manager.size('Hello'), (50, 20))
+        mock_font.return_value.render.assert_not_called()
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from engine.game_ui.frame_scheduler import FrameScheduler
+
+
+class TestFrameScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = FrameScheduler(fps=30, idle_wait=True, idle_timeout=250)
+        self.scheduler.clock = MagicMock()
+
+    @patch('engine.game_ui.frame_scheduler.pygame.event')
+    def test_events_blocks_while_idle(self, mock_event):
+        key_event = MagicMock(type=pygame.KEYDOWN, key=pygame.K_RETURN)
+        mock_event.wait.return_value = key_event
+        mock_event.get.return_value = []
+        events = self.scheduler.events()
+        mock_event.wait.assert_called_once_with(250)
+        self.scheduler.clock.tick.assert_called_once_with(30)
+        self.assertEqual(events, [key_event])
+
+    @patch('engine.game_ui.frame_scheduler.pygame.event')
+    def test_events_ignores_wait_timeout(self, mock_event):
+        mock_event.wait.return_value = MagicMock(type=pygame.NOEVENT)
+        mock_event.get.return_value = []
+        self.assertEqual(self.scheduler.events(), [])
+
+    @patch('engine.game_ui.frame_scheduler.pygame.event')
+    def test_events_does_not_block_while_animating(self, mock_event):
+        mock_event.get.return_value = []
+        self.scheduler.events(animating=True)
+        mock_event.wait.assert_not_called()
+        self.scheduler.clock.tick.assert_called_once_with(30)
+
+    @patch('engine.game_ui.frame_scheduler.pygame.event')
+    def test_events_without_idle_wait(self, mock_event):
+        self.scheduler.idle_wait = False
+        mock_event.get.return_value = []
+        self.scheduler.events()
+        mock_event.wait.assert_not_called()
@@ -1,9 +1,13 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
 from engine.game_objects.scene import Scene
 from engine.game_ui.game import Game
 from engine.game_ui.game_configurations import Configuration
+from engine.game_objects.string_table import StringTable
+from engine.utils.story_pack import string_table_path
 
 
 class TestGame(unittest.TestCase):
@@ -43,6 +47,13 @@ class TestGame(unittest.TestCase):
         with self.assertRaises(Exception):
             self.game.add_scene(scene)
 
+    def test_game_backlog_actions(self):
+        scene = Scene('Test Scene', 'background.png')
+        self.game.add_scene(scene)
+        self.game.backlog.record('Test Scene', 0)
+        self.assertEqual(self.game.backlog_actions(), [])
+        self.assertEqual(self.game.backlog.size, self.configuration.backlog_size)
+
     @patch('engine.game_ui.game.Game.load_assets')
     def test_game_load_assets(self, mock_load_assets):
         mock_load_assets.return_value = self.game
@@ -50,6 +61,18 @@ class TestGame(unittest.TestCase):
         self.assertEqual(result, self.game)
         mock_load_assets.assert_called_once_with(self.configuration)
 
+    def test_available_languages(self):
+        self.assertEqual(self.game.available_languages(), ['en', 'fr'])
+        with tempfile.TemporaryDirectory() as resource_folder:
+            configuration = Configuration(game_title='Test Game', resource_folder=resource_folder, languages=['en', 'fr'])
+            game = Game(configuration, debug=False)
+            path = string_table_path(configuration.resource_folder, 'fr')
+            os.makedirs(os.path.dirname(path))
+            with open(path, 'w', encoding='utf-8') as table:
+                table.write('{}')
+            game.strings = StringTable()
+            self.assertEqual(game.available_languages(), ['fr'])
+
     def test_game_quit(self):
         with self.assertRaises(SystemExit):
             self.game.quit()
@@ -1,10 +1,19 @@
+import json
+import os
+import tempfile
 import unittest
-from unittest.mock import patch, mock_open
+from unittest.mock import MagicMock, patch
 
+import pygame
+
+from engine.game_objects.action import Talk
 from engine.game_objects.character import Character
+from engine.game_objects.scene import Scene
 from engine.game_ui.game import Game
-from engine.game_ui.game_builder import GameBuilder
+from engine.game_ui.game_builder import GameBuilder, parse_build_arguments
 from engine.game_ui.game_configurations import Configuration
+from engine.utils.asset_store import AssetIndex
+from engine.utils.translation import DictionaryTranslationBackend, GoogleTranslationBackend
 
 
 class TestGameBuilder(unittest.TestCase):
@@ -19,28 +28,178 @@ class TestGameBuilder(unittest.TestCase):
         self.game = Game(self.configuration, debug=True)
         self.game_builder = GameBuilder(self.game)
 
+    def _enter_project(self, translations: dict[str, dict[str, str]] = None) -> dict:
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        # The cleanups run in reverse order, the working directory is restored before the folder is removed.
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(folder.name)
+        os.makedirs('resources')
+        with open('configuration.py', 'w') as configuration_file:
+            configuration_file.write('GAME_CONFIGURATION = None')
+        return {
+            'translation_memory': ':memory:',
+            'translation_backend': DictionaryTranslationBackend(translations or {}),
+        }
+
     def test_game_builder_init(self):
         self.assertEqual(self.game_builder.game, self.game)
         self.assertEqual(self.game_builder.config, self.configuration)
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch('engine.game_ui.game_builder.os.makedirs')
-    @patch('engine.game_ui.game_builder.shutil.copy')
-    @patch('engine.game_ui.game_builder.GameBuilder._move_to_output_folder')
-    @patch('engine.game_ui.game_builder.dump')
-    def test_game_builder_build(self, mock_dump, mock_move_to_output_folder, _, __, mock_open_instance):
+    def test_game_builder_build(self):
+        characters = {'Test Character': Character('Test Character', 'state', {'state': 'image.png'})}
+        scene = Scene('start', 'background.png')
+        scene.add_action(Talk(characters['Test Character'], 'Hello'))
+        self.game.add_scene(scene)
+        build_arguments = self._enter_project({'en': {'Hello': 'Hi'}})
+        with open(os.path.join('resources', 'background.png'), 'wb') as image_file:
+            image_file.write(b'image')
+
+        events = []
+        result = self.game_builder.build(characters, 'output', progress=events.append, **build_arguments)
+        self.assertEqual(result.main_path, os.path.join('output', '__main__.pyw'))
+        self.assertEqual(result.game_title, 'Test Game')
+        self.assertEqual(result.translations, {'hits': 0, 'misses': 2, 'batches': 2})
+        self.assertEqual(result.files['removed'], 0)
+        self.assertEqual(list(result.timings), ['plan', 'story', 'translation', 'images', 'files'])
+        self.assertEqual(
+            [(event.stage, event.status) for event in events if event.status == 'finish'],
+            [(stage, 'finish') for stage in result.timings]
+        )
+        with open(os.path.join('output', 'resources', 'story', 'strings', 'en.json'), encoding='utf-8') as table:
+            self.assertEqual(json.load(table), {'start#0': 'Hi'})
+        self.assertTrue(os.path.isfile(os.path.join('output', 'resources', 'background.png')))
+        self.assertTrue(os.path.isfile(os.path.join('output', '__main__.pyw')))
+
+        outputs = [os.path.join(path, name) for path, _, names in os.walk('output') for name in names]
+        stats = {output: os.stat(output).st_mtime_ns for output in outputs}
+        result = self.game_builder.build(characters, 'output', **build_arguments)
+        self.assertEqual(result.files['rebuilt'], 0)
+        self.assertEqual({output: os.stat(output).st_mtime_ns for output in outputs}, stats)
+
+        result = self.game_builder.build(characters, 'output', asset_store=True, **build_arguments)
+        # The untranslated fr table is the pt one, they are stored once.
+        self.assertEqual(result.files['stored'], 5)
+        self.assertFalse(os.path.exists(os.path.join('output', 'resources', 'background.png')))
+        assets = AssetIndex.open(os.path.join('output', 'resources'))
+        self.assertTrue(os.path.isfile(assets.resolve(os.path.join('output', 'resources', 'background.png'))))
+        self.assertEqual(assets.files['story/strings/fr.json'], assets.files['story/strings/pt.json'])
+
+    def test_game_builder_build_optimizes_images(self):
+        characters = {'Test Character': Character('Test Character', 'state', {'state': 'image.png'})}
+        build_arguments = dict(self._enter_project(), optimize_images='bmp')
+        pygame.image.save(pygame.Surface((1600, 1200)), os.path.join('resources', 'background.png'))
+
+        result = self.game_builder.build(characters, 'output', **build_arguments)
+        image = pygame.image.load(os.path.join('output', 'resources', 'background.png'))
+        self.assertEqual(image.get_size(), self.configuration.resolution)
+        self.assertEqual(result.images['images'], 1)
+        self.assertEqual(result.images['source_bytes'], os.path.getsize(os.path.join('resources', 'background.png')))
+
+        result = self.game_builder.build(characters, 'output', **build_arguments)
+        self.assertEqual(result.images['images'], 0)
+        build_arguments['optimize_images'] = 'png'
+        result = self.game_builder.build(characters, 'output', **build_arguments)
+        self.assertEqual(result.images['images'], 1)
+
+    def test_game_builder_optimize_images_keeps_the_linked_source(self):
         characters = {'Test Character': Character('Test Character', 'state', {'state': 'image.png'})}
-        self.game_builder.build(characters, 'output')
-        mock_dump.assert_called_once()
+        build_arguments = self._enter_project()
+        source = os.path.join('resources', 'background.png')
+        pygame.image.save(pygame.Surface((1600, 1200)), source)
+        with open(source, 'rb') as image_file:
+            source_bytes = image_file.read()
+
+        # The plain build places the source image in the output, as a hardlink when the file system allows it.
+        self.game_builder.build(characters, 'output', **build_arguments)
+        self.game_builder.build(characters, 'output', optimize_images='bmp', **build_arguments)
+        with open(source, 'rb') as image_file:
+            self.assertEqual(image_file.read(), source_bytes)
+        image = pygame.image.load(os.path.join('output', 'resources', 'background.png'))
+        self.assertEqual(image.get_size(), self.configuration.resolution)
+
+    @patch('engine.game_ui.game_builder.BuildManifest')
+    def test_game_builder_build_reports_manifest(self, mock_manifest):
+        characters = {'Test Character': Character('Test Character', 'state', {'state': 'image.png'})}
+        with patch('engine.game_ui.game_builder.GameBuilder._move_to_output_folder') as mock_move_to_output_folder:
+            self.game_builder.build(characters, 'output', translation_memory=':memory:', force=True)
+        mock_manifest.assert_called_once_with('.build_manifest.json', force=True)
+        mock_manifest.return_value.save.assert_called_once()
         mock_move_to_output_folder.assert_called_once()
+        self.assertEqual(mock_move_to_output_folder.call_args.args[2], mock_manifest.return_value)
+
+    @patch('engine.game_ui.game_builder.BuildManifest')
+    @patch('engine.game_ui.game_builder.GameBuilder._move_to_output_folder')
+    def test_game_builder_build_dry_run(self, mock_move_to_output_folder, mock_manifest):
+        characters = {'Test Character': Character('Test Character', 'state', {'state': 'image.png'})}
+        result = self.game_builder.build(characters, 'output', dry_run=True)
+        self.assertIsNone(result.main_path)
+        self.assertEqual(result.plan.translation_pairs, [('pt', 'en'), ('pt', 'fr')])
+        mock_manifest.assert_not_called()
+        mock_move_to_output_folder.assert_not_called()
 
     @patch('os.path.isfile')
     @patch('os.makedirs')
-    @patch('shutil.copy')
     @patch('os.listdir')
-    def test_game_builder_move_to_output_folder(self, mock_listdir, mock_copy, mock_makedirs, mock_is_file):
+    def test_game_builder_move_to_output_folder(self, mock_listdir, mock_makedirs, mock_is_file):
         mock_listdir.return_value = ['file1', 'file2']
         mock_is_file.return_value = True
-        self.game_builder._move_to_output_folder('source', 'output')
+        manifest = MagicMock()
+        self.game_builder._move_to_output_folder('source', 'output', manifest, [])
         mock_makedirs.assert_called_once_with('output', exist_ok=True)
-        self.assertEqual(mock_copy.call_count, 2)
+        self.assertEqual(manifest.copy.call_count, 2)
+
+    @patch('os.path.isfile')
+    @patch('os.makedirs')
+    @patch('os.listdir')
+    def test_game_builder_move_to_output_folder_with_resolutions(self, mock_listdir, mock_makedirs, mock_is_file):
+        mock_listdir.return_value = ['background.png', 'notes.txt']
+        mock_is_file.return_value = True
+        manifest = MagicMock()
+        manifest.check_derived.return_value = 'new'
+        image_jobs = []
+        self.game_builder._move_to_output_folder(
+            'source',
+            'output',
+            manifest,
+            image_jobs,
+            variant_paths={(800, 600): 'output/800x600', (640, 480): 'output/640x480'}
+        )
+        manifest.copy.assert_called_once_with('source/notes.txt', 'output/notes.txt')
+        self.assertEqual(image_jobs, [
+            (('source/background.png', 'output/800x600/background.png', (800, 600)), '800x600', 'new'),
+            (('source/background.png', 'output/640x480/background.png', (640, 480)), '640x480', 'new'),
+        ])
+
+    def test_parse_build_arguments(self):
+        arguments = parse_build_arguments([])
+        self.assertIsNone(arguments['resolutions'])
+        self.assertEqual(arguments['translation_memory'], '.translation_memory.sqlite')
+        self.assertIsInstance(arguments['translation_backend'], GoogleTranslationBackend)
+        self.assertEqual(arguments['translation_executor'].workers, 4)
+        arguments = parse_build_arguments([
+            '--translation-workers', '8',
+            '--translation-rate', '0',
+            '--dry-run',
+            '--force',
+            '--jobs', '4',
+            '--optimize-images',
+            '--asset-store',
+            '--languages', 'en',
+            '--resolutions', '800x600', '640x480',
+            '--translation-memory', 'memory.sqlite',
+            '--translation-backend', 'dictionary',
+        ])
+        self.assertEqual(arguments['resolutions'], [(800, 600), (640, 480)])
+        self.assertEqual(arguments['translation_memory'], 'memory.sqlite')
+        self.assertIsInstance(arguments['translation_backend'], DictionaryTranslationBackend)
+        self.assertEqual(arguments['translation_executor'].workers, 8)
+        self.assertIsNone(arguments['translation_executor'].bucket.rate)
+        self.assertTrue(arguments['dry_run'])
+        self.assertTrue(arguments['force'])
+        self.assertEqual(arguments['jobs'], 4)
+        self.assertEqual(arguments['optimize_images'], 'png')
+        self.assertTrue(arguments['asset_store'])
+        self.assertEqual(arguments['languages'], ['en'])
+        self.assertEqual(parse_build_arguments(['--optimize-images', 'bmp'])['optimize_images'], 'bmp')
+        self.assertIsNone(parse_build_arguments([])['optimize_images'])
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from engine.game_ui.game_renderer import GameSceneRenderer
+
+
+class TestGameSceneRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.screen = pygame.Surface((800, 600))
+        self.background_renderer = MagicMock(screen=self.screen)
+        self.foreground_renderer = MagicMock(screen=self.screen)
+        self.hud_renderer = MagicMock(screen=self.screen)
+        self.hud_renderer.menu_item_rect.side_effect = lambda items, index: pygame.Rect(300, 200 + index * 25, 100, 20)
+        self.renderer = GameSceneRenderer(self.background_renderer, self.foreground_renderer, self.hud_renderer)
+        self.frame = {
+            'background': 'background.png',
+            'character_name': 'Test Character',
+            'character_image': 'image.png',
+            'text': 'Choose',
+            'choices': [('1', 'One'), ('2', 'Two')],
+        }
+
+    @patch('engine.game_ui.game_renderer.pygame.display')
+    def test_render_full_frame(self, mock_display):
+        dirty_rects = self.renderer.render(selected_item=0, **self.frame)
+        mock_display.flip.assert_called_once()
+        self.assertEqual(dirty_rects, [self.screen.get_rect()])
+        self.background_renderer.render.assert_called_once_with('background.png')
+
+    @patch('engine.game_ui.game_renderer.pygame.display')
+    def test_render_skips_unchanged_frame(self, mock_display):
+        self.renderer.render(selected_item=0, **self.frame)
+        dirty_rects = self.renderer.render(selected_item=0, **self.frame)
+        self.assertEqual(dirty_rects, [])
+        mock_display.flip.assert_called_once()
+        mock_display.update.assert_not_called()
+        self.background_renderer.render.assert_called_once()
+
+    @patch('engine.game_ui.game_renderer.pygame.display')
+    def test_render_updates_only_the_selection(self, mock_display):
+        self.renderer.render(selected_item=0, **self.frame)
+        dirty_rects = self.renderer.render(selected_item=1, **self.frame)
+        self.assertEqual(dirty_rects, [pygame.Rect(300, 200, 100, 20), pygame.Rect(300, 225, 100, 20)])
+        mock_display.flip.assert_called_once()
+        mock_display.update.assert_called_once_with(dirty_rects)
+        self.assertEqual(self.screen.get_clip(), self.screen.get_rect())
+
+    @patch('engine.game_ui.game_renderer.pygame.display')
+    def test_render_after_invalidate(self, mock_display):
+        self.renderer.render(selected_item=0, **self.frame)
+        self.renderer.invalidate()
+        self.renderer.render(selected_item=0, **self.frame)
+        self.assertEqual(mock_display.flip.call_count, 2)
+
+    @patch('engine.game_ui.game_renderer.pygame.display')
+    def test_render_bakes_each_action_once(self, _):
+        self.renderer.render(selected_item=0, **self.frame)
+        self.renderer.render(selected_item=1, **self.frame)
+        self.renderer.invalidate()
+        self.renderer.render(selected_item=1, **self.frame)
+        self.background_renderer.render.assert_called_once()
+        self.foreground_renderer.render.assert_called_once_with('image.png')
+        self.hud_renderer.render.assert_called_once_with('Test Character', 'Choose')
+        self.assertEqual(self.hud_renderer.render_choices.call_count, 4)
+        self.assertIs(self.background_renderer.screen, self.screen)
+
+    @patch('engine.game_ui.game_renderer.pygame.display')
+    def test_clear_composites(self, mock_display):
+        self.renderer.render(selected_item=0, **self.frame)
+        self.renderer.clear_composites()
+        self.renderer.render(selected_item=0, **self.frame)
+        self.assertEqual(self.background_renderer.render.call_count, 2)
+        self.assertEqual(mock_display.flip.call_count, 2)
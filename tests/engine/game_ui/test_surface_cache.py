@@ -0,0 +1,72 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from engine.game_ui.game_renderer import BackgroundRenderer
+from engine.game_ui.surface_cache import SurfaceCache
+from engine.utils.asset_store import AssetIndex
+
+
+class TestSurfaceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = pygame.Surface((10, 10))
+        self.surface_size = SurfaceCache.surface_size(self.surface)
+        self.cache = SurfaceCache(max_bytes=self.surface_size * 2)
+
+    def test_surface_cache_get_miss_and_hit(self):
+        factory = MagicMock(return_value=self.surface)
+        self.assertIs(self.cache.get('key', factory), self.surface)
+        self.assertIs(self.cache.get('key', factory), self.surface)
+        factory.assert_called_once()
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_surface_cache_evicts_least_recently_used(self):
+        self.cache.put('first', pygame.Surface((10, 10)))
+        self.cache.put('second', pygame.Surface((10, 10)))
+        self.cache.get('first', MagicMock())
+        self.cache.put('third', pygame.Surface((10, 10)))
+        self.assertIn('first', self.cache)
+        self.assertNotIn('second', self.cache)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.cache.size, self.surface_size * 2)
+
+    def test_surface_cache_skips_surfaces_bigger_than_budget(self):
+        self.cache.put('big', pygame.Surface((100, 100)))
+        self.assertNotIn('big', self.cache)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_surface_cache_clear(self):
+        self.cache.put('key', self.surface)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats['bytes'], 0)
+
+
+class TestRendererSurfaceCache(unittest.TestCase):
+
+    @patch('engine.game_ui.game_renderer.pygame.image.load')
+    def test_background_renderer_loads_image_once(self, mock_load):
+        image = MagicMock()
+        image.convert.return_value = pygame.Surface((400, 300))
+        mock_load.return_value = image
+        renderer = BackgroundRenderer(pygame.Surface((800, 600)), 'resources')
+        renderer.render('background.png')
+        renderer.render('background.png')
+        mock_load.assert_called_once()
+        self.assertEqual(renderer.surface_cache.hits, 1)
+
+    @patch('engine.game_ui.game_renderer.pygame.image.load')
+    def test_identical_images_share_a_surface(self, mock_load):
+        image = MagicMock()
+        image.convert.return_value = pygame.Surface((800, 600))
+        mock_load.return_value = image
+        assets = AssetIndex('resources', {'background.png': 'objects/ab/ab.png', 'copy.png': 'objects/ab/ab.png'})
+        renderer = BackgroundRenderer(pygame.Surface((800, 600)), 'resources', assets=assets)
+        renderer.render('background.png')
+        renderer.render('copy.png')
+        mock_load.assert_called_once_with(os.path.join('resources', 'objects/ab/ab.png'))
+        self.assertEqual(len(renderer.surface_cache), 1)
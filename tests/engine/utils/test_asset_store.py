@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from engine.utils.asset_store import AssetIndex
+
+
+class TestAssetIndex(unittest.TestCase):
+
+    def test_index_without_store(self):
+        with tempfile.TemporaryDirectory() as folder:
+            index = AssetIndex.open(folder)
+            path = os.path.join(folder, 'background.png')
+            self.assertEqual(index.resolve(path), path)
+            self.assertEqual(index.folders(), [])
+
+    def test_resolve(self):
+        index = AssetIndex('resources', {'800x600/background.png': 'objects/ab/ab.png'})
+        self.assertEqual(
+            index.resolve(os.path.join('resources', '800x600', 'background.png')),
+            os.path.join('resources', 'objects/ab/ab.png')
+        )
+        self.assertEqual(index.resolve(os.path.join('resources', 'icon.png')), os.path.join('resources', 'icon.png'))
+        self.assertEqual(index.folders(), ['800x600'])
+
+    def test_game_does_not_import_the_store_builder(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                "import sys, engine.game_ui.game; "
+                "print('engine.utils.asset_store_builder' in sys.modules, 'engine.utils.build_manifest' in sys.modules)"
+            ],
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], 'False False')
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+
+from engine.utils.asset_store import ASSET_INDEX, AssetIndex
+from engine.utils.asset_store_builder import AssetStore
+
+
+class TestAssetStore(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.staging = os.path.join(folder.name, 'staging')
+        self.root = os.path.join(folder.name, 'output')
+        self._write('background.png', b'image')
+        self._write('800x600/background.png', b'scaled')
+        self._write('800x600/copy.png', b'scaled')
+
+    def _write(self, path: str, content: bytes):
+        path = os.path.join(self.staging, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(content)
+
+    def _objects(self) -> list[str]:
+        return [name for _, _, names in os.walk(os.path.join(self.root, 'objects')) for name in names]
+
+    def test_sync_stores_identical_files_once(self):
+        store = AssetStore(self.root)
+        index = store.sync(self.staging)
+        self.assertEqual(index.files['800x600/background.png'], index.files['800x600/copy.png'])
+        self.assertNotEqual(index.files['background.png'], index.files['800x600/copy.png'])
+        self.assertEqual(len(self._objects()), 2)
+        self.assertEqual((store.stored, store.added, store.saved_bytes), (2, 2, 6))
+        with open(index.resolve(os.path.join(self.root, '800x600', 'copy.png')), 'rb') as file:
+            self.assertEqual(file.read(), b'scaled')
+
+    def test_sync_removes_unreferenced_files(self):
+        AssetStore(self.root).sync(self.staging)
+        os.remove(os.path.join(self.staging, 'background.png'))
+        store = AssetStore(self.root)
+        index = store.sync(self.staging)
+        self.assertEqual((store.added, store.removed), (0, 1))
+        self.assertEqual(len(self._objects()), 1)
+        self.assertNotIn('background.png', index.files)
+
+    def test_clear(self):
+        AssetStore(self.root).sync(self.staging)
+        AssetStore(self.root).clear()
+        self.assertEqual(os.listdir(self.root), [])
+
+    def test_index_open(self):
+        AssetStore(self.root).sync(self.staging)
+        index = AssetIndex.open(self.root)
+        self.assertEqual(index.folders(), ['800x600'])
+        with open(os.path.join(self.root, ASSET_INDEX), encoding='utf-8') as index_file:
+            self.assertEqual(index.files, json.load(index_file)['files'])
@@ -0,0 +1,37 @@
+import os
+import unittest
+
+from engine.utils.build_jobs import BuildJobError, run_jobs
+
+
+def _check_positive(value: int):
+    if value < 0:
+        raise ValueError(f'{value} is negative')
+    return os.getpid()
+
+
+class TestBuildJobs(unittest.TestCase):
+
+    def test_run_jobs_in_process(self):
+        self.assertEqual(run_jobs(_check_positive, [(1,), (2,)], workers=1), [(os.getpid(), None)] * 2)
+
+    def test_run_jobs_on_processes_keeps_the_job_order(self):
+        results = run_jobs(_check_positive, [(1,), (-1,), (2,), (-2,)], workers=2)
+        values, errors = zip(*results)
+        self.assertIsNone(errors[0])
+        self.assertIsNone(errors[2])
+        self.assertNotEqual(values[0], os.getpid())
+        self.assertIsNone(values[1])
+        self.assertEqual(str(errors[1]), '-1 is negative')
+        self.assertEqual(str(errors[3]), '-2 is negative')
+
+    def test_run_jobs_reports_each_result_in_order(self):
+        results = []
+        run_jobs(_check_positive, [(1,), (-1,), (2,)], workers=2, on_result=lambda index, error: results.append(
+            (index, error is None)
+        ))
+        self.assertEqual(results, [(0, True), (1, False), (2, True)])
+
+    def test_build_job_error_merges_failures(self):
+        error = BuildJobError([(('a.png', (800, 600)), ValueError('broken')), (('b.png',), OSError('missing'))])
+        self.assertEqual(str(error), "2 build jobs failed:\n  a.png, (800, 600): broken\n  b.png: missing")
@@ -0,0 +1,109 @@
+import os
+import stat
+import tempfile
+import unittest
+
+from engine.utils.build_manifest import BuildManifest, link_or_copy
+
+
+class TestBuildManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.manifest_path = self.path('manifest.json')
+        self.source = self.path('source.png')
+        self.write_source(b'image')
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.folder.name, name)
+
+    def write_source(self, content: bytes):
+        with open(self.source, 'wb') as source_file:
+            source_file.write(content)
+
+    def build(self, force: bool = False) -> BuildManifest:
+        manifest = BuildManifest(self.manifest_path, force=force)
+        manifest.write(self.path('output/story.pack'), b'story')
+        manifest.copy(self.source, self.path('output/source.png'))
+        manifest.save()
+        return manifest
+
+    def test_unchanged_build_skips_everything(self):
+        first = self.build()
+        self.assertEqual(
+            [reason for _, reason in first.rebuilt],
+            ['new', 'new']
+        )
+        second = self.build()
+        self.assertEqual(second.rebuilt, [])
+        self.assertEqual(len(second.skipped), 2)
+
+    def test_changed_source_is_copied_again(self):
+        self.build()
+        self.write_source(b'another image')
+        manifest = self.build()
+        self.assertEqual(manifest.rebuilt, [(self.path('output/source.png'), 'changed')])
+        with open(self.path('output/source.png'), 'rb') as output_file:
+            self.assertEqual(output_file.read(), b'another image')
+
+    def test_write_does_not_change_a_linked_source(self):
+        link_or_copy(self.source, self.path('output/source.png'))
+        BuildManifest(self.manifest_path).write(self.path('output/source.png'), b'generated')
+        with open(self.source, 'rb') as source_file:
+            self.assertEqual(source_file.read(), b'image')
+        with open(self.path('output/source.png'), 'rb') as output_file:
+            self.assertEqual(output_file.read(), b'generated')
+        self.assertEqual(sorted(os.listdir(self.path('output'))), ['source.png'])
+
+    @unittest.skipIf(os.name == 'nt', 'The file modes are POSIX permissions')
+    def test_write_keeps_the_default_file_mode(self):
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+        BuildManifest(self.manifest_path).write(self.path('output/story.pack'), b'story')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path('output/story.pack')).st_mode), 0o644)
+
+    def test_removed_output_is_rebuilt(self):
+        self.build()
+        os.remove(self.path('output/story.pack'))
+        manifest = self.build()
+        self.assertEqual(manifest.rebuilt, [(self.path('output/story.pack'), 'output modified')])
+
+    def test_force_rebuilds_everything(self):
+        self.build()
+        self.assertEqual(len(self.build(force=True).rebuilt), 2)
+
+    def test_stale_outputs_are_removed(self):
+        self.build()
+        manifest = BuildManifest(self.manifest_path)
+        manifest.write(self.path('output/story.pack'), b'story')
+        manifest.save()
+        self.assertEqual(manifest.removed, [self.path('output/source.png')])
+        self.assertFalse(os.path.exists(self.path('output/source.png')))
+
+    def test_empty_folders_are_removed(self):
+        manifest = BuildManifest(self.manifest_path)
+        manifest.copy(self.source, self.path('output/800x600/source.png'))
+        manifest.save()
+        BuildManifest(self.manifest_path).save()
+        self.assertFalse(os.path.exists(self.path('output/800x600')))
+
+    def test_derived_is_keyed_on_variant(self):
+        variant = self.path('variant.png')
+        manifest = BuildManifest(self.manifest_path)
+        self.assertEqual(manifest.check_derived(self.source, variant, '800x600'), 'new')
+        open(variant, 'wb').close()
+        manifest.record_derived(self.source, variant, '800x600', 'new')
+        manifest.save()
+        manifest = BuildManifest(self.manifest_path)
+        self.assertIsNone(manifest.check_derived(self.source, variant, '800x600'))
+        self.assertEqual(manifest.check_derived(self.source, variant, '640x480'), 'changed')
+
+    def test_compare(self):
+        manifest = BuildManifest(self.manifest_path)
+        manifest.compare('scenes', {'start': 'a', 'end': 'b'})
+        manifest.save()
+        manifest = BuildManifest(self.manifest_path)
+        changes = manifest.compare('scenes', {'start': 'a', 'middle': 'c'})
+        self.assertEqual(changes, [('middle', 'new'), ('end', 'removed')])
+        self.assertIn('scenes: middle (new), end (removed)', manifest.summary())
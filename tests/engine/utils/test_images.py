@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from engine.utils.images import optimize_image, prescale_image, save_image
+
+# A 1x1 GIF, pygame decodes GIF files but cannot encode them.
+GIF_IMAGE = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00'
+    b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+
+
+class TestImages(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+        self.source = os.path.join(self.folder, 'background.png')
+        pygame.image.save(pygame.Surface((400, 300)), self.source)
+
+    def test_prescale_image(self):
+        destination = os.path.join(self.folder, 'output', 'background.png')
+        prescale_image(self.source, destination, (200, 200))
+        self.assertEqual(pygame.image.load(destination).get_size(), (200, 150))
+
+    def test_prescale_image_gif(self):
+        source = os.path.join(self.folder, 'icon.gif')
+        with open(source, 'wb') as image_file:
+            image_file.write(GIF_IMAGE)
+        destination = os.path.join(self.folder, 'output', 'icon.gif')
+        prescale_image(source, destination, (8, 6))
+        with open(destination, 'rb') as image_file:
+            self.assertEqual(image_file.read(4), b'\x89PNG')
+        self.assertEqual(pygame.image.load(destination).get_size(), (6, 6))
+
+    def test_optimize_image_scales_down(self):
+        destination = os.path.join(self.folder, 'output', 'background.png')
+        stats = optimize_image(self.source, destination, (200, 200))
+        self.assertEqual(pygame.image.load(destination).get_size(), (200, 150))
+        self.assertEqual(stats.source_bytes, os.path.getsize(self.source))
+        self.assertEqual(stats.output_bytes, os.path.getsize(destination))
+
+    def test_optimize_image_without_upscale(self):
+        destination = os.path.join(self.folder, 'output', 'background.png')
+        optimize_image(self.source, destination, (800, 600), upscale=False)
+        self.assertEqual(pygame.image.load(destination).get_size(), (400, 300))
+        optimize_image(self.source, destination, (800, 600))
+        self.assertEqual(pygame.image.load(destination).get_size(), (800, 600))
+
+    def test_optimize_image_keeps_the_original_when_not_smaller(self):
+        source = os.path.join(self.folder, 'icon.gif')
+        with open(source, 'wb') as image_file:
+            image_file.write(GIF_IMAGE)
+        destination = os.path.join(self.folder, 'output', 'icon.gif')
+        stats = optimize_image(source, destination, (800, 600), upscale=False)
+        with open(destination, 'rb') as image_file:
+            self.assertEqual(image_file.read(), GIF_IMAGE)
+        self.assertEqual(stats.output_bytes, stats.source_bytes)
+        optimize_image(source, destination, (800, 600), 'bmp', upscale=False)
+        with open(destination, 'rb') as image_file:
+            self.assertEqual(image_file.read(2), b'BM')
+
+    def test_save_image_bmp_keeps_the_name(self):
+        destination = os.path.join(self.folder, 'background.png')
+        save_image(pygame.Surface((4, 4)), destination, 'bmp')
+        with open(destination, 'rb') as image_file:
+            self.assertEqual(image_file.read(2), b'BM')
+        image = pygame.image.load(destination)
+        self.assertEqual(image.get_size(), (4, 4))
+        self.assertEqual(image.get_masks(), (0xFF0000, 0xFF00, 0xFF, 0xFF000000))
+
+    def test_save_image_invalid_format(self):
+        with self.assertRaises(ValueError):
+            save_image(pygame.Surface((4, 4)), os.path.join(self.folder, 'background.webp'), 'webp')
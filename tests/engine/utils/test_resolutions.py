@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from engine.utils.resolutions import (
+    available_resolutions,
+    fit_size,
+    format_resolution,
+    image_folder,
+    parse_resolution,
+    select_resolution,
+)
+
+
+class TestResolutions(unittest.TestCase):
+
+    def test_parse_resolution(self):
+        self.assertEqual(parse_resolution('800x600'), (800, 600))
+        self.assertEqual(parse_resolution(' 1280X720 '), (1280, 720))
+
+    def test_parse_resolution_invalid(self):
+        for value in ('800', '800x', 'x600', '0x600', 'big'):
+            with self.assertRaises(ValueError):
+                parse_resolution(value)
+
+    def test_format_resolution(self):
+        self.assertEqual(format_resolution((800, 600)), '800x600')
+
+    def test_fit_size(self):
+        self.assertEqual(fit_size((1600, 1200), (800, 600)), (800, 600))
+        self.assertEqual(fit_size((200, 400), (800, 600)), (300, 600))
+
+    def test_select_resolution(self):
+        available = [(640, 480), (800, 600), (1920, 1080)]
+        self.assertEqual(select_resolution(available, (800, 600)), (800, 600))
+        self.assertEqual(select_resolution(available, (1280, 720)), (800, 600))
+        self.assertEqual(select_resolution(available, (320, 240)), (640, 480))
+        self.assertIsNone(select_resolution([], (800, 600)))
+
+    def test_image_folder(self):
+        with tempfile.TemporaryDirectory() as resource_folder:
+            self.assertEqual(image_folder(resource_folder, (800, 600)), resource_folder)
+            os.makedirs(os.path.join(resource_folder, '640x480'))
+            os.makedirs(os.path.join(resource_folder, 'characters'))
+            self.assertEqual(available_resolutions(resource_folder), [(640, 480)])
+            self.assertEqual(image_folder(resource_folder, (800, 600)), os.path.join(resource_folder, '640x480'))
+
+    def test_image_folder_from_asset_store_folders(self):
+        folders = ['1280x720', '800x600', 'story']
+        self.assertEqual(available_resolutions('resources', folders), [(800, 600), (1280, 720)])
+        self.assertEqual(image_folder('resources', (1024, 768), folders), os.path.join('resources', '800x600'))
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from engine.utils.story_pack import (
+    StoryPack,
+    encode_story_pack,
+    encode_string_table,
+    story_pack_path,
+    string_table_path,
+)
+
+
+class TestStoryPack(unittest.TestCase):
+
+    def setUp(self):
+        self.characters = {'TEST CHARACTER': {'name': 'Test Character', 'state': 'STATE', 'states': {}}}
+        self.scenes = {
+            'start': {'name': 'start', 'background': 'background.png', 'actions': []},
+            'ação': {'name': 'ação', 'background': 'fundo.png', 'actions': [{'type': 'talk', 'text': 'Olá'}]},
+        }
+
+    def test_story_pack_path(self):
+        self.assertEqual(story_pack_path('resources'), os.path.join('resources', 'story', 'story.pack'))
+        self.assertEqual(
+            string_table_path('resources', 'en'),
+            os.path.join('resources', 'story', 'strings', 'en.json')
+        )
+
+    def test_encode_string_table(self):
+        self.assertEqual(encode_string_table({'start#0': 'Olá'}), '{"start#0": "Olá"}'.encode('utf-8'))
+
+    def test_encode_and_open_story_pack(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = story_pack_path(folder)
+            os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as pack_file:
+                pack_file.write(encode_story_pack(self.characters, self.scenes))
+            pack = StoryPack.open(path)
+        self.assertEqual(pack.characters, self.characters)
+        self.assertEqual(pack.scene_names, ['start', 'ação'])
+        self.assertEqual(pack.scene('ação'), self.scenes['ação'])
+        self.assertEqual(pack.scene('start'), self.scenes['start'])
+
+    def test_story_pack_invalid_version(self):
+        with self.assertRaises(ValueError):
+            StoryPack(b'{"version": 0, "characters": {}, "scenes": {}}\n')
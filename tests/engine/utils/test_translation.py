@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from engine.utils.translation import (
+    DictionaryTranslationBackend,
+    GoogleTranslationBackend,
+    TranslationBackend,
+    batches,
+    translate,
+)
+
+
+class TestTranslation(unittest.TestCase):
+
+    def test_game_does_not_import_translator(self):
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys, engine.game_ui.game; print('deep_translator' in sys.modules)"],
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], 'False')
+
+    @patch('deep_translator.GoogleTranslator')
+    def test_translate(self, mock_translator):
+        mock_translator.return_value.translate.return_value = 'Bonjour'
+        self.assertEqual(translate('Hello', 'en', 'fr'), 'Bonjour')
+        mock_translator.assert_called_once_with(source='en', target='fr')
+
+    @patch('deep_translator.GoogleTranslator')
+    def test_google_backend_translate_batch(self, mock_translator):
+        mock_translator.return_value.translate_batch.return_value = ['Oui', 'Non']
+        self.assertEqual(GoogleTranslationBackend().translate_batch(['Yes', 'No'], 'en', 'fr'), ['Oui', 'Non'])
+        mock_translator.return_value.translate_batch.assert_called_once_with(['Yes', 'No'])
+
+    def test_dictionary_backend(self):
+        backend = DictionaryTranslationBackend({'fr': {'Yes': 'Oui'}})
+        self.assertEqual(backend.translate_batch(['Yes', 'No'], 'en', 'fr'), ['Oui', 'No'])
+        self.assertEqual(DictionaryTranslationBackend().translate_batch(['Yes'], 'en', 'fr'), ['Yes'])
+
+    def test_backend_interface(self):
+        with self.assertRaises(NotImplementedError):
+            TranslationBackend().translate_batch(['Yes'], 'en', 'fr')
+
+    def test_batches(self):
+        self.assertEqual(list(batches(['a', 'b', 'c'], 2)), [['a', 'b'], ['c']])
+        self.assertEqual(list(batches([], 2)), [])
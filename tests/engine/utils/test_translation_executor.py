@@ -0,0 +1,94 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from engine.utils.translation import DictionaryTranslationBackend, TranslationBackend
+from engine.utils.translation_executor import TokenBucket, TranslationError, TranslationExecutor, TranslationJob
+
+
+class _ConcurrentBackend(TranslationBackend):
+
+    def __init__(self, batches: int):
+        # Every batch waits until all of them are being translated at the same time.
+        self.barrier = threading.Barrier(batches, timeout=5)
+        self.sequential = False
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        try:
+            self.barrier.wait()
+        except threading.BrokenBarrierError:
+            self.sequential = True
+        return [f'{target}:{text}' for text in texts]
+
+
+class _FlakyBackend(TranslationBackend):
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError('Too many requests')
+        return texts
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_token_bucket_limits_rate(self):
+        now = [0.0]
+        sleep = MagicMock(side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds))
+        bucket = TokenBucket(rate=2, capacity=1, clock=lambda: now[0], sleep=sleep)
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.5, 0.5])
+        self.assertEqual(now[0], 1.0)
+
+    def test_token_bucket_without_rate(self):
+        sleep = MagicMock()
+        bucket = TokenBucket(rate=None, sleep=sleep)
+        for _ in range(10):
+            bucket.acquire()
+        sleep.assert_not_called()
+
+
+class TestTranslationExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [TranslationJob('en', target, (f'text {index}',)) for target in ('fr', 'de') for index in range(4)]
+
+    def test_run_translates_concurrently(self):
+        executor = TranslationExecutor(workers=8, rate=None, progress=None)
+        backend = _ConcurrentBackend(len(self.jobs))
+        results = dict(executor.run(backend, self.jobs))
+        self.assertFalse(backend.sequential)
+        self.assertEqual(results[self.jobs[0]], ['fr:text 0'])
+        self.assertEqual(len(results), len(self.jobs))
+
+    def test_run_reports_progress_per_language(self):
+        progress = MagicMock()
+        executor = TranslationExecutor(workers=1, rate=None, progress=progress)
+        list(executor.run(DictionaryTranslationBackend(), self.jobs))
+        progress.assert_any_call('fr', 4, 4)
+        progress.assert_any_call('de', 4, 4)
+        self.assertEqual(progress.call_count, 8)
+
+    def test_run_retries_with_backoff(self):
+        sleep = MagicMock()
+        backend = _FlakyBackend(failures=2)
+        executor = TranslationExecutor(workers=1, rate=None, retries=2, backoff=0.5, progress=None, sleep=sleep)
+        results = list(executor.run(backend, self.jobs[:1]))
+        self.assertEqual(results, [(self.jobs[0], ['text 0'])])
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.5, 1.0])
+
+    def test_run_reports_failed_jobs_after_the_others(self):
+        backend = _FlakyBackend(failures=2)
+        executor = TranslationExecutor(workers=1, rate=None, retries=1, backoff=0, progress=None, sleep=MagicMock())
+        results = []
+        with self.assertRaises(TranslationError) as context:
+            for result in executor.run(backend, self.jobs[:2]):
+                results.append(result)
+        self.assertEqual(results, [(self.jobs[1], ['text 1'])])
+        self.assertEqual([job for job, _ in context.exception.failures], [self.jobs[0]])
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from engine.utils.translation import DictionaryTranslationBackend, GoogleTranslationBackend
+from engine.utils.translation_memory import TranslationMemory
+
+
+class TestTranslationMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = DictionaryTranslationBackend({'fr': {'Hello': 'Bonjour', 'Yes': 'Oui'}})
+        patcher = patch.object(self.backend, 'translate_batch', wraps=self.backend.translate_batch)
+        self.translate_batch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_translate_is_cached(self):
+        with TranslationMemory(':memory:', self.backend) as memory:
+            self.assertEqual(memory.translate('Hello', 'en', 'fr'), 'Bonjour')
+            self.assertEqual(memory.translate('Hello', 'en', 'fr'), 'Bonjour')
+            self.assertEqual(memory.translate('Hello', 'en', 'de'), 'Hello')
+            self.assertEqual(memory.stats, {'hits': 1, 'misses': 2, 'batches': 2})
+        self.assertEqual(self.translate_batch.call_count, 2)
+
+    def test_translate_batch_deduplicates(self):
+        with TranslationMemory(':memory:', self.backend, batch_size=1) as memory:
+            result = memory.translate_batch(['Yes', 'Hello', 'Yes', 'Yes'], 'en', 'fr')
+            self.assertEqual(result, ['Oui', 'Bonjour', 'Oui', 'Oui'])
+            self.assertEqual(memory.stats, {'hits': 0, 'misses': 2, 'batches': 2})
+        self.translate_batch.assert_any_call(['Yes'], 'en', 'fr')
+        self.translate_batch.assert_any_call(['Hello'], 'en', 'fr')
+
+    def test_translations_persist_between_builds(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'memory.sqlite')
+            with TranslationMemory(path, self.backend) as memory:
+                memory.translate('Hello', 'en', 'fr')
+            with TranslationMemory(path, self.backend) as memory:
+                self.assertEqual(memory.translate('Hello', 'en', 'fr'), 'Bonjour')
+                self.assertEqual(memory.stats, {'hits': 1, 'misses': 0, 'batches': 0})
+        self.translate_batch.assert_called_once_with(['Hello'], 'en', 'fr')
+
+    @patch('engine.utils.translation.GoogleTranslationBackend.translate_batch')
+    def test_memory_without_backends_is_migrated(self, mock_google_batch):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'memory.sqlite')
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    'CREATE TABLE translations ('
+                    'source TEXT NOT NULL, target TEXT NOT NULL, text_hash TEXT NOT NULL, text TEXT NOT NULL, '
+                    'translation TEXT NOT NULL, PRIMARY KEY (source, target, text_hash))'
+                )
+                connection.execute(
+                    'INSERT INTO translations VALUES (?, ?, ?, ?, ?)',
+                    ('en', 'fr', TranslationMemory.text_hash('Hello'), 'Hello', 'Salut')
+                )
+            connection.close()
+            with TranslationMemory(path, GoogleTranslationBackend()) as memory:
+                self.assertEqual(memory.translate('Hello', 'en', 'fr'), 'Salut')
+                self.assertEqual(memory.stats, {'hits': 1, 'misses': 0, 'batches': 0})
+            with TranslationMemory(path, GoogleTranslationBackend()) as memory:
+                self.assertEqual(memory.translate('Hello', 'en', 'fr'), 'Salut')
+        mock_google_batch.assert_not_called()
+
+    def test_translate_pairs(self):
+        with TranslationMemory(':memory:', self.backend) as memory:
+            result = memory.translate_pairs(['Yes', 'Hello'], [('en', 'fr'), ('en', 'en')])
+        self.assertEqual(result, {('en', 'fr'): ['Oui', 'Bonjour'], ('en', 'en'): ['Yes', 'Hello']})
+
+    @patch('engine.utils.translation.GoogleTranslationBackend.translate_batch')
+    def test_translations_are_kept_per_backend(self, mock_google_batch):
+        mock_google_batch.return_value = ['Salut']
+        with TranslationMemory(':memory:', self.backend) as memory:
+            memory.translate('Hello', 'en', 'fr')
+            memory.backend = GoogleTranslationBackend()
+            self.assertEqual(memory.translate('Hello', 'en', 'fr'), 'Salut')